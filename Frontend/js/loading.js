@@ -7,6 +7,10 @@
 
   const wait = (ms) => new Promise(res => setTimeout(res, ms));
 
+  // Search results come from the web: escape them before they go into innerHTML
+  const esc = (s) => String(s ?? '').replace(/[&<>"']/g, m => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[m]));
+  const safeUrl = (u) => /^https?:\/\//i.test(u || '') ? u : '#';
+
   async function typeChars(el, html, perCharMs = 4) {
     if (prefersReduced) {
       el.innerHTML = html;
@@ -64,15 +68,15 @@
 
   async function renderStreamForAddress(entry) {
     // Heading
-    await typeChars(line('h2', 'section-heading', entry.heading), entry.heading, 5);
+    await typeChars(line('h2', 'section-heading', esc(entry.heading)), esc(entry.heading), 5);
     await wait(5);
     
     // Subheading
-    await typeChars(line('h3', 'section-subheading', entry.subheading), entry.subheading, 5);
+    await typeChars(line('h3', 'section-subheading', esc(entry.subheading)), esc(entry.subheading), 5);
     await wait(5);
     
     // Summary bold
-    await typeChars(line('p', 'summary-bold', `<strong>${entry.summary_bold}</strong>`), entry.summary_bold, 5);
+    await typeChars(line('p', 'summary-bold', `<strong>${esc(entry.summary_bold)}</strong>`), esc(entry.summary_bold), 5);
     await wait(5);
 
     // Separator
@@ -83,22 +87,22 @@
     for (const r of entry.results) {
       // Result title
       await typeChars(
-        line('p', 'result-title', `<strong>${r.n}.</strong> ${r.title}`), 
-        `${r.n}. ${r.title}`, 
+        line('p', 'result-title', `<strong>${r.n}.</strong> ${esc(r.title)}`), 
+        `${r.n}. ${esc(r.title)}`, 
         5
       );
       await wait(5);
       
       // Result link
       await typeChars(
-        line('p', 'result-link', `🔗 <a href="${r.url_label}" target="_blank" rel="noopener">${r.url_label}</a>`),
-        `🔗 ${r.url_label}`,
+        line('p', 'result-link', `🔗 <a href="${esc(safeUrl(r.url_label))}" target="_blank" rel="noopener">${esc(r.url_label)}</a>`),
+        `🔗 ${esc(r.url_label)}`,
         5
       );
       await wait(5);
       
       // Analyzing line
-      await typeChars(line('p', 'result-analyzing', r.analyzing), r.analyzing, 5);
+      await typeChars(line('p', 'result-analyzing', esc(r.analyzing)), esc(r.analyzing), 5);
       await wait(5);
 
       // Analysis box
@@ -162,7 +166,7 @@
     
     // Stream the footer_italics content
     if (prefersReduced) {
-      box.innerHTML = `<em>${footerItalicsContent}</em>`;
+      box.innerHTML = `<em>${esc(footerItalicsContent)}</em>`;
       return;
     }
     
@@ -173,7 +177,54 @@
     }
     
     // After typing is complete, set italic formatting
-    box.innerHTML = `<em>${footerItalicsContent}</em>`;
+    box.innerHTML = `<em>${esc(footerItalicsContent)}</em>`;
+  }
+
+  const STAGE_LABELS = {
+    web_search: '🔎 Searched the web for the landlord',
+    zillow_search: '🏠 Found Zillow listings',
+    zillow_rent: '🏠 Checked the Zillow rent',
+    block_lot: '📜 Found the tax block and lot',
+    owners: '🪪 Looked up county record owners'
+  };
+
+  // Run the check on the server and stream its progress (verify_service.py /api/checks/stream)
+  function streamCheck(listing, footerItalicsBox) {
+    const params = new URLSearchParams(listing);
+    const source = new EventSource(`/api/checks/stream?${params}`);
+
+    source.addEventListener('queued', (e) => {
+      const { position } = JSON.parse(e.data);
+      footerItalicsBox.textContent = position > 0
+        ? `⏳ Waiting for ${position} check${position === 1 ? '' : 's'} ahead of yours..`
+        : '🔎Analyzing Data Records..';
+    });
+
+    source.addEventListener('stage', (e) => {
+      const { stage, seconds } = JSON.parse(e.data);
+      appendBlock(line('p', 'result-analyzing', `${esc(STAGE_LABELS[stage] || stage)} (${seconds.toFixed(1)}s)`));
+    });
+
+    source.addEventListener('result', async (e) => {
+      source.close();
+      const { frontend, summary } = JSON.parse(e.data);
+      sessionStorage.setItem('veritas_result', JSON.stringify(summary));
+      if (frontend.footer_italics) {
+        updateFooterItalicsBox(footerItalicsBox, frontend.footer_italics);
+      }
+      await renderStreamForAddress(frontend);
+      await wait(5000);
+      window.location.href = 'results.html';
+    });
+
+    // Server-sent `error` events carry data; the browser's own connection errors do not
+    source.addEventListener('error', async (e) => {
+      source.close();
+      const message = e.data ? JSON.parse(e.data).error : 'Lost the connection to the server.';
+      await renderFallbackContent('🔎 Searching Public Web Records', `The check failed: ${esc(message)}`);
+    });
+
+    source.addEventListener('done', () => source.close());
   }
 
   async function main() {
@@ -194,7 +245,14 @@
       // Create the Footer_Italics box immediately
       const footerItalicsBox = createFooterItalicsBox();
 
-      // Get data from sessionStorage
+      // A listing submitted from the form is checked live
+      const listing = sessionStorage.getItem('veritas_listing');
+      if (listing && window.EventSource) {
+        streamCheck(JSON.parse(listing), footerItalicsBox);
+        return;
+      }
+
+      // Otherwise replay the sample analysis from sessionStorage or data.js
       let address = sessionStorage.getItem('veritas_address');
       let rawTextJson = sessionStorage.getItem('veritas_text_json');
 
@@ -85,104 +85,27 @@ function getInputAddress() {
   return p || sessionStorage.getItem("veritas_address") || "";
 }
 
-async function fetchResults(address) {
-  const url = `/api/results?address=${encodeURIComponent(address)}`;
-  const res = await fetch(url);
+// Run the check without streaming (verify_service.py POST /api/checks), e.g. when
+// results.html is opened directly instead of through the loading page
+async function fetchResults(listing) {
+  const res = await fetch("/api/checks", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(listing),
+  });
   if (!res.ok) throw new Error(`HTTP ${res.status}`);
-  return res.json();
+  return (await res.json()).summary;
 }
 
-// Mock data for demo purposes (since we don't have a real backend)
-function getMockResults(address) {
-  // Simulate different scenarios based on address content
-  const addressLower = address.toLowerCase();
-  const isHighRisk = addressLower.includes('lawton');
-  const isLowRisk = addressLower.includes('king');
-  
-  if (isHighRisk) {
-    return {
-      clear_outcome: true,
-      scam_likelihood: 0.85,
-      address: address,
-      reasons: [
-        ["bad", "House owner (BIGGIO Family Trust) is unrelated to claimed landlord (Mary McClelland)"],
-        ["bad", "Price significantly below market rate for the area"],
-        ["bad", "Claimed landlord has no verifiable online presence"],
-        ["bad", "Listing is on Facebook Marketplace, which is commonly used for scams"],
-        ["good", "Property photos appear to be legitimate"]
-      ],
-      analyzed_data: [
-        ["Rental Price", "$720/month (65% below market average)"],
-        ["Market Average", "$2,500/month for similar properties"],
-        ["Landlord Contact", "Only via a limited-history Facebook account, no phone or email provided"],
-        ["Property History", "Price discrepancy across multiple platforms"],
-        ["Payment Method", "Not Provided"]
-      ],
-      additional_questions: [
-        "Have you been able to verify the landlord's identity through official channels?",
-        "Can you schedule an in-person viewing of the property?",
-        "Has the landlord provided verifiable references or credentials?",
-        "Are there any official property management companies associated with this listing?"
-      ],
-      sources: [
-        "https://www.ftc.gov/tips-advice/business-center/guidance/rental-listing-scams",
-        "https://www.consumer.ftc.gov/articles/0079-rental-scams",
-        "https://www.apartments.com/rental-manager/resources/article/rental-scams"
-      ]
-    };
-  } else if (isLowRisk) {
-    return {
-      clear_outcome: true,
-      scam_likelihood: 0.15,
-      address: address,
-      reasons: [
-        ["good", "Landlord provided verifiable contact information"],
-        ["good", "Property price is within market range"],
-        ["good", "In-person viewing scheduled and confirmed"],
-        ["bad", "Limited online presence for the property"]
-      ],
-      analyzed_data: [
-        ["Rental Price", "$2,800/month (within market range)"],
-        ["Market Average", "$3,200/month for similar properties"],
-        ["Landlord Contact", "Phone and email verified"],
-        ["Property History", "Listed by established real estate agency"],
-        ["Payment Method", "Standard lease agreement and deposit"]
-      ],
-      additional_questions: [
-        "Have you completed the background check process?",
-        "Are all lease terms clearly documented?",
-        "Have you verified the property management company's credentials?"
-      ],
-      sources: [
-        "https://www.hud.gov/topics/rental_assistance/tenantrights",
-        "https://www.nolo.com/legal-encyclopedia/renters-rights"
-      ]
-    };
-  } else {
-    // Default inconclusive case
-    return {
-      clear_outcome: false,
-      scam_likelihood: 0.5,
-      address: address,
-      reasons: [
-        ["bad", "Limited information available for analysis"],
-        ["good", "No obvious red flags detected"]
-      ],
-      analyzed_data: [
-        ["Information Available", "Insufficient data for complete analysis"],
-        ["Recommendation", "Gather more information before proceeding"]
-      ],
-      additional_questions: [
-        "Can you provide more details about the landlord?",
-        "What payment methods are being requested?",
-        "Have you been able to view the property in person?",
-        "Are there any unusual requests or pressure tactics?"
-      ],
-      sources: [
-        "https://www.consumer.ftc.gov/articles/0079-rental-scams"
-      ]
-    };
-  }
+// The summary the loading page stored (renderers.render_summary), or a fresh check
+async function loadResults() {
+  const stored = sessionStorage.getItem("veritas_result");
+  if (stored) return JSON.parse(stored);
+  const listing = sessionStorage.getItem("veritas_listing");
+  if (!listing) throw new Error("No listing submitted");
+  const summary = await fetchResults(JSON.parse(listing));
+  sessionStorage.setItem("veritas_result", JSON.stringify(summary));
+  return summary;
 }
 
 // ---- Page init ----
@@ -198,11 +121,7 @@ window.addEventListener("DOMContentLoaded", async () => {
 
   try {
     const address = getInputAddress();
-    
-    // For demo purposes, use mock data instead of real API call
-    // In production, replace this with: const data = await fetchResults(address);
-    await new Promise(resolve => setTimeout(resolve, 1500)); // Simulate loading time
-    const data = getMockResults(address);
+    const data = await loadResults();
 
     // Compute score text
     const score = computeLikelihood(data.clear_outcome, data.scam_likelihood);
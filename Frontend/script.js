@@ -397,24 +397,12 @@ async function handleFormSubmit(event) {
             attachments = await uploadFiles();
         }
         
-        // Submit form data
+        // The loading page streams the check from /api/checks/stream (verify_service.py)
         const formData = collectFormData(attachments);
-        const response = await submitForm(formData);
+        startCheck(formData);
         
-        if (response.ok) {
-            const result = await response.json();
-            
-            // Save address to sessionStorage for loading page
-            const address = document.getElementById('houseAddress').value.trim();
-            sessionStorage.setItem('veritas_address', address);
-            
-            
-            // Navigate to loading page
-            window.location.href = 'loading.html';
-        } else {
-            const error = await response.json();
-            showError(error);
-        }
+        // Navigate to loading page
+        window.location.href = 'loading.html';
     } catch (error) {
         console.error('Submission error:', error);
         showError({
@@ -498,36 +486,16 @@ function collectFormData(attachments) {
     };
 }
 
-async function submitForm(formData) {
-    // For demo purposes, simulate API call
-    // In production, this would make actual API calls
-    
-    console.log('Submitting form data:', formData);
-    
-    // Simulate API delay
-    await new Promise(resolve => setTimeout(resolve, 1000));
-    
-    // Simulate different responses for testing
-    const shouldSucceed = Math.random() >= 0; // 100% success rate for demo
-    
-    if (shouldSucceed) {
-        return {
-            ok: true,
-            json: async () => ({
-                submissionId: 'subm_' + Date.now(),
-                status: 'received',
-                estimatedWaitSec: 15
-            })
-        };
-    } else {
-        return {
-            ok: false,
-            json: async () => ({
-                errorId: 'err_' + Date.now(),
-                message: 'Validation failed: Please check your inputs and try again.'
-            })
-        };
-    }
+function startCheck(formData) {
+    // Read by loading.html (js/loading.js) and results.html (results.js)
+    sessionStorage.setItem('veritas_address', formData.houseAddress);
+    sessionStorage.setItem('veritas_listing', JSON.stringify({
+        name: formData.landlordName,
+        address: formData.houseAddress,
+        listing_url: formData.listingUrl,
+        other_details: formData.otherDetails
+    }));
+    sessionStorage.removeItem('veritas_result');
 }
 
 // UI State Management
@@ -1,15 +1,31 @@
 from Kamthe.SerperAPICall import search_google
-from Kamthe.firecrawl_scraper import scrape_url_simple
-import requests
+from Kamthe.firecrawl_scraper import scrape_url_or_none
+from http_client import post_json
+import llm_cache
+import tracing
+from relevance import ContentDeduper, landlord_page_relevant
+from content_window import landlord_window
 import os
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+import providers
 import json 
+from results import LandlordReport, SearchFinding
+from renderers import render_landlord
 
-load_dotenv()
+providers.load_env()
 
 # API configuration
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+OPENROUTER_API_URL = os.getenv("OPENROUTER_API_URL", "https://openrouter.ai/api/v1/chat/completions")
+
+# How many search results are scraped + analyzed at once
+ANALYSIS_CONCURRENCY = int(os.getenv("ANALYSIS_CONCURRENCY", "5"))
+
+# Batched analysis: pack all results of a search into one request, split into
+# several requests only when the estimated prompt exceeds the token budget
+ANALYSIS_BATCH = os.getenv("ANALYSIS_BATCH", "1") != "0"
+ANALYSIS_TOKEN_BUDGET = int(os.getenv("ANALYSIS_TOKEN_BUDGET", "12000"))
+CHARS_PER_TOKEN = 4
 
 # JSON schema for structured output
 AI_OUTPUT_SCHEMA = {
@@ -39,12 +55,75 @@ AI_OUTPUT_SCHEMA = {
     "required": ["name_address_match", "scam_fraud_report", "ownership_proof", "legal_news", "alive_or_dead"]
 }
 
-def analyze_landlord(name, address, search_result):
-    """Analyze a single search result for landlord verification."""
-    print(f"📄 Analyzing: {search_result['title']}")
-    
-    # Scrape the URL content
-    scraped_content = scrape_url_simple(search_result['link'])
+# One AI_OUTPUT_SCHEMA verdict per search result, tagged with the result number
+BATCH_OUTPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "result_number": {
+                        "type": "integer",
+                        "description": "The number of the search result this verdict is for"
+                    },
+                    **AI_OUTPUT_SCHEMA["properties"]
+                },
+                "required": ["result_number"] + AI_OUTPUT_SCHEMA["required"]
+            }
+        }
+    },
+    "required": ["results"]
+}
+
+class OpenRouterError(Exception):
+    """OpenRouter answered without a completion (error body or missing choices)."""
+
+
+def openrouter_completion(data, call_site, use_cache=None):
+    """
+    Run an OpenRouter chat completion and return the message content.
+
+    Responses are cached by llm_cache under a hash of the whole request body.
+    429/5xx responses are retried by rate_limit before `raise_for_status`.
+
+    Raises:
+        OpenRouterError: When the response carries no completion
+    """
+    def call():
+        headers = {
+            "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+            "Content-Type": "application/json"
+        }
+        response = post_json(OPENROUTER_API_URL, data, headers=headers, provider="openrouter")
+        response.raise_for_status()
+        response_data = response.json()
+        tracing.record_usage(response_data.get('usage'))
+        choices = response_data.get('choices')
+        if not choices or not (choices[0].get('message') or {}).get('content'):
+            error = response_data.get('error') or response_data
+            raise OpenRouterError(f"No completion from OpenRouter for {call_site}: {error}")
+        return choices[0]['message']['content'].strip()
+    return llm_cache.cached_call(call_site, data, call, use_cache=use_cache, provider="openrouter")
+
+
+def inconclusive_verdict():
+    return {k: 0 for k in AI_OUTPUT_SCHEMA["required"]}
+
+
+def analyze_landlord(name, address, search_result, scraped_content=None):
+    """
+    Analyze a single search result for landlord verification.
+
+    Without `scraped_content` the page is scraped and pre-filtered here; callers
+    passing it (see `_relevant_pages`) have already filtered it.
+    """
+    if scraped_content is None:
+        # Scrape the URL content
+        scraped_content = scrape_url_or_none(search_result['link'])
+        if not landlord_page_relevant(name, address, search_result, scraped_content):
+            return json.dumps(inconclusive_verdict())
     
     # Create analysis prompt
     prompt = f"""
@@ -55,7 +134,7 @@ def analyze_landlord(name, address, search_result):
     URL: {search_result['link']}
     Snippet: {search_result['snippet']}
     
-    Scraped Content: {scraped_content[:3000]}...
+    Relevant excerpts of the page: {landlord_window(scraped_content, name, address)}
     
     Answer these questions:
     1. Does the name and address match {name} at {address}? (Yes/No/Unknown)
@@ -69,11 +148,6 @@ def analyze_landlord(name, address, search_result):
 
     
     # Make API request
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    
     data = {
         "model": "openai/gpt-4o",
         "messages": [
@@ -90,54 +164,177 @@ def analyze_landlord(name, address, search_result):
         }
     }
     
-    response = requests.post(OPENROUTER_API_URL, headers=headers, json=data)
-    response_data = response.json()
-    return response_data['choices'][0]['message']['content'].strip()
+    return openrouter_completion(data, "analyze_landlord")
 
 
-def search_and_analyze_landlord(name, address, query):
-    """Search for landlord information and analyze results."""
-    
-    print(f"🔍 Searching for: {query}")
+def _result_block(i, result, scraped_content):
+    return f"""
+    Search Result {i}:
+    Title: {result['title']}
+    URL: {result['link']}
+    Snippet: {result['snippet']}
+    Relevant excerpts of the page: {scraped_content}
+    """
+
+
+def _batch_prompt(name, address, numbered_results):
+    blocks = "\n".join(_result_block(*item) for item in numbered_results)
+    return f"""
+    Your task is to analyze the following information and determine if this "landlord" is a potential scammer. Here are the results I got when I searched google for information about the "landlord". 
+    {blocks}
+    For EACH search result separately, answer these questions using only that result:
+    1. Does the name and address match {name} at {address}? (Yes/No/Unknown)
+    2. Are there any scam/fraud reports for {name}? (Yes/No/Unknown)
+    3. Does this prove ownership of {address} by {name}? (Yes/No/Unknown)
+    4. Are there any legal issues mentioned? (Yes/No/Unknown)
+    5. Is {name} alive and currently at {address}? (Yes/No/Unknown)
     
+    Return one entry per search result with its result_number and [name_address_match, scam_fraud_report, ownership_proof, legal_news, alive_or_dead] where yes is 1 and no is -1 and everything else is 0.
+    """
+
+
+def _chunk_by_tokens(numbered_results, token_budget):
+    """Split (i, result, scraped_content) tuples into chunks whose estimated prompt fits the budget."""
+    chunks, current = [], []
+    used = len(_batch_prompt("", "", [])) // CHARS_PER_TOKEN  # instructions, paid once per request
+    overhead = used
+    for item in numbered_results:
+        cost = len(_result_block(*item)) // CHARS_PER_TOKEN
+        if current and used + cost > token_budget:
+            chunks.append(current)
+            current, used = [], overhead
+        current.append(item)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _analyze_chunk(name, address, chunk):
+    data = {
+        "model": "openai/gpt-4o",
+        "messages": [
+            {"role": "user", "content": _batch_prompt(name, address, chunk)}
+        ],
+        "max_tokens": 150 * len(chunk),
+        "temperature": 0.3,
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "landlord_analysis_batch",
+                "schema": BATCH_OUTPUT_SCHEMA
+            }
+        }
+    }
+    return json.loads(openrouter_completion(data, "analyze_landlord_batch"))['results']
+
+
+def _relevant_pages(name, address, search_results, pool):
+    """
+    Scrape every search result and keep the pages worth an LLM call.
+
+    Pages that failed to scrape or fail the relevance pre-filter (placeholders, no mention
+    of the name or address) are dropped; duplicate pages point at the first copy.
+
+    Returns:
+        tuple: ([(result number, search result, scraped content)] to analyze,
+        {duplicate result number: result number of its first copy})
+    """
+    scraped = list(pool.map(tracing.bind(lambda result: scrape_url_or_none(result['link'])), search_results))
+    deduper = ContentDeduper()
+    pages, duplicate_of = [], {}
+    for i, (result, content) in enumerate(zip(search_results, scraped), 1):
+        if not landlord_page_relevant(name, address, result, content):
+            continue
+        first = deduper.first_seen(content, i)
+        if first != i:
+            duplicate_of[i] = first
+        else:
+            pages.append((i, result, content))
+    return pages, duplicate_of
+
+
+def _verdicts_in_order(count, by_number, duplicate_of):
+    """One AI_OUTPUT_SCHEMA verdict per result number 1..count (all 0 for results without an answer)."""
+    verdicts = []
+    for i in range(1, count + 1):
+        answer = by_number.get(duplicate_of.get(i, i), {})
+        verdicts.append({k: answer.get(k, 0) for k in AI_OUTPUT_SCHEMA["required"]})
+    return verdicts
+
+
+def analyze_landlord_batch(name, address, search_results, token_budget=ANALYSIS_TOKEN_BUDGET,
+                           max_workers=ANALYSIS_CONCURRENCY):
+    """
+    Analyze many search results with as few OpenRouter calls as the token budget allows.
+
+    Irrelevant pages are inconclusive without an LLM call and duplicate pages reuse the
+    verdict of the first copy (see `_relevant_pages`).
+
+    Returns:
+        list[dict]: One AI_OUTPUT_SCHEMA verdict per search result, in input order (all 0
+        for a result the model skipped)
+    """
+    workers = max(1, min(max_workers, len(search_results)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pages, duplicate_of = _relevant_pages(name, address, search_results, pool)
+        numbered = [(i, result, landlord_window(content, name, address)) for i, result, content in pages]
+        chunks = _chunk_by_tokens(numbered, token_budget) if numbered else []
+        answers = [a for chunk_answers in pool.map(tracing.bind(lambda chunk: _analyze_chunk(name, address, chunk)), chunks)
+                   for a in chunk_answers]
+    return _verdicts_in_order(len(search_results), {a.get('result_number'): a for a in answers}, duplicate_of)
+
+
+def analyze_landlord_each(name, address, search_results, max_workers=ANALYSIS_CONCURRENCY):
+    """
+    Analyze search results with one OpenRouter call per relevant, distinct page.
+
+    Same pre-filter, deduplication and return value as `analyze_landlord_batch`.
+    """
+    workers = max(1, min(max_workers, len(search_results)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pages, duplicate_of = _relevant_pages(name, address, search_results, pool)
+        answers = pool.map(tracing.bind(lambda page: json.loads(analyze_landlord(name, address, page[1], page[2]))), pages)
+        by_number = {i: answer for (i, _, _), answer in zip(pages, answers)}
+    return _verdicts_in_order(len(search_results), by_number, duplicate_of)
+
+
+def search_and_analyze_landlord(name, address, query, max_workers=ANALYSIS_CONCURRENCY, batch=ANALYSIS_BATCH):
+    """
+    Search for landlord information and analyze results.
+
+    Each result is scraped on a thread pool of at most `max_workers` threads
+    (1 = serial). With `batch`, all results go to the model in as few requests as
+    ANALYSIS_TOKEN_BUDGET allows; otherwise one request per relevant, distinct result. Flags are
+    collected in search-result order.
+
+    Returns:
+        LandlordReport: Per-result verdicts plus the green_flag / red_flag source maps
+    """
+    report = LandlordReport(query=query)
+
     # Search Google
     results = search_google(query)
     
     if not results:
-        print("❌ No search results found")
-        return
-    
-    print(f"✅ Found {len(results)} results")
-    print("-" * 60)
+        return report
+
+    # Both paths scrape concurrently, drop irrelevant pages and analyze duplicate pages once
+    if batch:
+        analyses = analyze_landlord_batch(name, address, results, max_workers=max_workers)
+    else:
+        analyses = analyze_landlord_each(name, address, results, max_workers=max_workers)
     
-    return_results = {'green_flag': {}, 'red_flag': {}}
-    # Analyze each result
-    for i, result in enumerate(results, 1):
-        print(f"\n{i}. {result['title']}")
-        print(f"   🔗 {result['link']}")
-        
-        analysis = analyze_landlord(name, address, result)
-        print(f"   🤖 Analysis")
-        analysis = json.loads(analysis)
-        for k,v in analysis.items():
+    for result, analysis in zip(results, analyses):
+        finding = SearchFinding(result['title'], result['link'], result['snippet'], analysis)
+        report.findings.append(finding)
+        for k,v in finding.verdicts.items():
             string_readable_k = ' '.join([word.capitalize() for word in k.split('_')])
             if v==1:
-                print(f"{string_readable_k}: ✅")
-                if string_readable_k in return_results['green_flag']:
-                    return_results['green_flag'][string_readable_k].append(result)
-                else:
-                    return_results['green_flag'][string_readable_k] = [result]
+                report.green_flag.setdefault(string_readable_k, []).append(finding.source())
             elif v==-1:
-                print(f"🚩🚩🚩 RED FLAG ALERT: {string_readable_k} 🚩🚩🚩")
-                if string_readable_k in return_results['red_flag']:
-                    return_results['red_flag'][string_readable_k].append(result)
-                else:
-                    return_results['red_flag'][string_readable_k] = [result]
-            elif v==0:
-                print(f"Inconclusive: {string_readable_k}")
-        print("-" * 60)
-    return return_results
-
+                report.red_flag.setdefault(string_readable_k, []).append(finding.source())
+    return report
 
 def main():
     """Main function to run the landlord verification tool."""
@@ -154,7 +351,7 @@ def main():
         print("=" * 60)
         
         # Search and analyze
-        search_and_analyze_landlord(name, address)
+        render_landlord(search_and_analyze_landlord(name, address, f"{name} {address}"))
         
         print("\n✅ Analysis complete!")
         
@@ -1,40 +1,186 @@
-import http.client
-import json
 import os
-from dotenv import load_dotenv
+import re
+import threading
+import time
+from collections import OrderedDict
+import providers
+from http_client import apost_json, post_json
+from cache_store import CacheStore
+from address import SUFFIXES, DIRECTIONS
+from single_flight import get_group
+import tracing
 
-load_dotenv()
+providers.load_env()
 
-def search_google(query, api_key=os.getenv("SERPER_API_KEY"), num_results=5):
+SERPER_API_URL = os.getenv("SERPER_API_URL", "https://google.serper.dev/search")
+
+# Search cache: results younger than SEARCH_CACHE_TTL are fresh; for SEARCH_CACHE_STALE_TTL
+# more seconds they are still served immediately while a background refresh runs.
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", str(6 * 3600)))
+SEARCH_CACHE_STALE_TTL = int(os.getenv("SEARCH_CACHE_STALE_TTL", str(7 * 24 * 3600)))
+SEARCH_CACHE_MEMORY_SIZE = 1024
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE", "1") != "0"
+
+# Addresses are canonicalized by address.py before they reach a query; this only evens
+# out abbreviations in the remaining free text
+_ABBREVIATIONS = {**SUFFIXES, **DIRECTIONS, "apt": "unit", "ste": "unit", "suite": "unit", "#": "unit",
+                  "sf": "san francisco"}
+_TOKEN_RE = re.compile(r"#|[\w']+")
+
+_memory = OrderedDict()  # normalized key -> {"results": [...], "fetched_at": ts}, least recently used first
+_refreshing = set()
+_lock = threading.Lock()
+_store = None
+
+
+def normalize_query(query):
+    """Cache key form of a query: lower-cased, punctuation and extra whitespace dropped, address abbreviations expanded."""
+    tokens = _TOKEN_RE.findall(query.lower())
+    return " ".join(_ABBREVIATIONS.get(t, t) for t in tokens)
+
+
+def _get_store():
+    global _store
+    with _lock:
+        if _store is None:
+            _store = CacheStore("serper_searches", default_ttl=SEARCH_CACHE_TTL + SEARCH_CACHE_STALE_TTL)
+    return _store
+
+
+def _remember(key, entry):
+    with _lock:
+        _memory[key] = entry
+        _memory.move_to_end(key)
+        while len(_memory) > SEARCH_CACHE_MEMORY_SIZE:
+            _memory.popitem(last=False)
+
+
+def _recall(key):
+    """Memory-cache entry for `key`, marked most recently used; None on a miss."""
+    with _lock:
+        entry = _memory.get(key)
+        if entry is not None:
+            _memory.move_to_end(key)
+    return entry
+
+
+def _fetch_and_store(key, query, api_key, num_results):
+    def fetch():
+        results = fetch_search_results(query, api_key=api_key, num_results=num_results)
+        entry = {"results": results, "fetched_at": time.time()}
+        _remember(key, entry)
+        _get_store().set(key, entry)
+        return results
+    # Concurrent misses (and background refreshes) for the same query share one Serper call
+    return get_group("serper").do(key, fetch)
+
+
+def _refresh_in_background(key, query, api_key, num_results):
+    with _lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def refresh():
+        try:
+            _fetch_and_store(key, query, api_key, num_results)
+        except Exception as e:
+            print(f"⚠️ Background refresh failed for '{query}': {e}")
+        finally:
+            with _lock:
+                _refreshing.discard(key)
+
+    threading.Thread(target=refresh, daemon=True).start()
+
+
+def _lookup(key, query, api_key, num_results):
+    """Cached results for `key` (memory, then disk), or None on a miss; stale hits start a background refresh."""
+    entry = _recall(key)
+    if entry is not None:
+        tracing.count("cache.serper_memory.hit")
+    else:
+        entry = _get_store().get(key)
+        if entry is not None:
+            _remember(key, entry)
+    if entry is not None:
+        age = time.time() - entry["fetched_at"]
+        if age < SEARCH_CACHE_TTL:
+            return entry["results"]
+        if age < SEARCH_CACHE_TTL + SEARCH_CACHE_STALE_TTL:
+            tracing.count("cache.serper_searches.stale")
+            _refresh_in_background(key, query, api_key, num_results)
+            return entry["results"]
+    return None
+
+
+def search_google(query, api_key=os.getenv("SERPER_API_KEY"), num_results=5, use_cache=SEARCH_CACHE_ENABLED):
     """
     Search Google using Serper API and return the top search results.
+
+    Results are memoized in memory and on disk under the normalized query. Stale
+    entries are returned immediately while a background thread refreshes them.
     
     Args:
         query (str): The search query
         api_key (str): Serper API key
         num_results (int): Number of results to return (default: 5)
+        use_cache (bool): Use the search cache (default: on unless SEARCH_CACHE=0)
     
     Returns:
         list: List of dictionaries containing search results with title, link, and snippet
     """
-    conn = http.client.HTTPSConnection("google.serper.dev")
-    payload = json.dumps({
+    if not use_cache:
+        return fetch_search_results(query, api_key=api_key, num_results=num_results)
+
+    key = f"{num_results}|{normalize_query(query)}"
+    results = _lookup(key, query, api_key, num_results)
+    if results is not None:
+        return results
+    return _fetch_and_store(key, query, api_key, num_results)
+
+
+async def search_google_async(query, api_key=os.getenv("SERPER_API_KEY"), num_results=5,
+                              use_cache=SEARCH_CACHE_ENABLED):
+    """
+    Async variant of `search_google` for pipeline stages: same cache, misses are sent
+    with `http_client.apost_json` on the event loop instead of a worker thread.
+    """
+    if not use_cache:
+        return await fetch_search_results_async(query, api_key=api_key, num_results=num_results)
+
+    key = f"{num_results}|{normalize_query(query)}"
+    results = _lookup(key, query, api_key, num_results)
+    if results is not None:
+        return results
+
+    async def fetch():
+        results = await fetch_search_results_async(query, api_key=api_key, num_results=num_results)
+        entry = {"results": results, "fetched_at": time.time()}
+        _remember(key, entry)
+        _get_store().set(key, entry)
+        return results
+    return await get_group("serper").do_async(key, fetch)
+
+
+def _request(query, api_key, num_results):
+    payload = {
         "q": query,
         "num": num_results
-    })
+    }
     headers = {
         'X-API-KEY': api_key,
         'Content-Type': 'application/json'
     }
-    
-    conn.request("POST", "/search", payload, headers)
-    res = conn.getresponse()
-    data = res.read()
-    
-    response_data = json.loads(data.decode("utf-8"))
+    return payload, headers
+
+
+def _parse_results(response, num_results):
+    # 429/5xx are retried by rate_limit; whatever still fails surfaces here instead of as a missing key
+    response.raise_for_status()
+    response_data = response.json()
     
     results = []
-    for item in response_data['organic'][:num_results]:
+    for item in response_data.get('organic', [])[:num_results]:
         result = {
             'title': item['title'],
             'link': item['link'],
@@ -42,9 +188,21 @@ def search_google(query, api_key=os.getenv("SERPER_API_KEY"), num_results=5):
         }
         results.append(result)
     
-    conn.close()
     return results
 
+
+def fetch_search_results(query, api_key=os.getenv("SERPER_API_KEY"), num_results=5):
+    """Uncached Serper search; same arguments and return value as `search_google`."""
+    payload, headers = _request(query, api_key, num_results)
+    return _parse_results(post_json(SERPER_API_URL, payload, headers=headers, provider="serper"), num_results)
+
+
+async def fetch_search_results_async(query, api_key=os.getenv("SERPER_API_KEY"), num_results=5):
+    """Async variant of `fetch_search_results`."""
+    payload, headers = _request(query, api_key, num_results)
+    return _parse_results(await apost_json(SERPER_API_URL, payload, headers=headers, provider="serper"), num_results)
+
+
 if __name__ == "__main__":
     query = input("Enter your search query: ")
     results = search_google(query)
@@ -1,21 +1,88 @@
-import requests
+import hashlib
 import os
-from dotenv import load_dotenv
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import providers
+from http_client import post_json
+from cache_store import CacheStore
+from single_flight import get_group
+import tracing
 
-load_dotenv()
+providers.load_env()
 
 FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY")
-FIRECRAWL_API_URL = "https://api.firecrawl.dev/v0/scrape"
+FIRECRAWL_API_URL = os.getenv("FIRECRAWL_API_URL", "https://api.firecrawl.dev/v0/scrape")
 
-def scrape_url(url):
+# Scrape cache: TTL in seconds per domain (matched on the domain suffix), size cap in MB
+SCRAPE_CACHE_TTLS = {
+    "zillow.com": 6 * 3600,
+    "recorder.sfgov.org": 7 * 24 * 3600,
+    "sfplanning.org": 7 * 24 * 3600,
+}
+SCRAPE_CACHE_DEFAULT_TTL = 24 * 3600
+SCRAPE_CACHE_MAX_MB = int(os.getenv("SCRAPE_CACHE_MAX_MB", "256"))
+SCRAPE_CACHE_ENABLED = os.getenv("SCRAPE_CACHE", "1") != "0"
+
+# Query parameters that never change the page content
+_TRACKING_PARAMS = {"fbclid", "gclid", "ref", "ref_src"}
+
+_scrape_cache = None
+_scrape_cache_lock = threading.Lock()
+
+
+def get_scrape_cache():
+    """Return the process-wide scrape cache store."""
+    global _scrape_cache
+    with _scrape_cache_lock:
+        if _scrape_cache is None:
+            _scrape_cache = CacheStore("firecrawl_scrapes", max_bytes=SCRAPE_CACHE_MAX_MB * 1024 * 1024)
+    return _scrape_cache
+
+
+def normalize_url(url):
+    """Canonical form of a URL for cache keys: lower-cased host, no fragment, tracking params dropped, params sorted."""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not (k.lower().startswith("utm_") or k.lower() in _TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower() or "https", parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def scrape_cache_key(url, formats):
+    """Content-addressed key for a (normalized url, requested formats) pair."""
+    raw = normalize_url(url) + "|" + ",".join(sorted(formats))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def scrape_ttl(url):
+    """TTL for a URL's domain, falling back to SCRAPE_CACHE_DEFAULT_TTL."""
+    host = urlsplit(url).netloc.lower().split(":")[0]
+    for domain, ttl in SCRAPE_CACHE_TTLS.items():
+        if host == domain or host.endswith("." + domain):
+            return ttl
+    return SCRAPE_CACHE_DEFAULT_TTL
+
+
+def scrape_url(url, formats=("markdown", "links"), use_cache=SCRAPE_CACHE_ENABLED):
     """
     Scrape a URL using Firecrawl API.
+
+    Successful scrapes are cached on disk keyed by the normalized URL and formats
+    (see `get_scrape_cache`); failed scrapes are never cached.
     
     Args:
         url (str): The URL to scrape
+        formats (tuple): Firecrawl output formats to request
+        use_cache (bool): Read from / write to the scrape cache
     
     Returns:
         dict: Firecrawl API response
+
+    Raises:
+        rate_limit.CircuitOpenError: When the Firecrawl circuit is open
+        HTTPError: When Firecrawl still answers with an error status after retries
     """
     # Check if URL is a social media platform
     social_platforms = ['facebook.com', 'twitter.com', 'instagram.com', 'tiktok.com', 'x.com']
@@ -29,6 +96,17 @@ def scrape_url(url):
             }
         }
     
+    cache_key = scrape_cache_key(url, formats)
+    if use_cache:
+        cached = get_scrape_cache().get(cache_key)
+        if cached is not None:
+            return cached
+
+    # Concurrent scrapes of the same page (e.g. several checks for one building) share one request
+    return get_group("firecrawl").do(cache_key, lambda: _fetch_scrape(url, formats, use_cache, cache_key))
+
+
+def _fetch_scrape(url, formats, use_cache, cache_key):
     headers = {
         "Authorization": f"Bearer {FIRECRAWL_API_KEY}",
         "Content-Type": "application/json"
@@ -36,24 +114,16 @@ def scrape_url(url):
     
     data = {
         "url": url,
-        "formats": ["markdown", "links"]
+        "formats": list(formats)
     }
     
-    response = requests.post(FIRECRAWL_API_URL, headers=headers, json=data)
-    
-    # Check if the response is successful
-    if response.status_code == 200:
-        return response.json()
-    else:
-        # Return a fallback structure if API fails
-        return {
-            'data': {
-                'title': 'Error',
-                'description': 'Failed to scrape content',
-                'markdown': 'No data available after scraping',
-                'links': []
-            }
-        }
+    # Retries 429/5xx with backoff; the circuit-open error and the final HTTP error propagate
+    response = post_json(FIRECRAWL_API_URL, data, headers=headers, provider="firecrawl")
+    response.raise_for_status()
+    result = response.json()
+    if use_cache:
+        get_scrape_cache().set(cache_key, result, ttl=scrape_ttl(url))
+    return result
 
 def scrape_url_simple(url):
     """
@@ -64,6 +134,9 @@ def scrape_url_simple(url):
     
     Returns:
         str: Markdown content of the URL
+
+    Raises:
+        Same errors as `scrape_url`
     """
     result = scrape_url(url)
     
@@ -73,6 +146,21 @@ def scrape_url_simple(url):
     else:
         return "No data available after scraping"
 
+
+def scrape_url_or_none(url):
+    """
+    `scrape_url_simple` for callers that go on without a page.
+
+    Returns:
+        str | None: Markdown content, or None when the scrape failed (the error is on the
+        firecrawl client span; the current span counts it as `firecrawl.failed`)
+    """
+    try:
+        return scrape_url_simple(url)
+    except Exception:
+        tracing.count("firecrawl.failed")
+        return None
+
 def main():
     """Main function to demonstrate URL scraping."""
     print("=== Firecrawl URL Scraper ===")
@@ -0,0 +1,200 @@
+"""
+Canonical form of free-text San Francisco addresses.
+
+    parse_address("88 king st, unit 116, san francisco 94107")
+    -> Address(number="88", street="king street", unit="116", city="san francisco", state="ca", zip="94107")
+
+`Address.key` ("88 king street #116") is the cache / index / pipeline key for an
+address, and `Address.display` ("88 King Street #116, San Francisco, CA 94107") is the
+text sent to Serper, Zillow searches and the block/lot prompt, so differently typed
+variants of one address share cache entries. Parsing is offline and regex-based;
+`parse_address` is memoized and `parse_addresses` normalizes whole listing feeds.
+Changing what `key` returns invalidates stored parcel keys: bump
+`parcel_index.KEY_VERSION` so existing indexes are re-keyed.
+
+    python address.py "539 28th Ave APT2, San Francisco, CA 94121"
+    python address.py --file listings.jsonl
+"""
+import argparse
+import csv
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+ADDRESS_CACHE_SIZE = 65536
+# Everything this repo looks up is in San Francisco
+DEFAULT_CITY = "san francisco"
+DEFAULT_STATE = "ca"
+
+# "apt 2", "APT2", "unit 116", "Apt #4B", "#307" -- but not "Aptos Ave" or "Unity Way"
+_UNIT_RE = re.compile(
+    r"(?:\b(?:apt|apartment|unit|ste|suite)(?:\.?\s*#\s*|\.?\s*(?=\d)|\.?\s+)|#\s*)([\w-]+)", re.IGNORECASE)
+# A zip code only counts at the end ("..., CA 94107", "... 94107-1234, USA"), never a 5-digit house number
+_ZIP_RE = re.compile(r"\b(\d{5})(?:-\d{4})?\W*(?:\b(?:usa|us|united states)\W*)?$", re.IGNORECASE)
+_TOKEN_RE = re.compile(r"[\w']+")
+SUFFIXES = {
+    "st": "street", "str": "street", "ave": "avenue", "av": "avenue", "blvd": "boulevard", "rd": "road",
+    "dr": "drive", "ln": "lane", "ct": "court", "pl": "place", "ter": "terrace", "hwy": "highway",
+    "pkwy": "parkway", "aly": "alley", "cir": "circle", "sq": "square", "plz": "plaza", "way": "way",
+}
+DIRECTIONS = {"n": "north", "s": "south", "e": "east", "w": "west"}
+_SUFFIX_WORDS = set(SUFFIXES) | set(SUFFIXES.values())
+# Directions after the street type belong to the street: "Pennsylvania Ave NW"
+_POST_DIRECTIONS = {**DIRECTIONS, "ne": "northeast", "nw": "northwest", "se": "southeast", "sw": "southwest"}
+_POST_DIRECTION_WORDS = set(_POST_DIRECTIONS) | set(_POST_DIRECTIONS.values())
+_CITY_ABBREVIATIONS = {"sf": "san francisco", "s f": "san francisco"}
+STATES = {
+    "al": "alabama", "ak": "alaska", "az": "arizona", "ar": "arkansas", "ca": "california", "co": "colorado",
+    "ct": "connecticut", "de": "delaware", "dc": "district of columbia", "fl": "florida", "ga": "georgia",
+    "hi": "hawaii", "id": "idaho", "il": "illinois", "in": "indiana", "ia": "iowa", "ks": "kansas",
+    "ky": "kentucky", "la": "louisiana", "me": "maine", "md": "maryland", "ma": "massachusetts",
+    "mi": "michigan", "mn": "minnesota", "ms": "mississippi", "mo": "missouri", "mt": "montana",
+    "ne": "nebraska", "nv": "nevada", "nh": "new hampshire", "nj": "new jersey", "nm": "new mexico",
+    "ny": "new york", "nc": "north carolina", "nd": "north dakota", "oh": "ohio", "ok": "oklahoma",
+    "or": "oregon", "pa": "pennsylvania", "ri": "rhode island", "sc": "south carolina", "sd": "south dakota",
+    "tn": "tennessee", "tx": "texas", "ut": "utah", "vt": "vermont", "va": "virginia", "wa": "washington",
+    "wv": "west virginia", "wi": "wisconsin", "wy": "wyoming",
+}
+_STATE_NAMES = {name: code for code, name in STATES.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class Address:
+    """A parsed address; all fields are lower-case and empty when unknown."""
+    number: str
+    street: str
+    unit: str = ""
+    city: str = ""
+    state: str = ""
+    zip: str = ""
+
+    @property
+    def building_key(self):
+        """Key of the building: "88 king street"."""
+        return f"{self.number} {self.street}".strip()
+
+    @property
+    def key(self):
+        """Canonical key of the unit (or building when there is no unit): "88 king street #116"."""
+        return f"{self.building_key} #{self.unit}" if self.unit else self.building_key
+
+    @property
+    def display(self):
+        """Canonical text form for queries and prompts: "88 King Street #116, San Francisco, CA 94107"."""
+        line = " ".join(w.capitalize() if w[:1].isalpha() else w for w in self.building_key.split())
+        if self.unit:
+            line += f" #{self.unit.upper()}"
+        place = " ".join(w.capitalize() for w in self.city.split())
+        region = " ".join(p for p in (self.state.upper(), self.zip) if p)
+        return ", ".join(p for p in (line, place, region) if p)
+
+
+def _street_words(tokens, post_direction=""):
+    """Expand a leading direction (when a street name follows it), a trailing street-type abbreviation and a post-directional."""
+    words = list(tokens)
+    # "N Point St" is North Point Street, but in "10 E St" the letter is the street name
+    if words and words[0] in DIRECTIONS and any(w not in _SUFFIX_WORDS for w in words[1:]):
+        words[0] = DIRECTIONS[words[0]]
+    if len(words) > 1 and words[-1] in SUFFIXES:
+        words[-1] = SUFFIXES[words[-1]]
+    if post_direction:
+        words.append(_POST_DIRECTIONS.get(post_direction, post_direction))
+    return " ".join(words)
+
+
+def _place(text):
+    """City and two-letter state from the text after the street line (state empty when none is given)."""
+    words = [w for w in _TOKEN_RE.findall(text.lower()) if not w.isdigit()]
+    state = ""
+    for size in (3, 2, 1):  # "district of columbia", "new york", "michigan" / "mi"
+        tail = " ".join(words[-size:])
+        if len(words) >= size and (tail in _STATE_NAMES or (size == 1 and tail in STATES)):
+            state = _STATE_NAMES.get(tail, tail)
+            del words[-size:]
+            break
+    city = " ".join(words)
+    return _CITY_ABBREVIATIONS.get(city, city), state
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def parse_address(text):
+    """
+    Parse a free-text address into its canonical parts.
+
+    The unit may appear anywhere ("apt 2", "APT2", "unit 116", "Apt #4B", "#307"). A
+    direction right after the street type stays in the street ("Ave NW"); without commas,
+    the words after that are read as the city. The zip code is only read from the end. The state is read from a
+    two-letter code or a full state name; without one it defaults to CA, and the city
+    defaults to San Francisco when the address is in California.
+
+    Returns:
+        Address: Parsed address (number and street are empty when there is no street line)
+    """
+    text = " ".join((text or "").split())
+    unit_match = _UNIT_RE.search(text)
+    unit = unit_match.group(1).lower() if unit_match else ""
+    if unit_match:
+        text = text[:unit_match.start()] + text[unit_match.end():]
+    zip_match = _ZIP_RE.search(text)
+    zip_code = zip_match.group(1) if zip_match else ""
+    if zip_match:
+        text = text[:zip_match.start()]
+
+    street_line, _, rest = text.partition(",")
+    tokens = _TOKEN_RE.findall(street_line.lower())
+    number = tokens.pop(0) if tokens and tokens[0][0].isdigit() else ""
+    # "88 King St San Francisco CA": the street ends at its first street-type word
+    cut = next((i + 1 for i, t in enumerate(tokens) if i > 0 and t in _SUFFIX_WORDS), len(tokens))
+    street_tokens, place_tokens = tokens[:cut], tokens[cut:]
+    post_direction = place_tokens.pop(0) if place_tokens and place_tokens[0] in _POST_DIRECTION_WORDS else ""
+    city, state = _place(" ".join(place_tokens) + " " + rest)
+    state = state or DEFAULT_STATE
+    if not city and state == DEFAULT_STATE:
+        city = DEFAULT_CITY
+    return Address(number, _street_words(street_tokens, post_direction), unit, city, state, zip_code)
+
+
+def normalize_address(text):
+    """Canonical key of a free-text address (see `Address.key`)."""
+    return parse_address(text).key
+
+
+def parse_addresses(texts):
+    """
+    Parse many addresses, parsing each distinct text once.
+
+    Returns:
+        list[Address]: One Address per input, in input order
+    """
+    parsed = {}
+    return [parsed[t] if t in parsed else parsed.setdefault(t, parse_address(t)) for t in texts]
+
+
+def normalize_listings(listings, field="address"):
+    """Add `address_key` and canonical `address_display` to every listing dict of a feed (in place)."""
+    for listing, address in zip(listings, parse_addresses([l.get(field) or "" for l in listings])):
+        listing["address_key"] = address.key
+        listing["address_display"] = address.display
+    return listings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Normalize addresses")
+    parser.add_argument("addresses", nargs="*")
+    parser.add_argument("--file", help="JSONL/CSV feed with an address column")
+    args = parser.parse_args()
+
+    texts = list(args.addresses)
+    if args.file:
+        with open(args.file, newline="") as f:
+            rows = list(csv.DictReader(f)) if args.file.lower().endswith(".csv") else \
+                [json.loads(line) for line in f if line.strip()]
+        texts += [r.get("address") or "" for r in rows]
+    for text, address in zip(texts, parse_addresses(texts)):
+        print(f"{text}  →  {address.key}  |  {address.display}")
+    print(parse_address.cache_info())
+
+
+if __name__ == "__main__":
+    main()
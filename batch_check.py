@@ -0,0 +1,135 @@
+"""
+Batch landlord verification.
+
+Reads a JSONL or CSV of listings (name, address, listing_url, other_details and an
+optional monthly rent; without it the rent is read from other_details), runs
+`check_if_scammer` on them concurrently and streams one JSON result per line:
+
+    python batch_check.py listings.jsonl results.jsonl --concurrency 8 --rate serper=5 --rate firecrawl=2
+
+Duplicate name+address rows are checked once. Stages shared between listings (the
+Zillow search, block/lot and recorder lookups for one address) run once per batch.
+Checks stop once their risk verdict is decisive (see risk_scoring.py); pass
+--full-audit to run every stage for every listing.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import time
+
+import http_client
+import llm_cache
+import rate_limit
+import recorder_scraper
+import single_flight
+from Kamthe.firecrawl_scraper import get_scrape_cache
+from browser_pool import get_browser_pool
+from check_if_scammer import check_if_scammer
+from address import normalize_address
+from name_match import name_key
+from renderers import dumps
+from rent_extractor import parse_reported_rent
+from risk_scoring import FULL_AUDIT
+
+FIELDS = ("name", "address", "listing_url", "other_details", "rent")
+
+
+def read_listings(path):
+    """Read listing rows from a .jsonl or .csv file."""
+    with open(path, newline="") as f:
+        if path.lower().endswith(".csv"):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+    return [{k: (row.get(k) or "") for k in FIELDS} for row in rows]
+
+
+async def run_batch(listings, out, concurrency=4, full_audit=FULL_AUDIT):
+    """
+    Check every listing and write one JSON line per input row to `out` as checks finish.
+
+    Args:
+        listings (list[dict]): Rows with name, address, listing_url, other_details and optional rent
+        out (file): Text file object receiving JSON lines
+        concurrency (int): Checks in flight at once
+        full_audit (bool): Run every stage instead of stopping once a verdict is decisive
+
+    Returns:
+        dict: Batch counters
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    memo = {}
+    checks = {}  # (name, address) key -> task, so duplicate rows share one check
+    stats = {"rows": len(listings), "checks": 0, "errors": 0}
+
+    async def check(listing):
+        async with semaphore:
+            stats["checks"] += 1
+            return await check_if_scammer(listing["name"], listing["address"], listing["listing_url"],
+                                          listing["other_details"], shared=memo, full_audit=full_audit,
+                                          reported_rent=parse_reported_rent(listing["rent"]))
+
+    async def process(i, listing):
+        key = (name_key(listing["name"]), normalize_address(listing["address"]))
+        if key not in checks:
+            checks[key] = asyncio.ensure_future(check(listing))
+        line = {"row": i, **listing}
+        try:
+            line["result"] = await asyncio.shield(checks[key])
+        except Exception as e:
+            stats["errors"] += 1
+            line["error"] = f"{type(e).__name__}: {e}"
+        out.write(dumps(line) + "\n")
+        out.flush()
+
+    await asyncio.gather(*(process(i, listing) for i, listing in enumerate(listings)))
+    stats["shared_stage_runs"] = len(memo)
+    return stats
+
+
+def parse_rate(value):
+    provider, _, rate = value.partition("=")
+    if not rate:
+        raise argparse.ArgumentTypeError("expected PROVIDER=REQUESTS_PER_SECOND")
+    return provider.strip().lower(), float(rate)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Batch landlord verification")
+    parser.add_argument("input", help="listings .jsonl or .csv")
+    parser.add_argument("output", help="results .jsonl (one line per input row)")
+    parser.add_argument("--concurrency", type=int, default=4, help="checks in flight at once")
+    parser.add_argument("--rate", type=parse_rate, action="append", default=[], metavar="PROVIDER=RPS",
+                        help="per-provider rate limit, e.g. serper=5 (repeatable)")
+    parser.add_argument("--full-audit", action="store_true", default=FULL_AUDIT,
+                        help="run every stage even once the risk verdict is decisive")
+    args = parser.parse_args()
+
+    for provider, rate in args.rate:
+        rate_limit.configure(provider, rate)
+
+    listings = read_listings(args.input)
+    t0 = time.perf_counter()
+    try:
+        with open(args.output, "w") as out:
+            stats = await run_batch(listings, out, concurrency=args.concurrency, full_audit=args.full_audit)
+    finally:
+        await get_browser_pool().close()
+        await recorder_scraper.close()
+        await http_client.aclose()
+    print(f"✅ {stats['rows']} rows, {stats['checks']} checks, {stats['errors']} errors "
+          f"in {time.perf_counter() - t0:.1f}s → {args.output}")
+    for provider, m in rate_limit.stats().items():
+        print(f"   {provider}: {m['requests']} requests, {m['retries']} retries, {m['throttled']} throttled, "
+              f"circuit {m['circuit']}")
+    for group, m in single_flight.stats().items():
+        print(f"   {group}: {m['executed']} lookups, {m['deduplicated']} coalesced (max {m['max_callers']} callers)")
+    for call_site, m in llm_cache.stats().items():
+        print(f"   llm {call_site}: {m['hits']} cache hits, {m['misses']} misses, {m['bypassed']} bypassed")
+    m = get_scrape_cache().stats()
+    print(f"   scrape cache: {m['hits']} hits, {m['misses']} misses, {m['entries']} entries, {m['evictions']} evicted")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
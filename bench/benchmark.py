@@ -0,0 +1,200 @@
+"""
+Offline pipeline benchmark on recorded provider fixtures (see replay.py).
+
+Starts the replay stub server, points Serper/Firecrawl/OpenRouter at it, seeds the
+parcel index and owner store so the GPT-5 block/lot lookup and the recorder browser
+agent are skipped, and measures latency and throughput of `check_if_scammer`,
+`search_and_analyze_landlord` and `analyze_zillow` at several concurrency levels:
+
+    python -m bench.benchmark bench/fixtures --listings listings.jsonl --concurrency 1,4,8 \\
+        --latency serper=400 --latency firecrawl=1500 --latency openrouter=2500
+
+Listings are JSONL/CSV rows with name and address, optionally block_number, lot_number
+and owners (a list, or names separated by ";") used for seeding. Local caches are
+disabled so every repetition reaches the stub server.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import tempfile
+import time
+
+import replay
+from address import parse_address
+
+DEFAULT_LISTINGS = [
+    {"name": "Advaith Sridhar", "address": "88 King Street, San Francisco, 94107"},
+    {"name": "Mittie J. Priest", "address": "4350 Kirkham St, San Francisco, CA 94122"},
+    {"name": "Aliou Balde", "address": "539 28th Ave APT2, San Francisco, CA 94121"},
+]
+TARGETS = ("check", "landlord", "zillow")
+
+
+def read_listings(path):
+    with open(path, newline="") as f:
+        if path.lower().endswith(".csv"):
+            return list(csv.DictReader(f))
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def _summary(latencies, wall):
+    return {
+        "runs": len(latencies),
+        "wall_seconds": round(wall, 3),
+        "throughput_per_second": round(len(latencies) / wall, 3) if wall else 0.0,
+        "p50_seconds": round(_percentile(latencies, 0.5), 3),
+        "p95_seconds": round(_percentile(latencies, 0.95), 3),
+        "max_seconds": round(max(latencies, default=0.0), 3),
+    }
+
+
+def _configure_environment(base_url, cache_dir):
+    """Point providers at the stub server and isolate local state; must run before the pipeline is imported."""
+    os.environ.update(replay.provider_env(base_url))
+    os.environ.update({"VERITAS_CACHE_DIR": cache_dir, "LLM_CACHE": "0", "SEARCH_CACHE": "0", "SCRAPE_CACHE": "0"})
+    for key in ("SERPER_API_KEY", "FIRECRAWL_API_KEY", "OPENROUTER_API_KEY", "OPENAI_API_KEY"):
+        os.environ.setdefault(key, "replay")
+    replay.RECORD_DIR = None
+
+
+def _seed(listings):
+    """Index every listing's parcel and owners so no stage needs GPT-5 or a browser."""
+    from parcel_index import get_parcel_index
+    from property_search import get_owner_store, owner_key
+
+    index, store = get_parcel_index(), get_owner_store()
+    for i, listing in enumerate(listings):
+        block = listing.get("block_number") or f"B{i:03d}"
+        lot = listing.get("lot_number") or "001"
+        owners = listing.get("owners") or [listing["name"]]
+        if isinstance(owners, str):
+            owners = [o.strip() for o in owners.split(";") if o.strip()]
+        index.add(listing["address"], block, lot, source="bench")
+        store.set(owner_key(block, lot), owners)
+
+
+async def _timed_runs(jobs, concurrency):
+    """Run coroutine factories with at most `concurrency` in flight; return per-run latencies and wall time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(job):
+        async with semaphore:
+            t0 = time.perf_counter()
+            result = await job()
+            latencies.append(time.perf_counter() - t0)
+            return result
+
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(one(job) for job in jobs))
+    return results, latencies, time.perf_counter() - t0
+
+
+async def bench_check(listings, concurrency, repeat):
+    from check_if_scammer import check_if_scammer
+    from rent_extractor import parse_reported_rent
+
+    jobs = [lambda l=l: check_if_scammer(l["name"], l["address"], "", l.get("other_details", ""),
+                                         reported_rent=parse_reported_rent(l.get("rent")))
+            for l in listings * repeat]
+    results, latencies, wall = await _timed_runs(jobs, concurrency)
+    stages = {}
+    for result in results:
+        for stage, seconds in result.timings.items():
+            stages.setdefault(stage, []).append(seconds)
+    report = _summary(latencies, wall)
+    report["stages"] = {stage: {"mean_seconds": round(sum(v) / len(v), 3), "p95_seconds": round(_percentile(v, 0.95), 3)}
+                        for stage, v in stages.items()}
+    return report
+
+
+async def bench_landlord(listings, concurrency, repeat):
+    from Kamthe.GoogleSearch import search_and_analyze_landlord
+
+    # Same canonical query check_if_scammer.build_stages sends, so fixtures recorded by `check` replay here
+    jobs = [lambda l=l, display=parse_address(l["address"]).display: asyncio.to_thread(
+                search_and_analyze_landlord, l["name"], display, f"{l['name']} {display}")
+            for l in listings * repeat]
+    _, latencies, wall = await _timed_runs(jobs, concurrency)
+    return _summary(latencies, wall)
+
+
+async def bench_zillow(listings, concurrency, repeat):
+    from Kamthe.SerperAPICall import search_google
+    from zillow import analyze_zillow
+
+    # The Zillow search itself is not part of analyze_zillow; fetch it once up front
+    addresses = [parse_address(l['address']).display for l in listings]
+    searches = [(search_google(f"{a} zillow"), a) for a in addresses]
+    jobs = [lambda s=s, a=a: asyncio.to_thread(analyze_zillow, s, a) for s, a in searches * repeat]
+    _, latencies, wall = await _timed_runs(jobs, concurrency)
+    return _summary(latencies, wall)
+
+
+BENCHMARKS = {"check": bench_check, "landlord": bench_landlord, "zillow": bench_zillow}
+
+
+def print_report(report):
+    for target, levels in report["targets"].items():
+        print(f"\n📊 {target}")
+        for concurrency, r in levels.items():
+            print(f"   concurrency {concurrency:>3}: {r['runs']} runs in {r['wall_seconds']:.2f}s  "
+                  f"{r['throughput_per_second']:.2f}/s  p50 {r['p50_seconds']:.2f}s  p95 {r['p95_seconds']:.2f}s  "
+                  f"max {r['max_seconds']:.2f}s")
+            for stage, s in r.get("stages", {}).items():
+                print(f"      {stage:<14} mean {s['mean_seconds']:.2f}s  p95 {s['p95_seconds']:.2f}s")
+    server = report["server"]
+    print(f"\n🗂️  {server['hits']} fixture hits, {server['misses']} misses ({server['fixtures']} fixtures)")
+
+
+async def run(args):
+    cache_dir = tempfile.mkdtemp(prefix="veritas-bench-")
+    server, base_url, counters = replay.start_server(args.fixtures, latency=dict(args.latency), jitter=args.jitter)
+    _configure_environment(base_url, cache_dir)
+    listings = read_listings(args.listings) if args.listings else DEFAULT_LISTINGS
+    _seed(listings)
+
+    report = {"listings": len(listings), "repeat": args.repeat, "latency": dict(args.latency), "targets": {}}
+    try:
+        for target in args.targets:
+            report["targets"][target] = {}
+            for concurrency in args.concurrency:
+                report["targets"][target][concurrency] = await BENCHMARKS[target](listings, concurrency, args.repeat)
+    finally:
+        server.shutdown()
+        import http_client
+        await http_client.aclose()
+        http_client.close()
+    report["server"] = dict(counters)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the verification pipeline on replayed fixtures")
+    parser.add_argument("fixtures", help="Directory recorded with VERITAS_RECORD_DIR")
+    parser.add_argument("--listings", help="JSONL/CSV listings (defaults to the sample listings)")
+    parser.add_argument("--concurrency", type=lambda v: [int(c) for c in v.split(",")], default=[1, 4, 8])
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per listing at each concurrency level")
+    parser.add_argument("--targets", type=lambda v: v.split(","), default=list(TARGETS))
+    parser.add_argument("--latency", type=replay.parse_latency, action="append", default=[],
+                        help="Injected latency per provider, e.g. firecrawl=1500 (repeatable)")
+    parser.add_argument("--jitter", type=float, default=0.2)
+    parser.add_argument("--json", help="Also write the report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
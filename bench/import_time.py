@@ -0,0 +1,95 @@
+"""
+Cold-start import cost of the pipeline entry points, from `python -X importtime`.
+
+    python -m bench.import_time                       # check_if_scammer, batch_check, verify_service
+    python -m bench.import_time check_if_scammer --runs 5 --compare HEAD~1
+
+Each module is imported in a fresh interpreter `--runs` times; the report shows the
+median cumulative import time, the slowest modules and which heavy provider
+libraries were imported at startup. `--compare REF` measures the same modules in a
+temporary git worktree of REF for a before/after view.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MODULES = ("check_if_scammer", "batch_check", "verify_service")
+# Libraries that should only be imported by the code path that uses them
+HEAVY_MODULES = ("browser_use", "openai", "pydantic", "playwright", "httpx", "dotenv")
+
+
+def import_profile(module, cwd=REPO_ROOT):
+    """
+    Import `module` once in a fresh interpreter.
+
+    Returns:
+        tuple: (cumulative microseconds, {imported module: self microseconds}, error text or None)
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=cwd, capture_output=True, text=True)
+    modules, total = {}, 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not self_us.isdigit():
+            continue  # header line
+        modules[name.strip()] = int(self_us)
+        if name.strip() == module:
+            total = int(cumulative_us)
+    error = None
+    if proc.returncode:
+        error = (proc.stderr.strip().splitlines() or ["import failed"])[-1]
+    return total, modules, error
+
+
+def measure(module, runs, cwd=REPO_ROOT):
+    totals, modules, error = [], {}, None
+    for _ in range(runs):
+        total, modules, error = import_profile(module, cwd)
+        totals.append(total)
+    heavy = sorted({name.split(".")[0] for name in modules if name.split(".")[0] in HEAVY_MODULES})
+    slowest = sorted(modules.items(), key=lambda kv: -kv[1])[:8]
+    return {"median_ms": statistics.median(totals) / 1000, "heavy": heavy, "slowest": slowest, "error": error}
+
+
+def print_measurement(label, module, m):
+    print(f"\n⏱️  {module} [{label}]: {m['median_ms']:.1f} ms")
+    if m["error"]:
+        print(f"   ⚠️ import failed: {m['error']}")
+    print(f"   heavy libraries at startup: {', '.join(m['heavy']) or 'none'}")
+    for name, us in m["slowest"]:
+        print(f"   {us / 1000:8.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure pipeline import time with python -X importtime")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--compare", metavar="REF", help="Also measure this git ref (e.g. HEAD~1)")
+    args = parser.parse_args()
+
+    baseline_dir = None
+    if args.compare:
+        baseline_dir = tempfile.mkdtemp(prefix="veritas-import-")
+        subprocess.run(["git", "worktree", "add", "--detach", baseline_dir, args.compare],
+                       cwd=REPO_ROOT, check=True, capture_output=True)
+    try:
+        for module in args.modules:
+            current = measure(module, args.runs)
+            print_measurement("working tree", module, current)
+            if baseline_dir:
+                before = measure(module, args.runs, cwd=baseline_dir)
+                print_measurement(args.compare, module, before)
+                print(f"   Δ {current['median_ms'] - before['median_ms']:+.1f} ms")
+    finally:
+        if baseline_dir:
+            subprocess.run(["git", "worktree", "remove", "--force", baseline_dir], cwd=REPO_ROOT, capture_output=True)
+
+
+if __name__ == "__main__":
+    main()
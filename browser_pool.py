@@ -0,0 +1,181 @@
+"""
+Warm pool of headless browsers shared by browser-use agents.
+
+Starting a browser is the slowest part of a recorder lookup, so agents lease an
+already-running browser instead of launching their own:
+
+    async with get_browser_pool().lease() as browser:
+        agent = Agent(task=task, llm=llm, browser=browser)
+        await agent.run()
+
+Browsers are health-checked before each lease and recycled after
+BROWSER_RECYCLE_AFTER tasks. A browser's connection belongs to the event loop that
+launched it, so each event loop (e.g. each `asyncio.run` of the CLI) gets its own
+browsers and lock. The size limit applies per event loop; the counters are process-wide.
+"""
+import asyncio
+import os
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+BROWSER_RECYCLE_AFTER = int(os.getenv("BROWSER_RECYCLE_AFTER", "20"))
+BROWSER_HEALTH_TIMEOUT = 5.0
+
+
+@dataclass
+class PooledBrowser:
+    browser: "Browser"  # browser_use.Browser
+    tasks: int = 0
+    generation: int = 0  # pool generation at launch; browsers from before a close() are not reused
+
+
+@dataclass
+class _LoopState:
+    """Browsers and wait condition of one event loop."""
+    cond: asyncio.Condition = field(default_factory=asyncio.Condition)
+    idle: list = field(default_factory=list)
+    size: int = 0
+    generation: int = 0
+
+
+class BrowserPool:
+    """
+    Bounded pool of long-lived `Browser` sessions.
+
+    Args:
+        max_size (int): Most browsers alive at once per event loop; further leases wait for a release
+        recycle_after (int): Close a browser after it has served this many tasks
+        **browser_kwargs: Passed to `Browser(...)` (headless defaults to True)
+    """
+
+    def __init__(self, max_size=BROWSER_POOL_SIZE, recycle_after=BROWSER_RECYCLE_AFTER, **browser_kwargs):
+        self.max_size = max_size
+        self.recycle_after = recycle_after
+        self.browser_kwargs = {"headless": True, **browser_kwargs}
+        self.launched = 0
+        self.recycled = 0
+        self.leases = 0
+        self._loops = weakref.WeakKeyDictionary()  # event loop -> _LoopState
+
+    def _state(self):
+        """State of the running event loop, created on first use (asyncio conditions are bound to their loop)."""
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = self._loops[loop] = _LoopState()
+        return state
+
+    async def _launch(self, generation):
+        from browser_use import Browser  # deferred: importing browser-use is slow
+        # keep_alive stops Agent.run() from closing the browser when the task ends
+        browser = Browser(keep_alive=True, **self.browser_kwargs)
+        await browser.start()
+        self.launched += 1
+        return PooledBrowser(browser, generation=generation)
+
+    async def _discard(self, pooled):
+        self.recycled += 1
+        try:
+            await pooled.browser.kill()
+        except Exception as e:
+            print(f"⚠️ Failed to close pooled browser: {e}")
+
+    async def _is_healthy(self, pooled):
+        try:
+            await asyncio.wait_for(pooled.browser.get_current_page_url(), BROWSER_HEALTH_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    async def acquire(self):
+        """Lease a healthy browser, launching one if the pool has room, otherwise waiting."""
+        state = self._state()
+        while True:
+            async with state.cond:
+                while not state.idle and state.size >= self.max_size:
+                    await state.cond.wait()
+                if state.idle:
+                    pooled = state.idle.pop()
+                else:
+                    pooled = None
+                    state.size += 1
+
+            if pooled is None:
+                try:
+                    pooled = await self._launch(state.generation)
+                except BaseException:
+                    async with state.cond:
+                        state.size -= 1
+                        state.cond.notify()
+                    raise
+            elif not await self._is_healthy(pooled):
+                await self._drop(state, pooled)
+                continue
+            self.leases += 1
+            return pooled
+
+    async def _drop(self, state, pooled):
+        await self._discard(pooled)
+        async with state.cond:
+            state.size -= 1
+            state.cond.notify()
+
+    async def release(self, pooled, healthy=True):
+        """Return a leased browser; it is closed instead when unhealthy, past its task budget or leased before close()."""
+        state = self._state()
+        pooled.tasks += 1
+        if not healthy or pooled.tasks >= self.recycle_after or pooled.generation != state.generation:
+            await self._drop(state, pooled)
+            return
+        async with state.cond:
+            state.idle.append(pooled)
+            state.cond.notify()
+
+    @asynccontextmanager
+    async def lease(self):
+        """Context manager yielding a pooled `Browser`; a failed task marks its browser unhealthy."""
+        pooled = await self.acquire()
+        healthy = False
+        try:
+            yield pooled.browser
+            healthy = True
+        finally:
+            await self.release(pooled, healthy=healthy)
+
+    async def close(self):
+        """
+        Close every idle browser of this event loop; browsers leased now are closed when released.
+
+        The pool stays usable: later leases launch fresh browsers.
+        """
+        state = self._state()
+        async with state.cond:
+            idle, state.idle = state.idle, []
+            state.size -= len(idle)
+            state.generation += 1
+        for pooled in idle:
+            await self._discard(pooled)
+
+    def stats(self):
+        states = list(self._loops.values())
+        return {
+            "size": sum(s.size for s in states),
+            "idle": sum(len(s.idle) for s in states),
+            "max_size": self.max_size,
+            "launched": self.launched,
+            "recycled": self.recycled,
+            "leases": self.leases,
+        }
+
+
+_pool = None
+
+
+def get_browser_pool():
+    """Return the process-wide headless browser pool."""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool()
+    return _pool
@@ -0,0 +1,133 @@
+"""
+Small persistent key/value cache on SQLite.
+
+Values are JSON-serialized and zlib-compressed. Every entry has its own TTL and the
+store is bounded by total compressed size, evicting least-recently-used entries
+first. Hit/miss/eviction counters are kept per store instance.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+import tracing
+
+CACHE_DIR = os.getenv("VERITAS_CACHE_DIR", ".cache")
+
+
+class CacheStore:
+    """
+    Persistent TTL + LRU cache stored in `<CACHE_DIR>/<name>.sqlite3`.
+
+    Args:
+        name (str): Store name, used as the database file name
+        max_bytes (int): Size cap for the compressed values; LRU entries are evicted above it
+        default_ttl (float): TTL in seconds for `set()` calls that don't pass one (None = never expires)
+        path (str): Explicit database path, overrides `name`
+    """
+
+    def __init__(self, name, max_bytes=256 * 1024 * 1024, default_ttl=None, path=None):
+        if path is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = os.path.join(CACHE_DIR, f"{name}.sqlite3")
+        self.name = name
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, created REAL, accessed REAL, expires REAL,"
+            " size INTEGER, value BLOB)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get_entry(self, key):
+        """
+        Look up an entry without applying its TTL.
+
+        Returns:
+            tuple | None: (value, expires_at) or None when the key is absent. `expires_at` is None
+            for entries that never expire.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return json.loads(zlib.decompress(row[0])), row[1]
+
+    def get(self, key, default=None):
+        """Return the cached value for `key`, or `default` when it is missing or expired."""
+        entry = self.get_entry(key)
+        if entry is None or (entry[1] is not None and entry[1] <= time.time()):
+            self.misses += 1
+            tracing.count(f"cache.{self.name}.miss")
+            return default
+        self.hits += 1
+        tracing.count(f"cache.{self.name}.hit")
+        return entry[0]
+
+    def set(self, key, value, ttl=None):
+        """Store `value` under `key`, expiring after `ttl` seconds (defaults to the store TTL)."""
+        ttl = self.default_ttl if ttl is None else ttl
+        blob = zlib.compress(json.dumps(value).encode("utf-8"))
+        now = time.time()
+        expires = now + ttl if ttl is not None else None
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, created, accessed, expires, size, value) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, now, now, expires, len(blob), blob),
+            )
+            self._size += len(blob) - (old[0] if old else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def delete(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._size -= row[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._size = 0
+
+    def _evict(self):
+        # Drop expired entries first, then least-recently-used ones down to 90% of the cap
+        self._conn.execute("DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        target = self.max_bytes * 0.9
+        rows = self._conn.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall()
+        for key, size in rows:
+            if self._size <= target:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._size -= size
+            self.evictions += 1
+
+    def stats(self):
+        """Counters and size for this store."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "entries": entries,
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
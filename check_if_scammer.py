@@ -1,67 +1,113 @@
 from Kamthe.GoogleSearch import search_and_analyze_landlord
 from openai_websearch import get_block_number
 from property_search import get_owner_name
-from Kamthe.SerperAPICall import search_google
+from Kamthe.SerperAPICall import search_google_async
+from address import parse_address
+from name_match import best_match, name_key, names_match
 import asyncio 
 from zillow import analyze_zillow
+from pipeline import Stage, run_stages
+from browser_pool import get_browser_pool
+import http_client
+import recorder_scraper
+import tracing
+from results import CheckResult
+from risk_scoring import FULL_AUDIT, RiskScorer, rent_flag
+from rent_extractor import parse_reported_rent
+from renderers import print_stage, render_verdicts, print_timings
 
 def are_names_similar(name, potential_name):
-    potential_name_words = potential_name.lower().split(' ')
-    name_words = name.lower().split(' ')
-    for w in name_words:
-        if w in potential_name_words:
-            return True
-    return False
+    """Whether two names refer to the same person or entity (see name_match.py)."""
+    return names_match(name, potential_name)
+
+def build_stages(name, address):
+    """Stage DAG for one check: web reputation, Zillow rent, and block/lot → recorder run as independent branches."""
+    # Stage keys and provider queries use the canonical address, so variants of one address share work
+    canonical = parse_address(address)
+    address_key = canonical.key
+    person_key = f"{name_key(name)}|{address_key}"
+
+    def web_search(_):
+        return search_and_analyze_landlord(name, canonical.display, f"{name} {canonical.display}")
+
+    async def zillow_search(_):
+        return await search_google_async(f"{canonical.display} zillow")
+
+    def zillow_rent(deps):
+        return analyze_zillow(deps['zillow_search'], canonical.display)
+
+    def block_lot(_):
+        return get_block_number(address)
+
+    async def owners(deps):
+        block_details = deps['block_lot']
+        return await get_owner_name(block_number=block_details.block_number, lot_number=block_details.lot_number)
+
+    return [
+        Stage('web_search', web_search, key=person_key),
+        Stage('zillow_search', zillow_search, key=address_key),
+        Stage('zillow_rent', zillow_rent, deps=('zillow_search',), key=address_key),
+        Stage('block_lot', block_lot, key=address_key),
+        Stage('owners', owners, deps=('block_lot',), key=address_key),
+    ]
                 
-async def check_if_scammer(name, address,listing_url, other_details, **kwargs):
-    print(f"🔎 Searching Online")
-    query = f"{name} {address}"
-    google_results = search_and_analyze_landlord(name, address, query)
-    
-    # zillow search
-    zillow_results = search_google(f"{address} zillow")
-    zillow_rent_amount = analyze_zillow(zillow_results)
-    if zillow_rent_amount:
-        reported_rent_amount = 2*1550
-        if zillow_rent_amount > 1.2*reported_rent_amount:
-            print(f"🚩🚩🚩 RED FLAG ALERT: Zillow amount is {zillow_rent_amount}, much higher than reported rent amount {reported_rent_amount} 🚩🚩🚩")
-    
-    print(f"📜🏠 Checking San Francisco Planning Department records")
-    block_details = get_block_number(address)
-    print(f"📋 Found tax block number '{block_details.block_number}', Lot number '{block_details.lot_number}'")
-    print(f"🧭 Finding owner details from County of San Francisco Assessor-Recorder Public Index Search")
-    print("<display browser use agent recorded video>")
-    potential_owner_names = await get_owner_name(block_number=block_details.block_number, lot_number=block_details.lot_number)
-    print(f"🪪 Found previous owner names {', '.join(potential_owner_names)}")
-    flag = False
-    matched_name = None
-    for potential_owner in potential_owner_names:
-        if are_names_similar(name, potential_owner):
-            flag=True
-            matched_name = potential_owner
-            break
-    
-    if not flag:
-        print(f"🚩🚩🚩 RED FLAG ALERT: Declared owner does not match owner names in county records!! 🚩🚩🚩")
-    else:
-        print(f"✅ Declared name '{name}' matches with country record name '{matched_name}'")
+async def check_if_scammer(name, address,listing_url, other_details, shared=None, on_stage=None,
+                           reported_rent=None, full_audit=FULL_AUDIT, **kwargs):
+    """
+    Run the verification stages for one listing.
+
+    `shared` is an optional memo dict reused across concurrent checks (see batch_check.py)
+    so stages for the same address or name+address run only once. `on_stage(name, result, timing)`
+    is called as each stage completes (e.g. renderers.print_stage, verify_service.py).
+
+    Stage results feed a running risk score (risk_scoring.py); once it is decisively scam or
+    clear the unfinished stages are skipped. `full_audit=True` (or FULL_AUDIT=1) runs every stage.
+
+    `reported_rent` is the listing's monthly rent; when it is not given it is read from
+    `other_details` ("Rent: $2,400", "$2,400/mo"). Without a rent the Zillow rent is shown
+    but not scored.
+
+    Returns:
+        CheckResult: Findings of every stage that ran; nothing is printed (see renderers.py)
+    """
+    if reported_rent is None:
+        reported_rent = parse_reported_rent(other_details)
+    scorer = RiskScorer(name, reported_rent)
+
+    def stop_when(stage, stage_result):
+        # A full audit still scores every stage, it just never stops early
+        return scorer.update(stage, stage_result) and not full_audit
+
+    with tracing.span("check", kind="check", landlord=name, address=address):
+        run = await run_stages(build_stages(name, address), memo=shared, on_stage=on_stage, stop_when=stop_when)
+        tracing.set_attributes(risk_score=round(scorer.score, 3), verdict=scorer.verdict,
+                               skipped=sorted(run.skipped))
+    block_details = run.results.get('block_lot')
+    result = CheckResult(
+        name=name,
+        address=address,
+        listing_url=listing_url,
+        landlord=run.results.get('web_search'),
+        zillow=run.results.get('zillow_rent'),
+        reported_rent_usd=reported_rent,
+        block_number=block_details.block_number if block_details else None,
+        lot_number=block_details.lot_number if block_details else None,
+        owners=list(run.results.get('owners') or ()),
+        timings={stage: round(t.duration, 3) for stage, t in run.timings.items()},
+        shared_stages=sorted(run.shared),
+        skipped_stages=sorted(run.skipped),
+        risk_score=round(scorer.score, 3),
+        verdict=scorer.verdict,
+        risk_reasons=scorer.reasons,
+        total_seconds=round(run.total, 3),
+    )
+
+    result.zillow_rent_flag = rent_flag(result.zillow, reported_rent)
     
-    print("====== SUMMARY =====")
-    if google_results['green_flag']:
-        print(f"🟢 Found the following green flags from search results: 🟢")
-        for k,v in google_results['green_flag'].items():
-            print(f"🟢 Proof of {k}")
-            for source in v:
-                print(f"- {source['title']}")
-                print(f"- 🔗 {source['link']}")
-    if google_results['red_flag']:
-        print(f"🚩🚩🚩 RED FLAGS: Found the following green flags from search results: 🚩🚩🚩")
-        for k,v in google_results['red_fl~ag'].items():
-            print(f"🚩 Contradictory proof found for {k}")
-            for source in v:
-                print(f"- {source['title']}")
-                print(f"- 🔗 {source['link']}")
-        
+    match = best_match(name, result.owners)
+    if match:
+        result.owner_match, result.owner_match_score = match.name, match.score
+    return result
     
     
 async def main():
@@ -73,7 +119,15 @@ async def main():
     address = "88 King Street, San Francisco, 94107"
     listing_url = ""
     other_details = ""
-    result = await check_if_scammer(name, address, listing_url, other_details)
+    try:
+        result = await check_if_scammer(name, address, listing_url, other_details, on_stage=print_stage,
+                                        reported_rent=2*1550)
+        render_verdicts(result)
+        print_timings(result)
+    finally:
+        await get_browser_pool().close()
+        await recorder_scraper.close()
+        await http_client.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+"""
+Prompt windows for scraped pages.
+
+Instead of sending the first 3,000 characters of a Firecrawl page to the LLM, strip
+navigation, link lists and footers from the markdown, split it into passages and keep
+the passages that mention the landlord, the address or a price, within a token budget.
+"""
+import os
+import re
+
+from address import parse_address
+from relevance import name_tokens
+
+CONTENT_TOKEN_BUDGET = int(os.getenv("CONTENT_TOKEN_BUDGET", "750"))
+CHARS_PER_TOKEN = 4
+MAX_PASSAGE_CHARS = 600
+
+_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_BARE_URL_RE = re.compile(r"https?://\S+")
+_FOOTER_RE = re.compile(r"^(#+\s*)?(footer|©|copyright|privacy policy|terms of (use|service)|cookie)", re.IGNORECASE)
+_PRICE_RE = re.compile(r"\$\s?\d[\d,]*")
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def _is_link_line(line):
+    """Lines that are only links (nav bars, link lists, image embeds)."""
+    without_links = _LINK_RE.sub("", line)
+    without_links = _BARE_URL_RE.sub("", without_links)
+    return bool(_LINK_RE.search(line) or _BARE_URL_RE.search(line)) and len(re.sub(r"[\W_]", "", without_links)) < 3
+
+
+def strip_boilerplate(markdown):
+    """Drop link-only lines, footers and repeated short lines; turn remaining links into their text."""
+    kept, seen_short = [], set()
+    lines = (markdown or "").splitlines()
+    for n, line in enumerate(lines):
+        stripped = line.strip()
+        if _FOOTER_RE.match(stripped.lstrip("*-_ ")):
+            if n > len(lines) // 2:
+                break  # a footer marker in the second half ends the content
+            continue
+        if _is_link_line(stripped):
+            continue
+        stripped = _BARE_URL_RE.sub("", _LINK_RE.sub(r"\1", stripped)).strip()
+        if stripped and len(stripped) < 40:
+            # Short repeated lines are menu items / buttons; blank lines separate passages and stay
+            if stripped.lower() in seen_short:
+                continue
+            seen_short.add(stripped.lower())
+        kept.append(stripped)
+    return "\n".join(kept)
+
+
+def split_passages(text):
+    """Split text into passages on blank lines and headings, capping passage length."""
+    passages, current = [], []
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            if current:
+                passages.append(" ".join(current))
+            current = [line] if line else []
+            continue
+        current.append(line)
+    if current:
+        passages.append(" ".join(current))
+
+    capped = []
+    for p in passages:
+        while len(p) > MAX_PASSAGE_CHARS:
+            cut = p.rfind(". ", 0, MAX_PASSAGE_CHARS)
+            cut = cut + 1 if cut > MAX_PASSAGE_CHARS // 2 else MAX_PASSAGE_CHARS
+            capped.append(p[:cut].strip())
+            p = p[cut:].strip()
+        if p.strip():
+            capped.append(p.strip())
+    return capped
+
+
+def select_passages(text, keywords, prices=False, token_budget=CONTENT_TOKEN_BUDGET):
+    """
+    Keep the highest-scoring passages of `text` that fit in `token_budget`.
+
+    Passages score one point per distinct keyword they contain, plus one when `prices`
+    is set and they mention a dollar amount. Chosen passages are returned in page order;
+    when nothing scores, the start of the page is used.
+    """
+    budget = token_budget * CHARS_PER_TOKEN
+    passages = split_passages(strip_boilerplate(text))
+    scored = []
+    for i, p in enumerate(passages):
+        words = set(_WORD_RE.findall(p.lower()))
+        score = len(keywords & words) + (1 if prices and _PRICE_RE.search(p) else 0)
+        scored.append((score, i, p))
+
+    if not any(score for score, _, _ in scored):
+        ranked = [(0, i, p) for i, p in enumerate(passages)]
+    else:
+        ranked = sorted((s for s in scored if s[0] > 0), key=lambda s: (-s[0], s[1]))
+
+    chosen, used = [], 0
+    for _, i, p in ranked:
+        if used + len(p) > budget:
+            continue
+        chosen.append((i, p))
+        used += len(p) + 5
+    if not chosen and passages:
+        chosen = [(0, passages[0][:budget])]
+    return "\n...\n".join(p for _, p in sorted(chosen))
+
+
+def _address_keywords(address):
+    parsed = parse_address(address)
+    return {w for w in (parsed.number, parsed.unit, parsed.zip, *parsed.street.split()) if w} - {"street", "avenue"}
+
+
+def landlord_window(content, name, address, token_budget=CONTENT_TOKEN_BUDGET):
+    """Passages of a landlord search-result page that mention the name or address."""
+    return select_passages(content, name_tokens(name) | _address_keywords(address), token_budget=token_budget)
+
+
+def rent_window(content, address="", token_budget=CONTENT_TOKEN_BUDGET):
+    """Passages of a Zillow page that mention prices, rent or the address."""
+    keywords = {"rent", "mo", "month", "monthly", "available", "bed", "beds"} | _address_keywords(address)
+    return select_passages(content, keywords, prices=True, token_budget=token_budget)
@@ -1,17 +1,16 @@
-from browser_use import Agent, ChatOpenAI, Browser
-from dotenv import load_dotenv
 import asyncio
 import os 
+from browser_pool import get_browser_pool
+import providers
 
-load_dotenv()
+providers.load_env()
 os.environ['ANONYMIZED_TELEMETRY'] = "false"
 
-fb_user = os.environ['FB_EMAIL']
-fb_password = os.environ['FB_PASSWORD']
-
 async def main():
-    
-    company_credentials = {'x_user': fb_user, 'x_pass': fb_password}
+    # Credentials are read when the search runs, so importing this module never fails
+    if not os.getenv("FB_EMAIL") or not os.getenv("FB_PASSWORD"):
+        raise SystemExit("❌ Set FB_EMAIL and FB_PASSWORD to run the Facebook search")
+    from browser_use import Agent, ChatOpenAI
     llm = ChatOpenAI(model="gpt-4.1")
     task = "Go to this url https://www.facebook.com/groups/746424749257725/user/100066500240746 and find the user's name. Use login credentials x_user for email and x_pass for password"
     company_credentials = {'x_user': os.getenv("FB_EMAIL"), 'x_pass': os.getenv("FB_PASSWORD")}
@@ -20,8 +19,9 @@ async def main():
     # user_data_dir='~/Library/Application Support/Google/Chrome',
     # profile_directory='Advaith',
     # )
-    agent = Agent(task=task, llm=llm, sensitive_data=company_credentials)
-    await agent.run()
+    async with get_browser_pool().lease() as browser:
+        agent = Agent(task=task, llm=llm, sensitive_data=company_credentials, browser=browser)
+        await agent.run()
 
 if __name__ == "__main__":
     asyncio.run(main())
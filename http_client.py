@@ -0,0 +1,156 @@
+"""
+Shared HTTP transport for the Serper, Firecrawl and OpenRouter callers.
+
+One process-wide `requests.Session` keeps a keep-alive connection pool per host,
+so repeat calls to the same provider reuse the TLS connection instead of paying a
+new handshake. Calls made for a provider go through its rate limit, retry policy
+and circuit breaker (see rate_limit.py) and are saved as replay fixtures when
+VERITAS_RECORD_DIR is set (see replay.py). Set HTTP2=1 to route sync and async
+calls through httpx with HTTP/2 (needs `pip install "httpx[http2]"`).
+"""
+import asyncio
+import os
+import threading
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import rate_limit
+import replay
+import tracing
+
+POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))  # number of hosts kept pooled
+POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))  # keep-alive connections per host
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "60"))
+HTTP2 = os.getenv("HTTP2", "0") == "1"
+
+_lock = threading.Lock()
+_session = None
+_httpx_client = None
+_async_clients = weakref.WeakKeyDictionary()  # event loop -> httpx.AsyncClient
+
+
+def get_session():
+    """Return the shared, pooled `requests.Session`."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def _httpx_limits(httpx):
+    return httpx.Limits(max_connections=POOL_CONNECTIONS * POOL_MAXSIZE,
+                        max_keepalive_connections=POOL_MAXSIZE)
+
+
+def _get_httpx_client():
+    global _httpx_client
+    if _httpx_client is None:
+        import httpx
+        with _lock:
+            if _httpx_client is None:
+                _httpx_client = httpx.Client(http2=True, limits=_httpx_limits(httpx), timeout=HTTP_TIMEOUT)
+    return _httpx_client
+
+
+def _trace_response(response):
+    """Status and body sizes of a requests/httpx response on the current span."""
+    if tracing.current_span() is None:
+        return
+    request = response.request
+    body = getattr(request, "body", None) or getattr(request, "content", None) or b""
+    tracing.set_attributes(status=response.status_code, request_bytes=len(body), response_bytes=len(response.content))
+
+
+def post_json(url, payload, headers=None, timeout=HTTP_TIMEOUT, provider=None):
+    """
+    POST a JSON body over the shared connection pool.
+
+    Args:
+        url (str): Endpoint URL
+        payload (dict): JSON-serializable request body
+        headers (dict): Extra request headers
+        timeout (float): Request timeout in seconds
+        provider (str): Provider whose rate limit, retries and circuit breaker apply (see rate_limit.py)
+
+    Returns:
+        Response object exposing `status_code`, `headers`, `content`, `json()` and `raise_for_status()`
+
+    Raises:
+        rate_limit.CircuitOpenError: When the provider's circuit is open
+    """
+    def send():
+        with tracing.span(provider or "http", kind="client", provider=provider or "http", url=url):
+            if HTTP2:
+                response = _get_httpx_client().post(url, json=payload, headers=headers, timeout=timeout)
+            else:
+                response = get_session().post(url, json=payload, headers=headers, timeout=timeout)
+            _trace_response(response)
+            if replay.RECORD_DIR and provider:
+                replay.record(provider, url, payload, response)
+            return response
+
+    if provider:
+        return rate_limit.call(provider, send)
+    return send()
+
+
+def get_async_client():
+    """Return the pooled `httpx.AsyncClient` bound to the running event loop."""
+    import httpx
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(http2=HTTP2, limits=_httpx_limits(httpx), timeout=HTTP_TIMEOUT)
+        _async_clients[loop] = client
+    return client
+
+
+async def apost_json(url, payload, headers=None, timeout=HTTP_TIMEOUT, provider=None):
+    """
+    Async variant of `post_json`.
+
+    Uses httpx when it is installed and falls back to the pooled sync session on a
+    worker thread otherwise.
+    """
+    try:
+        client = get_async_client()
+    except ImportError:
+        return await asyncio.to_thread(post_json, url, payload, headers, timeout, provider)
+    async def send():
+        with tracing.span(provider or "http", kind="client", provider=provider or "http", url=url):
+            response = await client.post(url, json=payload, headers=headers, timeout=timeout)
+            _trace_response(response)
+            if replay.RECORD_DIR and provider:
+                replay.record(provider, url, payload, response)
+            return response
+
+    if provider:
+        return await rate_limit.call_async(provider, send)
+    return await send()
+
+
+async def aclose():
+    """Close the async client bound to the running event loop."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def close():
+    """Close the shared sync connection pools."""
+    global _session, _httpx_client
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+        if _httpx_client is not None:
+            _httpx_client.close()
+            _httpx_client = None
@@ -0,0 +1,81 @@
+"""
+Disk cache for deterministic LLM calls.
+
+Responses are keyed by a hash of the full request (model, messages, temperature,
+response schema, ...) and stored in a size-bounded CacheStore with LRU eviction.
+LLM_CACHE=0 bypasses it everywhere; `use_cache=False` bypasses it for one call.
+Hit/miss counters are kept per call site.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict
+
+from cache_store import CacheStore
+import tracing
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE", "1") != "0"
+LLM_CACHE_MAX_MB = int(os.getenv("LLM_CACHE_MAX_MB", "128"))
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(30 * 24 * 3600)))
+
+_store = None
+_lock = threading.Lock()
+_metrics = defaultdict(lambda: {"hits": 0, "misses": 0, "bypassed": 0})
+
+
+def _get_store():
+    global _store
+    with _lock:
+        if _store is None:
+            _store = CacheStore("llm_responses", max_bytes=LLM_CACHE_MAX_MB * 1024 * 1024, default_ttl=LLM_CACHE_TTL)
+    return _store
+
+
+def request_key(request):
+    """Stable hash of an LLM request (any JSON-serializable dict)."""
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def cached_call(call_site, request, call, use_cache=None, provider=None):
+    """
+    Return the cached response for `request`, or run `call()` and cache its result.
+
+    Args:
+        call_site (str): Name used for per-call-site metrics, e.g. "analyze_landlord"
+        request (dict): Everything that determines the response (model, messages, temperature, schema...)
+        call (callable): Makes the real LLM call; must return a JSON-serializable value
+        use_cache (bool): Override LLM_CACHE for this call
+        provider (str): Provider name recorded on the trace span
+
+    Returns:
+        The (possibly cached) response value
+    """
+    use_cache = LLM_CACHE_ENABLED if use_cache is None else use_cache
+    with tracing.span(f"llm:{call_site}", kind="llm", call_site=call_site, provider=provider or call_site):
+        if not use_cache:
+            _metrics[call_site]["bypassed"] += 1
+            tracing.set_attributes(cache="bypass")
+            return call()
+
+        key = f"{call_site}:{request_key(request)}"
+        cached = _get_store().get(key)
+        if cached is not None:
+            _metrics[call_site]["hits"] += 1
+            tracing.set_attributes(cache="hit")
+            return cached
+        _metrics[call_site]["misses"] += 1
+        tracing.set_attributes(cache="miss")
+        value = call()
+        _get_store().set(key, value)
+        return value
+
+
+def stats():
+    """Per-call-site hit/miss/bypass counters and hit rates."""
+    out = {}
+    for call_site, m in _metrics.items():
+        lookups = m["hits"] + m["misses"]
+        out[call_site] = {**m, "hit_rate": m["hits"] / lookups if lookups else 0.0}
+    return out
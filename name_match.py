@@ -0,0 +1,223 @@
+"""
+Fuzzy person/entity name matching for owner checks.
+
+Names are parsed once (memoized) into full-word tokens, initials and Soundex keys.
+Recorder-style decorations are dropped: "(E)"/"(R)" party prefixes, "LAST, FIRST"
+order, honorifics and generational suffixes, and entity words (LLC, INC, TRUST,
+TRUSTEE, REVOCABLE, ...), so "SMITH MARY J TR" and "Mary J. Smith" compare equal
+while the owner is still flagged as an entity. `name_key` (dedup and memo keys) keeps
+suffixes and entity words, so "John Smith Jr" and "Smith Holdings LLC" get keys of their own.
+
+Two names score by how much of each side the other covers (harmonic mean): full
+tokens match exactly, by Soundex + spelling similarity, or by a close typo; initials
+count half and match a token with the same first letter. "Mary J. Smith" therefore no
+longer matches every owner called "Mary".
+
+`NameIndex` is an inverted index (token and Soundex key -> names) for screening
+against many owner or known-scammer names: a query only scores the names sharing a
+token or sound with it.
+"""
+import difflib
+import heapq
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional
+
+# Score at or above which two names are considered the same party
+MATCH_THRESHOLD = 0.8
+# Candidates scored per requested result, chosen by the number of shared tokens
+CANDIDATES_PER_RESULT = 20
+
+_PARTY_PREFIX_RE = re.compile(r"^\s*\((?:e|r)\)\s*", re.IGNORECASE)
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_HONORIFICS = {"mr", "mrs", "ms", "miss", "dr", "jr", "sr", "ii", "iii", "iv", "esq", "md", "phd"}
+ENTITY_WORDS = {
+    "llc", "inc", "corp", "corporation", "co", "company", "lp", "llp", "ltd", "trust", "trustee", "trustees",
+    "tr", "ttee", "revocable", "irrevocable", "living", "family", "estate", "partners", "partnership",
+    "properties", "holdings", "investments", "the", "of", "et", "al", "etal", "etux", "ux", "and",
+}
+_WEAK_ENTITY_WORDS = {"the", "of", "and", "et", "al", "etal", "etux", "ux"}  # not enough to call a name an entity
+_SOUNDEX_CODES = {c: str(d) for d, letters in enumerate(("aeiouyhw", "bfpv", "cgjkqsxz", "dt", "l", "mn", "r"))
+                  for c in letters}
+
+
+def soundex(word):
+    """American Soundex code of a word ("robert" -> "r163")."""
+    word = "".join(c for c in word.lower() if c.isalpha())
+    if not word:
+        return ""
+    code, last = word[0], _SOUNDEX_CODES.get(word[0], "")
+    for c in word[1:]:
+        digit = _SOUNDEX_CODES.get(c, "")
+        if digit != last and digit != "0":
+            code += digit
+        if c not in "hw":  # h/w do not separate equal codes
+            last = digit
+    return (code + "000")[:4]
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedName:
+    """
+    Normalized name: full-word tokens, single-letter initials, Soundex keys and entity flag.
+
+    `qualifiers` holds the honorifics, generational suffixes and entity words that scoring
+    ignores; they still tell parties apart in `key`.
+    """
+    text: str
+    tokens: tuple
+    initials: tuple
+    sounds: tuple
+    is_entity: bool
+    qualifiers: tuple = ()
+
+    @property
+    def key(self):
+        """
+        Order-independent identity key: "Smith, Mary J." and "Mary J Smith" -> "mary smith j",
+        while "John Smith Jr" / "John Smith Sr" and "Smith Holdings LLC" / "Smith Family Trust" stay apart.
+        """
+        return " ".join(sorted(self.tokens) + sorted(self.initials) + sorted(self.qualifiers))
+
+
+@lru_cache(maxsize=65536)
+def parse_name(name):
+    """Parse a person or entity name (memoized)."""
+    text = _PARTY_PREFIX_RE.sub("", name or "")
+    words = _WORD_RE.findall(text.lower().replace("'", ""))
+    is_entity = any(w in ENTITY_WORDS and w not in _WEAK_ENTITY_WORDS for w in words)
+    qualifiers = tuple(w for w in words if (w in _HONORIFICS or w in ENTITY_WORDS) and w not in _WEAK_ENTITY_WORDS)
+    words = [w for w in words if w not in _HONORIFICS and w not in ENTITY_WORDS]
+    tokens = tuple(w for w in words if len(w) > 1)
+    initials = tuple(w for w in words if len(w) == 1 and w.isalpha())
+    return ParsedName(name or "", tokens, initials, tuple(soundex(t) for t in tokens), is_entity, qualifiers)
+
+
+def name_key(name):
+    """
+    Canonical order-independent key of a name, for caches, memo keys and dedup.
+
+    Unlike scoring it keeps suffixes and entity words, so it never merges distinct parties.
+    """
+    return parse_name(name).key
+
+
+@lru_cache(maxsize=262144)
+def _token_similarity(a, a_sound, b, b_sound):
+    if a == b:
+        return 1.0
+    # Cheap rejects before difflib: very different lengths, or different sound and first letter
+    if 2 * min(len(a), len(b)) < 0.75 * (len(a) + len(b)) or (a_sound != b_sound and a[0] != b[0]):
+        return 0.0
+    ratio = difflib.SequenceMatcher(None, a, b).ratio()
+    if a_sound == b_sound and ratio >= 0.75:
+        return max(ratio, 0.85)
+    return ratio if ratio >= 0.88 else 0.0
+
+
+def _coverage(side, other):
+    """Weighted share of `side`'s tokens and initials matched by `other` (initials weigh 0.5)."""
+    total = matched = 0.0
+    for token, sound in zip(side.tokens, side.sounds):
+        total += 1.0
+        best = max((_token_similarity(token, sound, t, s) for t, s in zip(other.tokens, other.sounds)), default=0.0)
+        if best < 1.0 and token[0] in other.initials:
+            best = max(best, 0.5)
+        matched += best
+    for initial in side.initials:
+        total += 0.5
+        if initial in other.initials or any(t[0] == initial for t in other.tokens):
+            matched += 0.5
+    return matched / total if total else 0.0
+
+
+def score_names(a, b):
+    """
+    Similarity of two names, 0-1.
+
+    Args:
+        a, b (str | ParsedName): Names to compare
+
+    Returns:
+        float: Harmonic mean of how much of each name the other covers
+    """
+    a = parse_name(a) if isinstance(a, str) else a
+    b = parse_name(b) if isinstance(b, str) else b
+    if not a.tokens or not b.tokens:
+        return 0.0
+    forward, backward = _coverage(a, b), _coverage(b, a)
+    if not forward or not backward:
+        return 0.0
+    return 2 * forward * backward / (forward + backward)
+
+
+def names_match(a, b, threshold=MATCH_THRESHOLD):
+    return score_names(a, b) >= threshold
+
+
+@dataclass(slots=True)
+class NameMatch:
+    """One scored candidate returned by `NameIndex.search`."""
+    name: str
+    score: float
+    is_entity: bool
+    payload: object = None
+
+
+class NameIndex:
+    """Inverted index over names (tokens and Soundex keys) with scored lookup."""
+
+    def __init__(self, names=()):
+        self._names = []  # (ParsedName, payload)
+        self._postings = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self):
+        return len(self._names)
+
+    def add(self, name, payload=None):
+        """Index a name; `payload` is returned with its matches (e.g. a source record)."""
+        parsed = parse_name(name)
+        i = len(self._names)
+        self._names.append((parsed, payload))
+        for key in set(parsed.tokens) | {f"~{s}" for s in parsed.sounds}:
+            self._postings.setdefault(key, set()).add(i)
+        return i
+
+    def _candidates(self, parsed, threshold, limit):
+        """Ids sharing the most query tokens; only these are scored."""
+        hits = Counter()
+        for token, sound in zip(parsed.tokens, parsed.sounds):
+            hits.update(self._postings.get(token, set()) | self._postings.get(f"~{sound}", set()))
+        # A name sharing h of n tokens covers at most h/n of the query, and the harmonic
+        # mean with 1.0 on the other side reaches `threshold` only if h/n >= t / (2 - t)
+        min_hits = max(1, math.ceil(len(parsed.tokens) * threshold / (2 - threshold) - 1e-9))
+        ranked = [(h, i) for i, h in hits.items() if h >= min_hits]
+        if len(ranked) > limit * CANDIDATES_PER_RESULT:
+            ranked = heapq.nlargest(limit * CANDIDATES_PER_RESULT, ranked)
+        return [i for _, i in ranked]
+
+    def search(self, name, limit=5, threshold=0.0) -> List[NameMatch]:
+        """Best-scoring indexed names for `name`, highest first."""
+        parsed = parse_name(name)
+        matches = []
+        for i in self._candidates(parsed, threshold, limit):
+            candidate, payload = self._names[i]
+            score = score_names(parsed, candidate)
+            if score >= threshold and score > 0:
+                matches.append(NameMatch(candidate.text, round(score, 3), candidate.is_entity, payload))
+        matches.sort(key=lambda m: -m.score)
+        return matches[:limit]
+
+    def best(self, name, threshold=MATCH_THRESHOLD) -> Optional[NameMatch]:
+        matches = self.search(name, limit=1, threshold=threshold)
+        return matches[0] if matches else None
+
+
+def best_match(name, candidates, threshold=MATCH_THRESHOLD):
+    """Best of `candidates` (e.g. one parcel's owner names) matching `name`, or None."""
+    return NameIndex(candidates).best(name, threshold)
@@ -1,31 +1,68 @@
-import asyncio
-from openai import OpenAI
-from dotenv import load_dotenv
-from pydantic import BaseModel
-load_dotenv()
-
-client = OpenAI()
-
-class HouseID(BaseModel):
-    block_number: str
-    lot_number: str
-    
+from functools import lru_cache
+from parcel_index import get_parcel_index
+from address import parse_address
+from single_flight import get_group
+from results import BlockLot
+import providers
+import rate_limit
+import llm_cache
+import tracing
+
+
+@lru_cache(maxsize=None)
+def house_id_model():
+    """Structured-output model of the GPT-5 answer (pydantic is only imported on a parcel-index miss)."""
+    from pydantic import BaseModel
+
+    class HouseID(BaseModel):
+        block_number: str
+        lot_number: str
+    return HouseID
+
 def get_block_number(address):
-    response = client.responses.parse(
-    model="gpt-5",
-    input=f"Find the block number and lot number for this SF apartment address: {address}. Return them exactly as found (including leading zeros)",
-    tools=[
-        {
-            "type": "web_search"
-        }
-    ],
-    text_format=HouseID,
-    )
-
-    result = response.output_parsed
-    if result.block_number and result.lot_number:
-        return result
-    raise Exception("Could not find block or lot number :(")
+    """
+    Block/lot for an SF address: local parcel index first, GPT-5 web search only on a miss.
+
+    Returns:
+        BlockLot: Block and lot numbers as found (including leading zeros)
+    """
+    hit = get_parcel_index().lookup(address)
+    if hit:
+        return BlockLot(block_number=hit["block_number"], lot_number=hit["lot_number"])
+    # Concurrent checks for the same address share one GPT-5 web search
+    canonical = parse_address(address)
+    return get_group("block_lot").do(canonical.key, lambda: _search_block_number(address, canonical.display))
+
+
+def _search_block_number(address, display):
+    request = {
+        "model": "gpt-5",
+        "input": f"Find the block number and lot number for this SF apartment address: {display}. Return them exactly as found (including leading zeros)",
+        "tools": [
+            {
+                "type": "web_search"
+            }
+        ],
+    }
+
+    HouseID = house_id_model()
+
+    def call():
+        def send():
+            with tracing.span("openai", kind="client", provider="openai"):
+                return providers.get("openai").responses.parse(**request, text_format=HouseID)
+        response = rate_limit.call("openai", send)
+        tracing.record_usage(response.usage)
+        result = response.output_parsed
+        if result.block_number and result.lot_number:
+            return result.model_dump()
+        # Raising keeps failed lookups out of the LLM cache
+        raise Exception("Could not find block or lot number :(")
+
+    cache_request = {**request, "schema": HouseID.model_json_schema()}
+    result = BlockLot(**llm_cache.cached_call("get_block_number", cache_request, call, provider="openai"))
+    get_parcel_index().add(address, result.block_number, result.lot_number, source="web_search")
+    return result
 
 # Run the async function
 if __name__ == "__main__":
@@ -0,0 +1,216 @@
+"""
+Local address -> (block, lot) index for San Francisco parcels.
+
+Load it in bulk from a parcel CSV or GeoJSON dump (e.g. DataSF "Parcels - Active and
+Retired" or the Enterprise Addressing System export):
+
+    python parcel_index.py load parcels.csv
+    python parcel_index.py lookup "88 King Street, unit 116, San Francisco 94107"
+
+`openai_websearch.get_block_number` consults it before falling back to the GPT-5 web
+search, and writes web-search answers back into it.
+
+Rows are keyed by `address.Address.key`. An index written before that key format
+(KEY_VERSION) is re-keyed from its stored street number/street/unit/zip when opened.
+"""
+import argparse
+import csv
+import difflib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import replace
+
+from address import parse_address
+from cache_store import CACHE_DIR
+
+PARCEL_INDEX_PATH = os.getenv("PARCEL_INDEX_PATH", os.path.join(CACHE_DIR, "parcel_index.sqlite3"))
+FUZZY_CUTOFF = 0.85
+# Version of the address_key format (PRAGMA user_version); older indexes are re-keyed on open.
+# 1: keys are address.Address.key (directions and comma-less city names handled by address.py)
+# 2: post-directionals ("Ave NW") are part of the street; rows that lost one to the city
+#    under version 1 only get it back when their source dump is loaded again
+KEY_VERSION = 2
+
+# Accepted column names (lower-cased, spaces -> underscores) in parcel dumps
+_ADDRESS_COLS = ("address", "full_address", "address_full", "property_location")
+_NUMBER_COLS = ("from_address_num", "address_number", "street_number", "from_st")
+_STREET_COLS = ("street_name", "street")
+_STREET_TYPE_COLS = ("street_type", "street_suffix")
+_UNIT_COLS = ("unit", "unit_number", "address_unit")
+_ZIP_COLS = ("zip", "zip_code", "zipcode", "zip_code_5")
+_BLOCK_COLS = ("block", "block_num", "block_number")
+_LOT_COLS = ("lot", "lot_num", "lot_number")
+_BLKLOT_COLS = ("blklot", "parcel_number", "mapblklot")
+
+class ParcelIndex:
+    """SQLite-backed address -> block/lot index with exact and fuzzy lookup."""
+
+    def __init__(self, path=PARCEL_INDEX_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS parcels ("
+            " address_key TEXT PRIMARY KEY, street_number TEXT, street TEXT, unit TEXT,"
+            " zip TEXT, block TEXT, lot TEXT, source TEXT)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS parcels_number ON parcels (street_number)")
+        self._conn.commit()
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < KEY_VERSION:
+            self._rekey()
+
+    def _rekey(self):
+        """Recompute every row's key with the current address.py so rows stored under an older key format still match."""
+        with self._lock:
+            rows = self._conn.execute("SELECT street_number, street, unit, zip, block, lot, source FROM parcels").fetchall()
+            records = []
+            for number, street, unit, zip_code, block, lot, source in rows:
+                address = replace(parse_address(f"{number} {street}"), unit=unit or "", zip=zip_code or "")
+                records.append((address.key, address.number, address.street, address.unit, address.zip, block, lot, source))
+            self._conn.execute("DELETE FROM parcels")
+            self._conn.executemany("INSERT OR REPLACE INTO parcels VALUES (?, ?, ?, ?, ?, ?, ?, ?)", records)
+            self._conn.execute(f"PRAGMA user_version = {KEY_VERSION}")
+            self._conn.commit()
+
+    def add(self, address, block, lot, source="manual"):
+        """Index a single free-text address."""
+        self.add_many([(parse_address(address), block, lot)], source=source)
+
+    def add_many(self, rows, source="bulk"):
+        """
+        Index many parcels at once.
+
+        Args:
+            rows (iterable): (Address, block, lot) tuples
+            source (str): Where the rows came from, stored for auditing
+
+        Returns:
+            int: Number of rows written
+        """
+        records = [
+            (address.key, address.number, address.street, address.unit, address.zip, block, lot, source)
+            for address, block, lot in rows
+            if address.number and address.street and block and lot
+        ]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO parcels VALUES (?, ?, ?, ?, ?, ?, ?, ?)", records)
+            self._conn.commit()
+        return len(records)
+
+    def lookup(self, address):
+        """
+        Find the block/lot for an address.
+
+        Tries the exact unit key, then the building key, then a fuzzy match on the street
+        name among parcels with the same street number (and zip, when both sides have one).
+
+        Returns:
+            dict | None: {"block_number", "lot_number", "match", "score"} or None on a miss
+        """
+        parsed = parse_address(address)
+        number, street, unit, zip_code = parsed.number, parsed.street, parsed.unit, parsed.zip
+        if not number or not street:
+            return None
+        with self._lock:
+            for key in dict.fromkeys((parsed.key, parsed.building_key)):
+                row = self._conn.execute("SELECT block, lot FROM parcels WHERE address_key = ?", (key,)).fetchone()
+                if row:
+                    return {"block_number": row[0], "lot_number": row[1], "match": "exact", "score": 1.0}
+            candidates = self._conn.execute(
+                "SELECT street, unit, zip, block, lot FROM parcels WHERE street_number = ?", (number,)
+            ).fetchall()
+
+        best, best_score = None, FUZZY_CUTOFF
+        for cand_street, cand_unit, cand_zip, block, lot in candidates:
+            if zip_code and cand_zip and zip_code != cand_zip:
+                continue
+            if cand_unit and cand_unit != unit:
+                continue
+            score = difflib.SequenceMatcher(None, street, cand_street).ratio()
+            if cand_unit == unit:
+                score += 0.01  # prefer the row for the same unit among equally close streets
+            if score >= best_score:
+                best, best_score = (block, lot), score
+        if best is None:
+            return None
+        return {"block_number": best[0], "lot_number": best[1], "match": "fuzzy", "score": min(best_score, 1.0)}
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM parcels").fetchone()[0]
+
+
+def _pick(record, names):
+    for n in names:
+        value = record.get(n)
+        if value not in (None, ""):
+            return str(value).strip()
+    return ""
+
+
+def _record_to_row(record):
+    record = {k.strip().lower().replace(" ", "_"): v for k, v in record.items()}
+    block, lot = _pick(record, _BLOCK_COLS), _pick(record, _LOT_COLS)
+    blklot = _pick(record, _BLKLOT_COLS).replace("-", "")
+    if (not block or not lot) and len(blklot) >= 7:
+        block, lot = blklot[:4], blklot[4:]
+
+    full_address = _pick(record, _ADDRESS_COLS)
+    if not full_address:
+        full_address = " ".join((_pick(record, _NUMBER_COLS), _pick(record, _STREET_COLS), _pick(record, _STREET_TYPE_COLS)))
+    address = parse_address(full_address)
+    address = replace(address, unit=_pick(record, _UNIT_COLS).lower() or address.unit,
+                      zip=_pick(record, _ZIP_COLS)[:5] or address.zip)
+    return address, block, lot
+
+
+def load_file(path, index=None):
+    """
+    Bulk-load a parcel CSV or GeoJSON dump into the index.
+
+    Returns:
+        int: Number of parcels indexed
+    """
+    index = index or get_parcel_index()
+    if path.lower().endswith((".geojson", ".json")):
+        with open(path) as f:
+            records = [feature.get("properties") or {} for feature in json.load(f)["features"]]
+        return index.add_many((_record_to_row(r) for r in records), source=os.path.basename(path))
+    with open(path, newline="") as f:
+        return index.add_many((_record_to_row(r) for r in csv.DictReader(f)), source=os.path.basename(path))
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_parcel_index():
+    """Return the process-wide parcel index."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = ParcelIndex()
+    return _index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SF parcel block/lot index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    load = sub.add_parser("load", help="bulk-load a parcel CSV/GeoJSON dump")
+    load.add_argument("path")
+    lookup = sub.add_parser("lookup", help="look up the block/lot for an address")
+    lookup.add_argument("address")
+    args = parser.parse_args()
+
+    if args.command == "load":
+        n = load_file(args.path)
+        print(f"✅ Indexed {n} parcels ({get_parcel_index().count()} total)")
+    else:
+        hit = get_parcel_index().lookup(args.address)
+        print(hit if hit else "❌ Not in the parcel index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+import tracing
+
+
+@dataclass
+class Stage:
+    """
+    One step of the verification pipeline.
+
+    Args:
+        name (str): Unique stage name, also the key of its result
+        func (callable): Sync or async callable taking the dict of results of its dependencies
+        deps (tuple): Names of the stages that must finish before this one starts
+        key (str): Identity of the stage's work (e.g. the normalized address); stages with the
+            same name and key share one execution across runs given the same memo dict
+    """
+    name: str
+    func: Callable
+    deps: Sequence[str] = ()
+    key: Optional[str] = None
+
+
+@dataclass
+class StageTiming:
+    start: float
+    end: float
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+@dataclass
+class PipelineRun:
+    results: Dict[str, object] = field(default_factory=dict)
+    timings: Dict[str, StageTiming] = field(default_factory=dict)
+    shared: set = field(default_factory=set)  # stages whose result came from the memo
+    skipped: set = field(default_factory=set)  # stages cancelled because `stop_when` ended the run
+    stopped_after: Optional[str] = None  # stage whose result made `stop_when` true
+    total: float = 0.0
+
+
+def _check_graph(stages: List[Stage]):
+    names = {s.name for s in stages}
+    if len(names) != len(stages):
+        raise ValueError("Duplicate stage names in pipeline")
+    for s in stages:
+        missing = [d for d in s.deps if d not in names]
+        if missing:
+            raise ValueError(f"Stage '{s.name}' depends on unknown stage(s) {missing}")
+
+    # Kahn's algorithm, only to reject cycles up front
+    indegree = {s.name: len(s.deps) for s in stages}
+    ready = [n for n, d in indegree.items() if d == 0]
+    seen = 0
+    while ready:
+        n = ready.pop()
+        seen += 1
+        for s in stages:
+            if n in s.deps:
+                indegree[s.name] -= 1
+                if indegree[s.name] == 0:
+                    ready.append(s.name)
+    if seen != len(stages):
+        raise ValueError("Pipeline stages contain a dependency cycle")
+
+
+async def _call(func, inputs):
+    if inspect.iscoroutinefunction(func):
+        return await func(inputs)
+    # Blocking provider calls (requests, OpenAI client) run on worker threads
+    # so independent branches overlap on the event loop.
+    return await asyncio.to_thread(func, inputs)
+
+
+async def run_stages(stages: List[Stage], memo: Optional[dict] = None,
+                     on_stage: Optional[Callable] = None,
+                     stop_when: Optional[Callable] = None) -> PipelineRun:
+    """
+    Run pipeline stages as a DAG, starting every stage as soon as its dependencies finish.
+
+    Args:
+        stages (list[Stage]): Stages to run
+        memo (dict): Optional (stage name, key) -> task map shared between concurrent runs,
+            so keyed stages run once per key (used by batch checks)
+        on_stage (callable): Called as on_stage(name, result, timing) as soon as each stage finishes
+        stop_when (callable): Called as stop_when(name, result) after each stage; once it returns
+            True the stages still pending or running are cancelled and listed in `run.skipped`.
+            Stages running on worker threads cannot be interrupted: their thread finishes in the
+            background but the run no longer waits for it.
+
+    Returns:
+        PipelineRun: Stage results and per-stage timings (seconds since the run started)
+    """
+    _check_graph(stages)
+    run = PipelineRun()
+    t0 = time.perf_counter()
+    tasks: Dict[str, asyncio.Task] = {}
+    stop = asyncio.Event()
+
+    async def run_one(stage: Stage):
+        if stage.deps:
+            await asyncio.gather(*(tasks[d] for d in stage.deps))
+        inputs = {d: run.results[d] for d in stage.deps}
+        start = time.perf_counter() - t0
+        try:
+            with tracing.span(f"stage:{stage.name}", kind="stage", stage=stage.name):
+                if memo is not None and stage.key is not None:
+                    memo_key = (stage.name, stage.key)
+                    if memo_key in memo:
+                        run.shared.add(stage.name)
+                        tracing.set_attributes(shared=True)
+                    else:
+                        memo[memo_key] = asyncio.ensure_future(_call(stage.func, inputs))
+                    # shield: one run being cancelled must not cancel work other runs wait on
+                    result = await asyncio.shield(memo[memo_key])
+                else:
+                    result = await _call(stage.func, inputs)
+        finally:
+            run.timings[stage.name] = StageTiming(start, time.perf_counter() - t0)
+        run.results[stage.name] = result
+        if on_stage is not None:
+            on_stage(stage.name, result, run.timings[stage.name])
+        if stop_when is not None and not stop.is_set() and stop_when(stage.name, result):
+            run.stopped_after = stage.name
+            stop.set()
+        return result
+
+    for stage in stages:
+        tasks[stage.name] = asyncio.create_task(run_one(stage), name=stage.name)
+    stopper = asyncio.create_task(stop.wait())
+    pending = set(tasks.values())
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending | {stopper}, return_when=asyncio.FIRST_COMPLETED)
+            for task in done - {stopper}:
+                task.result()  # re-raise the first stage error
+            if stop.is_set():
+                break
+            pending.discard(stopper)
+        pending.discard(stopper)
+        if pending:
+            run.skipped = {task.get_name() for task in pending}
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for name in run.skipped:
+                run.timings.pop(name, None)
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+    finally:
+        stopper.cancel()
+        run.total = time.perf_counter() - t0
+    return run
@@ -1,28 +1,137 @@
-from browser_use import Agent, ChatOpenAI, Browser
-from dotenv import load_dotenv
+import argparse
 import asyncio
+import csv
 import os 
+import threading
+from functools import lru_cache
 from typing import List
-from pydantic import BaseModel
+from cache_store import CacheStore
+from browser_pool import get_browser_pool
+import recorder_scraper
+import rate_limit
+import tracing
+from single_flight import get_group
+import providers
 
-load_dotenv()
+providers.load_env()
 
-class Owners(BaseModel):
-    owners: List[str]
+# Recorder owner records barely change; keep them for 30 days unless overridden
+OWNER_CACHE_TTL = int(os.getenv("OWNER_CACHE_TTL", str(30 * 24 * 3600)))
+# Scripted recorder search before falling back to the LLM-driven agent
+RECORDER_FAST_PATH = os.getenv("RECORDER_FAST_PATH", "1") != "0"
+
+_owner_store = None
+_owner_store_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def owners_model():
+    """Structured-output model of the browser agent (pydantic is only imported when the agent runs)."""
+    from pydantic import BaseModel
+
+    class Owners(BaseModel):
+        owners: List[str]
+    return Owners
+
+def get_owner_store():
+    """Durable (block, lot) -> owner names store."""
+    global _owner_store
+    with _owner_store_lock:
+        if _owner_store is None:
+            _owner_store = CacheStore("recorder_owners", default_ttl=OWNER_CACHE_TTL)
+    return _owner_store
+
+def owner_key(block_number, lot_number):
+    return f"{str(block_number).strip().upper()}/{str(lot_number).strip().upper()}"
     
-async def get_owner_name(block_number, lot_number):
+async def _count_step(agent):
+    tracing.count("browser.steps")
+
+async def get_owner_name(block_number, lot_number, use_cache=True):
+    key = owner_key(block_number, lot_number)
+    if use_cache:
+        cached = get_owner_store().get(key)
+        if cached is not None:
+            return cached
+    # Concurrent checks for the same parcel share one recorder lookup
+    return await get_group("recorder").do_async(key, lambda: _lookup_owner_name(block_number, lot_number, key))
+
+async def _lookup_owner_name(block_number, lot_number, key):
+    await rate_limit.acquire_async("recorder")
+    if RECORDER_FAST_PATH:
+        try:
+            owners = await recorder_scraper.fetch_owner_names(block_number, lot_number)
+            get_owner_store().set(key, owners)
+            return owners
+        except Exception as e:
+            # Recorded on the owners stage span instead of printed; the browser agent takes over
+            tracing.count("recorder.scripted_failed")
+            tracing.set_attributes(recorder_fallback=f"{type(e).__name__}: {e}")
+
+    # browser-use (and its LLM client) is only imported when the scripted lookup fails
+    from browser_use import Agent, ChatOpenAI
     llm = ChatOpenAI(model="gpt-4.1")
     url = "https://recorder.sfgov.org/#!/simple"
     task = f"Go to this url {url}. Enter the block number '{block_number}' and lot number '{lot_number}'. IMPORTANT: Leave all other fields blank. Hit search. return the list of names that appears on the page and end immediately - don't navigate on the page."
-    agent = Agent(task=task, llm=llm, output_model_schema=Owners)
-    history=await agent.run(max_steps=20)
-    owners: Owners = history.structured_output
+    async with get_browser_pool().lease() as browser:
+        agent = Agent(task=task, llm=llm, output_model_schema=owners_model(), browser=browser)
+        with tracing.span("browser_use:recorder", kind="browser", provider="browser_use"):
+            history=await agent.run(max_steps=20, on_step_end=_count_step)
+    owners = history.structured_output
+    if owners.owners:
+        get_owner_store().set(key, owners.owners)
     return owners.owners
 
+async def warm_owner_cache(parcels, concurrency=2):
+    """
+    Prefetch owner names for many parcels so later checks skip the browser agent.
+
+    Args:
+        parcels (list[tuple]): (block_number, lot_number) pairs
+        concurrency (int): Browser agents to run at once
+
+    Returns:
+        dict: owner_key -> list of owner names (or the error message for failed parcels)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    results = {}
+
+    async def warm(block_number, lot_number):
+        key = owner_key(block_number, lot_number)
+        async with semaphore:
+            try:
+                results[key] = await get_owner_name(block_number, lot_number)
+                print(f"✅ {key}: {', '.join(results[key])}")
+            except Exception as e:
+                results[key] = str(e)
+                print(f"❌ {key}: {e}")
+
+    pending = [(b, l) for b, l in parcels if get_owner_store().get(owner_key(b, l)) is None]
+    print(f"🔥 Warming {len(pending)} of {len(parcels)} parcels")
+    await asyncio.gather(*(warm(b, l) for b, l in pending))
+    return results
+
+def read_parcels(path):
+    """Read (block, lot) pairs from a CSV with block/lot columns."""
+    with open(path, newline="") as f:
+        rows = [{k.strip().lower(): v for k, v in row.items()} for row in csv.DictReader(f)]
+    return [(row["block"].strip(), row["lot"].strip()) for row in rows if row.get("block") and row.get("lot")]
+
 async def main():
-    block_number = "1865"
-    lot_number = "012"
-    await get_owner_name(block_number=block_number, lot_number=lot_number)
+    parser = argparse.ArgumentParser(description="SF recorder owner lookup")
+    parser.add_argument("--warm", metavar="CSV", help="prefetch owners for every block/lot in this CSV")
+    parser.add_argument("--concurrency", type=int, default=2)
+    args = parser.parse_args()
+    try:
+        if args.warm:
+            await warm_owner_cache(read_parcels(args.warm), concurrency=args.concurrency)
+            return
+
+        block_number = "1865"
+        lot_number = "012"
+        await get_owner_name(block_number=block_number, lot_number=lot_number)
+    finally:
+        await get_browser_pool().close()
+        await recorder_scraper.close()
 
 if __name__=="__main__":
     asyncio.run(main())
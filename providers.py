@@ -0,0 +1,71 @@
+"""
+Lazily created provider clients and one-time environment loading.
+
+Importing the pipeline must stay cheap: `openai`, `pydantic` and `browser_use` are
+only imported by the code path that needs them, and clients are built on first use
+through this registry instead of at module import:
+
+    client = providers.get("openai")
+
+Register further clients with `register(name, factory)`; `reset()` drops built
+instances (e.g. after changing keys in tests or notebooks).
+
+    python -X importtime -c "import check_if_scammer"   # see bench/import_time.py
+"""
+import threading
+
+_lock = threading.RLock()  # factories may themselves call get()
+_factories = {}
+_instances = {}
+_env_loaded = False
+
+
+def load_env():
+    """Load `.env` into os.environ once per process."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    with _lock:
+        if not _env_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _env_loaded = True
+
+
+def register(name, factory):
+    """Register (or replace) the zero-argument factory building provider `name`."""
+    with _lock:
+        _factories[name] = factory
+        _instances.pop(name, None)
+
+
+def get(name):
+    """Return provider `name`, building it on first use."""
+    instance = _instances.get(name)
+    if instance is not None:
+        return instance
+    with _lock:
+        if name not in _instances:
+            if name not in _factories:
+                raise KeyError(f"Unknown provider '{name}'")
+            load_env()
+            _instances[name] = _factories[name]()
+        return _instances[name]
+
+
+def reset(name=None):
+    """Forget one (or every) built provider so the next `get` builds it again."""
+    with _lock:
+        if name is None:
+            _instances.clear()
+        else:
+            _instances.pop(name, None)
+
+
+def _openai_client():
+    from openai import OpenAI
+    # Retries are done by rate_limit.call so they share the provider's backoff and circuit breaker
+    return OpenAI(max_retries=0)
+
+
+register("openai", _openai_client)
@@ -0,0 +1,336 @@
+"""
+Per-provider request rate limits, retries and circuit breakers.
+
+Each provider ("serper", "firecrawl", "openrouter", "openai", "recorder") gets a
+token bucket. Limits come from RATE_LIMIT_<PROVIDER> (requests per second, e.g.
+RATE_LIMIT_SERPER=5) or from `configure()`; providers without a limit are not throttled.
+
+`call()` / `call_async()` wrap one provider request:
+- 429 and 5xx responses and transport errors are retried with exponential backoff
+  and full jitter, waiting at least as long as the provider's Retry-After header.
+- A 429 halves the provider's bucket rate and pauses the whole provider until
+  Retry-After; successful calls slowly restore the configured rate.
+- After CIRCUIT_FAILURES consecutive failures the provider's circuit opens and calls
+  fail fast with CircuitOpenError for CIRCUIT_RESET seconds, then one trial call is let through.
+
+`stats()` returns the per-provider counters.
+"""
+import asyncio
+import email.utils
+import os
+import random
+import threading
+import time
+
+RETRY_MAX = int(os.getenv("RETRY_MAX", "3"))  # retries after the first attempt
+BACKOFF_BASE = float(os.getenv("BACKOFF_BASE", "0.5"))  # seconds
+BACKOFF_MAX = float(os.getenv("BACKOFF_MAX", "30"))
+CIRCUIT_FAILURES = int(os.getenv("CIRCUIT_FAILURES", "5"))
+CIRCUIT_RESET = float(os.getenv("CIRCUIT_RESET", "30"))  # seconds an open circuit rejects calls
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Args:
+        rate (float): Tokens added per second
+        burst (float): Bucket capacity (defaults to max(1, rate))
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self.max_rate = self.rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def throttle(self, factor=0.5, floor=0.05):
+        """Cut the rate after a 429 (never below `floor` of the configured rate)."""
+        with self._lock:
+            self.rate = max(self.max_rate * floor, self.rate * factor)
+
+    def recover(self, step=0.05):
+        """Raise the rate back towards the configured rate after a successful call."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * step)
+
+    def _reserve(self):
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += wait
+            return wait
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed -> open after `failure_threshold` failures in a row; open -> half-open after
+    `reset_timeout` seconds, when one trial call is allowed; its outcome closes or reopens it.
+    """
+
+    def __init__(self, failure_threshold=CIRCUIT_FAILURES, reset_timeout=CIRCUIT_RESET):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+
+    def allow(self):
+        """Whether a call may go out now."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial = False
+
+
+_buckets = {}
+_breakers = {}
+_paused_until = {}  # provider -> monotonic time before which no request may start (Retry-After)
+_metrics = {}
+_lock = threading.Lock()
+
+
+def _counters(provider):
+    with _lock:
+        return _metrics.setdefault(provider, {"requests": 0, "retries": 0, "throttled": 0, "server_errors": 0,
+                                              "transport_errors": 0, "rejected": 0, "backoff_seconds": 0.0})
+
+
+def configure(provider, rate, burst=None):
+    """Set (or with rate=None, remove) the request rate limit for a provider."""
+    with _lock:
+        if rate is None:
+            _buckets.pop(provider, None)
+        else:
+            _buckets[provider] = TokenBucket(rate, burst)
+
+
+def get_bucket(provider):
+    """Bucket for a provider, created from RATE_LIMIT_<PROVIDER> on first use; None when unlimited."""
+    with _lock:
+        if provider not in _buckets:
+            rate = os.getenv(f"RATE_LIMIT_{provider.upper()}")
+            _buckets[provider] = TokenBucket(float(rate)) if rate else None
+        return _buckets[provider]
+
+
+def get_breaker(provider):
+    """Circuit breaker for a provider."""
+    with _lock:
+        if provider not in _breakers:
+            _breakers[provider] = CircuitBreaker()
+        return _breakers[provider]
+
+
+def _pause_remaining(provider):
+    return max(0.0, _paused_until.get(provider, 0.0) - time.monotonic())
+
+
+def acquire(provider):
+    """Block until the provider's rate limit allows one more request."""
+    pause = _pause_remaining(provider)
+    if pause:
+        time.sleep(pause)
+    bucket = get_bucket(provider)
+    if bucket is not None:
+        bucket.acquire()
+
+
+async def acquire_async(provider):
+    """Async variant of `acquire`."""
+    pause = _pause_remaining(provider)
+    if pause:
+        await asyncio.sleep(pause)
+    bucket = get_bucket(provider)
+    if bucket is not None:
+        await bucket.acquire_async()
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date); None if absent or invalid."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def backoff_delay(attempt, retry_after=None):
+    """Exponential backoff with full jitter for retry `attempt` (0-based), never shorter than Retry-After."""
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, BACKOFF_MAX))
+    return delay
+
+
+def _outcome(result=None, error=None):
+    """(status, retry_after) of a response or of an exception raised by a client library."""
+    source = result if error is None else error
+    status = getattr(source, "status_code", None)
+    response = source if error is None else getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    return status, parse_retry_after(headers.get("retry-after") or headers.get("Retry-After"))
+
+
+def _before_attempt(provider, breaker, counters):
+    if not breaker.allow():
+        counters["rejected"] += 1
+        raise CircuitOpenError(f"{provider} circuit is open after repeated failures")
+    counters["requests"] += 1
+
+
+def _after_attempt(provider, breaker, counters, status, retry_after, error):
+    """Record one attempt; return True when it should be retried."""
+    bucket = get_bucket(provider)
+    if status == 429:
+        counters["throttled"] += 1
+        if bucket is not None:
+            bucket.throttle()
+        if retry_after:
+            with _lock:
+                _paused_until[provider] = max(_paused_until.get(provider, 0.0), time.monotonic() + retry_after)
+    elif status is not None and status >= 500:
+        counters["server_errors"] += 1
+    elif status is None and error is not None:
+        counters["transport_errors"] += 1
+
+    if status in RETRYABLE_STATUS or (status is None and error is not None):
+        breaker.record_failure()
+        return True
+    # Anything else (2xx, or a 4xx that is the caller's fault) means the provider is up
+    breaker.record_success()
+    if bucket is not None:
+        bucket.recover()
+    return False
+
+
+def call(provider, send, max_retries=RETRY_MAX):
+    """
+    Send one provider request through its rate limit, retry policy and circuit breaker.
+
+    Args:
+        provider (str): Provider name
+        send (callable): Makes the request; returns a response with `status_code` and
+            `headers`, or raises (client-library errors with `status_code` are classified too)
+        max_retries (int): Retries after the first attempt
+
+    Returns:
+        The response of the last attempt; it may still be a 429/5xx once retries are exhausted
+
+    Raises:
+        CircuitOpenError: When the provider's circuit is open
+    """
+    breaker, counters = get_breaker(provider), _counters(provider)
+    for attempt in range(max_retries + 1):
+        _before_attempt(provider, breaker, counters)
+        acquire(provider)
+        result = error = None
+        try:
+            result = send()
+        except Exception as e:
+            error = e
+        status, retry_after = _outcome(result, error)
+        retry = _after_attempt(provider, breaker, counters, status, retry_after, error)
+        # Stop retrying once this call's failures have opened the circuit
+        if not retry or attempt == max_retries or breaker.state == "open":
+            if error is not None:
+                raise error
+            return result
+        counters["retries"] += 1
+        delay = backoff_delay(attempt, retry_after)
+        counters["backoff_seconds"] += delay
+        time.sleep(delay)
+
+
+async def call_async(provider, send, max_retries=RETRY_MAX):
+    """Async variant of `call`; `send` is a coroutine function."""
+    breaker, counters = get_breaker(provider), _counters(provider)
+    for attempt in range(max_retries + 1):
+        _before_attempt(provider, breaker, counters)
+        await acquire_async(provider)
+        result = error = None
+        try:
+            result = await send()
+        except Exception as e:
+            error = e
+        status, retry_after = _outcome(result, error)
+        retry = _after_attempt(provider, breaker, counters, status, retry_after, error)
+        # Stop retrying once this call's failures have opened the circuit
+        if not retry or attempt == max_retries or breaker.state == "open":
+            if error is not None:
+                raise error
+            return result
+        counters["retries"] += 1
+        delay = backoff_delay(attempt, retry_after)
+        counters["backoff_seconds"] += delay
+        await asyncio.sleep(delay)
+
+
+def stats():
+    """Per-provider request/retry/throttle counters, current bucket rate and circuit state."""
+    with _lock:
+        providers = set(_metrics) | set(_breakers)
+    out = {}
+    for provider in sorted(providers):
+        bucket = get_bucket(provider)
+        out[provider] = {
+            **_counters(provider),
+            "rate": bucket.rate if bucket is not None else None,
+            "rate_limit_wait_seconds": bucket.waited if bucket is not None else 0.0,
+            "circuit": get_breaker(provider).state,
+        }
+    return out
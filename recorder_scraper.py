@@ -0,0 +1,228 @@
+"""
+Scripted SF Assessor-Recorder owner lookup (no LLM).
+
+Fills block/lot into the recorder.sfgov.org simple search with Playwright and parses
+the grantor/grantee names out of the results grid. `property_search.get_owner_name`
+uses it as the fast path and only starts the browser-use agent when it fails.
+
+    python recorder_scraper.py 1865 012            # live lookup
+    python recorder_scraper.py --html saved.html   # parse a saved copy of the results page
+"""
+import argparse
+import asyncio
+import os
+import re
+import weakref
+from html.parser import HTMLParser
+
+RECORDER_URL = "https://recorder.sfgov.org/#!/simple"
+RECORDER_TIMEOUT_MS = int(os.getenv("RECORDER_TIMEOUT_MS", "20000"))
+
+# The simple search is an Angular form; match inputs on model/name/placeholder so
+# small markup changes don't break the script.
+BLOCK_INPUT = "input[ng-model*='block' i], input[name*='block' i], input[placeholder*='block' i]"
+LOT_INPUT = "input[ng-model*='lot' i], input[name*='lot' i], input[placeholder*='lot' i]"
+SEARCH_BUTTON = "button:has-text('Search'), input[type='submit']"
+RESULTS_TABLE = "table:has(td)"
+NO_RESULTS_TEXT = re.compile(r"no (records|results|documents) found", re.IGNORECASE)
+
+# Result-grid columns that hold party names ("Grantor", "Grantee(s)", "Owner Name", ...)
+_ROLES = {"grantor", "grantee", "owner"}
+# Grids that list all parties in one "Name" column tag each row in a role column instead
+_PARTY_NAME_HEADERS = {"name", "party", "party name"}
+_ROLE_HEADERS = {"name type", "party type", "role"}
+# Cell values that are roles or document types, not names
+_NOT_A_NAME_RE = re.compile(
+    r"^(?:grantors?|grantees?|owners?|n/?a|none|(?:grant |quitclaim |trust transfer |warranty )?deed(?: of trust)?"
+    r"|reconveyance|full reconveyance|substitution of trustee|assignment\b.*|notice\b.*|release\b.*|lien\b.*"
+    r"|affidavit\b.*|agreement\b.*|mortgage)$", re.IGNORECASE)
+# Grantees that lend against the property rather than own it
+_LENDER_RE = re.compile(
+    r"\b(?:bank|bancorp|n\.?a\.?$|fsb|credit union|savings|mortgage|lending|lender|loans?|financial|servicing"
+    r"|federal national|federal home loan|mers|title (?:company|co|insurance)|escrow)\b", re.IGNORECASE)
+
+
+class RecorderScrapeError(Exception):
+    pass
+
+
+class _TableParser(HTMLParser):
+    """Collects every <table> as a list of rows of cell texts."""
+
+    def __init__(self):
+        super().__init__()
+        self.tables = []
+        self._row = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            self.tables.append([])
+        elif tag == "tr" and self.tables:
+            self._row = []
+        elif tag in ("td", "th") and self._row is not None:
+            self._cell = []
+        elif tag == "br" and self._cell is not None:
+            self._cell.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in ("td", "th") and self._cell is not None:
+            self._row.append("".join(self._cell).strip())
+            self._cell = None
+        elif tag == "tr" and self._row is not None:
+            if self._row:
+                self.tables[-1].append(self._row)
+            self._row = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def _header_words(header):
+    """Lower-cased header words without punctuation or plural s ("Grantee(s)" -> ["grantee"])."""
+    return [w[:-1] if w.endswith("s") else w for w in re.findall(r"[a-z]{2,}", header.lower())]
+
+
+def _name_columns(header):
+    """
+    Indexes of the party-name columns of a results grid.
+
+    Returns:
+        tuple: ([column index], role column index or None); with a role column, only rows
+        whose role is a grantor/grantee/owner count
+    """
+    words = [_header_words(h) for h in header]
+    columns = [i for i, w in enumerate(words) if w and set(w) - {"name"} and set(w) - {"name"} <= _ROLES]
+    if columns:
+        return columns, None
+    role = next((i for i, w in enumerate(words) if " ".join(w) in _ROLE_HEADERS), None)
+    if role is None:
+        return [], None
+    return [i for i, w in enumerate(words) if " ".join(w) in _PARTY_NAME_HEADERS], role
+
+
+def _is_party_name(value):
+    """Whether a grid value is a person or owning entity (not a role, document type or lender)."""
+    return bool(value) and not _NOT_A_NAME_RE.match(value) and not _LENDER_RE.search(value)
+
+
+def parse_owner_names(html):
+    """
+    Extract the unique party names from a recorder results page.
+
+    Only grantor/grantee/owner columns are read (or, in grids with a role column, the
+    name of rows whose role is one of those). Document types and institutional lenders
+    such as banks and mortgage servicers are dropped.
+
+    Args:
+        html (str): Results page HTML
+
+    Returns:
+        list[str]: Names in first-seen order
+    """
+    parser = _TableParser()
+    parser.feed(html)
+    names = []
+    for table in parser.tables:
+        if len(table) < 2:
+            continue
+        columns, role = _name_columns(table[0])
+        for row in table[1:]:
+            if role is not None and (role >= len(row) or not set(_header_words(row[role])) & _ROLES):
+                continue
+            for i in columns:
+                if i >= len(row):
+                    continue
+                for name in re.split(r"[\n;]+", row[i]):
+                    name = " ".join(name.split())
+                    if _is_party_name(name) and name not in names:
+                        names.append(name)
+    return names
+
+
+_playwright = None
+_browser = None
+_browser_locks = weakref.WeakKeyDictionary()  # event loop -> asyncio.Lock
+
+
+def _browser_lock():
+    """Lock guarding the browser launch, one per event loop (asyncio locks are bound to their loop)."""
+    loop = asyncio.get_running_loop()
+    lock = _browser_locks.get(loop)
+    if lock is None:
+        lock = _browser_locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def _get_browser():
+    global _playwright, _browser
+    async with _browser_lock():
+        if _browser is None or not _browser.is_connected():
+            from playwright.async_api import async_playwright
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+    return _browser
+
+
+async def fetch_owner_names(block_number, lot_number, timeout_ms=RECORDER_TIMEOUT_MS):
+    """
+    Look up owner names for a block/lot with a scripted Playwright session.
+
+    Raises:
+        RecorderScrapeError: The form or the results grid could not be found, or no names were parsed
+    """
+    browser = await _get_browser()
+    page = await browser.new_page()
+    try:
+        await page.goto(RECORDER_URL, timeout=timeout_ms)
+        await page.fill(BLOCK_INPUT, str(block_number), timeout=timeout_ms)
+        await page.fill(LOT_INPUT, str(lot_number), timeout=timeout_ms)
+        await page.click(SEARCH_BUTTON, timeout=timeout_ms)
+        await page.wait_for_selector(RESULTS_TABLE, timeout=timeout_ms)
+        html = await page.content()
+    except Exception as e:
+        raise RecorderScrapeError(f"Recorder search failed for {block_number}/{lot_number}: {e}") from e
+    finally:
+        await page.close()
+
+    names = parse_owner_names(html)
+    if not names:
+        if NO_RESULTS_TEXT.search(html):
+            raise RecorderScrapeError(f"No recorder documents for {block_number}/{lot_number}")
+        raise RecorderScrapeError(f"Could not parse owner names for {block_number}/{lot_number}")
+    return names
+
+
+async def close():
+    global _playwright, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Scripted SF recorder owner lookup")
+    parser.add_argument("block", nargs="?")
+    parser.add_argument("lot", nargs="?")
+    parser.add_argument("--html", help="parse a saved results page instead of searching live")
+    args = parser.parse_args()
+
+    if args.html:
+        with open(args.html) as f:
+            print(parse_owner_names(f.read()))
+        return
+    if not (args.block and args.lot):
+        parser.error("block and lot are required without --html")
+    try:
+        print(await fetch_owner_names(args.block, args.lot))
+    finally:
+        await close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""
+Cheap local checks that decide whether a scraped page is worth an LLM call.
+
+- Placeholder pages (social-platform short-circuits, failed scrapes) are dropped.
+- Landlord pages must mention the landlord's name or the street address.
+- Zillow pages must mention a dollar amount.
+- Pages whose normalized content was already seen in the same check are duplicates.
+"""
+import hashlib
+import re
+
+from address import parse_address
+
+PLACEHOLDER_TEXTS = {"no data available after scraping", ""}
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+_HONORIFICS = {"mr", "mrs", "ms", "dr", "jr", "sr", "ii", "iii"}
+DOLLAR_RE = re.compile(r"\$\s?\d")
+
+
+def is_placeholder(content):
+    return (content or "").strip().lower() in PLACEHOLDER_TEXTS
+
+
+def _words(text):
+    return set(_WORD_RE.findall((text or "").lower()))
+
+
+def name_tokens(name):
+    """Distinctive lower-cased words of a person's name (no initials or honorifics)."""
+    return {w for w in _WORD_RE.findall(name.lower()) if len(w) >= 3 and w not in _HONORIFICS}
+
+
+def mentions_landlord(name, address, text):
+    """True if `text` names the landlord or contains the street number together with the street name."""
+    words = _words(text)
+    if name_tokens(name) & words:
+        return True
+    parsed = parse_address(address)
+    number, street = parsed.number, parsed.street
+    street_words = {w for w in street.split() if len(w) >= 3} - {"street", "avenue", "boulevard", "road", "drive"}
+    return bool(number) and number in words and bool(street_words & words)
+
+
+class ContentDeduper:
+    """Remembers normalized page contents seen within one check."""
+
+    def __init__(self):
+        self._seen = {}
+
+    def first_seen(self, content, index):
+        """Return the index of the first page with the same content, registering `index` if it is new."""
+        digest = hashlib.sha1(" ".join((content or "").lower().split()).encode("utf-8")).hexdigest()
+        return self._seen.setdefault(digest, index)
+
+
+def landlord_page_relevant(name, address, search_result, content):
+    """Whether a landlord search result should go to the LLM."""
+    if is_placeholder(content):
+        return False
+    text = " ".join((search_result.get("title", ""), search_result.get("snippet", ""), content))
+    return mentions_landlord(name, address, text)
+
+
+def zillow_page_has_price(content):
+    """Whether a scraped Zillow page could contain a rent at all."""
+    return not is_placeholder(content) and bool(DOLLAR_RE.search(content))
@@ -0,0 +1,235 @@
+"""
+Renderers for pipeline results (see results.py).
+
+- `print_stage` / `render_cli`: the emoji console output, live per stage or as a full report
+- `to_jsonable` / `dumps`: JSON (orjson when installed)
+- `render_frontend`: the entry shape the Frontend's loading page consumes (analysis-data.json)
+- `render_summary`: the verdict shape the Frontend's results page consumes
+
+Batch and server runs call the JSON renderers only, so no formatting happens in the
+hot path.
+"""
+import dataclasses
+import json
+
+from results import CheckResult, LandlordReport
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SEPARATOR = "-" * 60
+
+
+def to_jsonable(value):
+    """Plain dict/list view of result records, pydantic models and containers."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: to_jsonable(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [to_jsonable(v) for v in value]
+    return value
+
+
+def _default(value):
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return str(value)
+
+
+def dumps(value):
+    """Serialize a result (or any JSON-able value containing records) to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(to_jsonable(value), default=_default)
+
+
+def _readable(key):
+    return ' '.join([word.capitalize() for word in key.split('_')])
+
+
+def _verdict_line(key, verdict):
+    readable = _readable(key)
+    if verdict == 1:
+        return f"{readable}: ✅"
+    if verdict == -1:
+        return f"🚩🚩🚩 RED FLAG ALERT: {readable} 🚩🚩🚩"
+    return f"Inconclusive: {readable}"
+
+
+def render_landlord(report: LandlordReport):
+    print(f"🔍 Searching for: {report.query}")
+    if not report.findings:
+        print("❌ No search results found")
+        return
+    print(f"✅ Found {len(report.findings)} results")
+    print(SEPARATOR)
+    for i, finding in enumerate(report.findings, 1):
+        print(f"\n{i}. {finding.title}")
+        print(f"   🔗 {finding.link}")
+        print(f"📄 Analyzing: {finding.title}")
+        print(f"   🤖 Analysis")
+        for key, verdict in finding.verdicts.items():
+            print(_verdict_line(key, verdict))
+        print(SEPARATOR)
+
+
+def print_stage(name, result, timing=None):
+    """CLI progress printer; pass as `on_stage` to `check_if_scammer`."""
+    if name == "web_search" and result is not None:
+        print(f"🔎 Searching Online")
+        render_landlord(result)
+    elif name == "zillow_rent":
+        if result:
+            print(f"🏠 Zillow rent ${result.monthly_rent_usd:,.0f}/mo from {result.source_title or result.source_url} "
+                  f"({result.method}, confidence {result.confidence:.2f})")
+            if result.provenance:
+                print(f"   “{result.provenance}”")
+        else:
+            print(f"🏠 No Zillow rent found")
+    elif name == "block_lot":
+        print(f"📜🏠 Checking San Francisco Planning Department records")
+        print(f"📋 Found tax block number '{result.block_number}', Lot number '{result.lot_number}'")
+    elif name == "owners":
+        print(f"🧭 Finding owner details from County of San Francisco Assessor-Recorder Public Index Search")
+        print(f"🪪 Found previous owner names {', '.join(result)}")
+
+
+def render_verdicts(result: CheckResult):
+    """Print the cross-stage red flags and the summary of a finished check."""
+    if result.zillow_rent_flag:
+        print(f"🚩🚩🚩 RED FLAG ALERT: Zillow amount is {result.zillow.monthly_rent_usd}, much higher than reported rent amount {result.reported_rent_usd} 🚩🚩🚩")
+    if result.owner_mismatch:
+        print(f"🚩🚩🚩 RED FLAG ALERT: Declared owner does not match owner names in county records!! 🚩🚩🚩")
+    elif result.owner_match:
+        print(f"✅ Declared name '{result.name}' matches with country record name '{result.owner_match}'")
+
+    print("====== SUMMARY =====")
+    report = result.landlord
+    if report and report.green_flag:
+        print(f"🟢 Found the following green flags from search results: 🟢")
+        for k, v in report.green_flag.items():
+            print(f"🟢 Proof of {k}")
+            for source in v:
+                print(f"- {source['title']}")
+                print(f"- 🔗 {source['link']}")
+    if report and report.red_flag:
+        print(f"🚩🚩🚩 RED FLAGS: Found the following red flags from search results: 🚩🚩🚩")
+        for k, v in report.red_flag.items():
+            print(f"🚩 Contradictory proof found for {k}")
+            for source in v:
+                print(f"- {source['title']}")
+                print(f"- 🔗 {source['link']}")
+    _render_risk(result)
+
+
+def _render_risk(result: CheckResult):
+    icon = {"scam": "🚩", "clear": "🟢"}.get(result.verdict, "❔")
+    print(f"{icon} Risk score {result.risk_score:+.2f}: {result.verdict}")
+    for reason in result.risk_reasons:
+        print(f"   {reason}")
+    if result.skipped_stages:
+        print(f"⏭️ Skipped {', '.join(result.skipped_stages)} once the verdict was decisive (run with full audit to include them)")
+
+
+def print_timings(result: CheckResult):
+    serial = sum(result.timings.values())
+    print(f"⏱️ Stage timings (total {result.total_seconds:.2f}s, serial sum {serial:.2f}s)")
+    for name, seconds in result.timings.items():
+        print(f"   {name:<16} {seconds:.2f}s")
+
+
+def render_cli(result: CheckResult):
+    """Full console report for a finished check (stage output, verdicts, summary, timings)."""
+    if result.landlord is not None:
+        print_stage("web_search", result.landlord)
+    print_stage("zillow_rent", result.zillow)
+    if result.block_number is not None:
+        print(f"📋 Found tax block number '{result.block_number}', Lot number '{result.lot_number}'")
+        print(f"🪪 Found previous owner names {', '.join(result.owners)}")
+    render_verdicts(result)
+    print_timings(result)
+
+
+def render_frontend(result: CheckResult):
+    """The per-address entry the Frontend loading page renders (see Frontend/analysis-data.json)."""
+    report = result.landlord or LandlordReport(query=f"{result.name} {result.address}")
+    if result.owner_mismatch:
+        footer = "🚩🚩🚩 RED FLAG ALERT: Declared owner does not match owner names in county records!! 🚩🚩🚩"
+    elif report.green_flag:
+        first = next(iter(report.green_flag.values()))[0]
+        footer = f"🟢 Found green flags: Proof of {' & '.join(report.green_flag)} from {first['title']}"
+    elif result.owner_match:
+        footer = f"✅ Declared name '{result.name}' matches with country record name '{result.owner_match}'"
+    else:
+        footer = ""
+    return {
+        "heading": "🔎 Searching Online",
+        "subheading": f"🔍 Searching for: {report.query}",
+        "summary_bold": f"✅ Found {len(report.findings)} results" if report.findings else "❌ No search results found",
+        "results": [
+            {
+                "n": i,
+                "title": finding.title,
+                "url_label": finding.link,
+                "analyzing": f"📄 Analyzing: {finding.title}",
+                "analysis": [_verdict_line(k, v) for k, v in finding.verdicts.items()],
+            }
+            for i, finding in enumerate(report.findings, 1)
+        ],
+        "footer_italics": footer,
+    }
+
+
+ADDITIONAL_QUESTIONS = [
+    "Can you schedule an in-person viewing of the property?",
+    "Have you been able to verify the landlord's identity through official channels?",
+    "What payment methods are being requested?",
+    "Are there any unusual requests or pressure tactics?",
+]
+
+
+def render_summary(result: CheckResult):
+    """The verdict shape Frontend/results.html renders (scam likelihood, reasons, insights, sources)."""
+    reasons = []
+    if result.owner_mismatch:
+        reasons.append(["bad", f"Declared owner {result.name} does not match county record owners "
+                               f"({', '.join(result.owners)})"])
+    elif result.owner_match:
+        reasons.append(["good", f"Declared name {result.name} matches county record owner {result.owner_match}"])
+    if result.zillow_rent_flag:
+        reasons.append(["bad", f"Zillow rent ${result.zillow.monthly_rent_usd:,.0f}/month is much higher than the "
+                               f"reported ${result.reported_rent_usd:,.0f}/month"])
+    report = result.landlord
+    if report:
+        reasons += [["good", f"Proof of {k} online"] for k in report.green_flag]
+        reasons += [["bad", f"Contradictory results online for {k}"] for k in report.red_flag]
+
+    insights = [["Risk Score", f"{result.risk_score:+.2f} ({result.verdict})"]]
+    if result.reported_rent_usd:
+        insights.append(["Reported Rent", f"${result.reported_rent_usd:,.0f}/month"])
+    if result.zillow:
+        insights.append(["Zillow Rent", f"${result.zillow.monthly_rent_usd:,.0f}/month"])
+    if result.block_number is not None:
+        insights.append(["Tax Block / Lot", f"{result.block_number} / {result.lot_number}"])
+    if result.owners:
+        insights.append(["County Record Owners", ", ".join(result.owners)])
+    if result.skipped_stages:
+        insights.append(["Skipped Checks", f"{', '.join(result.skipped_stages)} (verdict already decisive)"])
+
+    sources = [finding.link for finding in report.findings] if report else []
+    if result.zillow and result.zillow.source_url:
+        sources.append(result.zillow.source_url)
+    return {
+        "clear_outcome": result.verdict != "inconclusive",
+        "scam_likelihood": round((result.risk_score + 1) / 2, 2),
+        "address": result.address,
+        "reasons": reasons,
+        "analyzed_data": insights,
+        "additional_questions": ADDITIONAL_QUESTIONS,
+        "sources": list(dict.fromkeys(s for s in sources if s)),
+    }
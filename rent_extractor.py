@@ -0,0 +1,133 @@
+"""
+Deterministic monthly-rent extraction from Zillow pages.
+
+Reads explicit "$X/mo" style prices and the listing JSON Zillow embeds in its pages
+from Firecrawl markdown. Each match gets a provenance snippet and a confidence score
+so `zillow.analyze_zillow` can stop at the first confident answer and only fall back
+to the LLM when nothing deterministic is found.
+"""
+import re
+
+from results import ZillowRent
+
+# Confidence at or above which analyze_zillow stops looking at further results
+CONFIDENT_RENT = 0.8
+
+MIN_RENT, MAX_RENT = 300, 50000
+
+_AMOUNT = r"\$\s?(\d{1,3}(?:,\d{3})+|\d{3,6})(?:\.\d{2})?"
+MONTHLY_RENT_RE = re.compile(
+    _AMOUNT + r"\+?\s*(?:/\s*mo(?:nth)?\b|per\s+month|a\s+month|monthly)",
+    re.IGNORECASE,
+)
+RENT_RANGE_RE = re.compile(
+    _AMOUNT + r"\s*(?:-|–|to)\s*" + _AMOUNT + r"\s*(?:/\s*mo(?:nth)?\b|per\s+month)",
+    re.IGNORECASE,
+)
+# "price":2450 / "unformattedPrice":"2450" in the embedded listing JSON of rental pages
+EMBEDDED_PRICE_RE = re.compile(r'"(?:unformattedPrice|monthlyRent|price)"\s*:\s*"?\$?(\d{1,3}(?:,\d{3})+|\d{3,6})')
+FOR_RENT_RE = re.compile(r'"homeStatus"\s*:\s*"FOR_RENT"|"statusType"\s*:\s*"FOR_RENT"|for rent', re.IGNORECASE)
+# Amounts preceded by these words (in the same clause) are not the advertised rent
+_EXCLUDED_CONTEXT = re.compile(
+    r"zestimate|mortgage|hoa|deposit|fee|estimated|\best\.|payment|principal|insurance|tax|parking", re.IGNORECASE)
+# ... nor amounts directly followed by these ("$150/mo parking", "$400/mo HOA")
+_EXCLUDED_TRAILING = re.compile(r"^\W*(?:hoa|parking|deposit|fee|insurance|tax(?:es)?|utilities)\b", re.IGNORECASE)
+# Clause boundaries: line breaks, table cells, separators and runs of spaces
+_CLAUSE_BREAK_RE = re.compile(r"\n|\||;|•|·|\s{2,}")
+_LOOKBACK, _LOOKAHEAD = 30, 20
+# "Rent: $2,400" / "rent is 2400" in a listing's own description
+_STATED_RENT_RE = re.compile(r"\brent\b\W{0,3}(?:is\s+|of\s+)?" + _AMOUNT.replace(r"\$\s?", r"\$?\s?"), re.IGNORECASE)
+# Several different advertised rents on one page (floor plans or unrelated prices):
+# kept as a fallback while analyze_zillow looks at further results
+AMBIGUOUS_RENT_CONFIDENCE = 0.7
+
+
+def _amount(text):
+    value = float(text.replace(",", ""))
+    return value if MIN_RENT <= value <= MAX_RENT else None
+
+
+def _snippet(text, start, end, pad=40):
+    return " ".join(text[max(0, start - pad):end + pad].split())
+
+
+def _clause_start(text, start):
+    """Start of the clause containing `start`: after the last break or the previous dollar amount."""
+    window_start = max(0, start - _LOOKBACK)
+    window = text[window_start:start]
+    cut = max((m.end() for m in _CLAUSE_BREAK_RE.finditer(window)), default=0)
+    previous_amount = window.rfind("$")
+    if previous_amount >= 0:
+        cut = max(cut, previous_amount + 1)
+    return window_start + cut
+
+
+def _excluded(text, start, end):
+    """Whether the words before the amount (same clause) or right after it mark it as something other than rent."""
+    before = text[_clause_start(text, start):start]
+    after = _CLAUSE_BREAK_RE.split(text[end:end + _LOOKAHEAD], maxsplit=1)[0]
+    return bool(_EXCLUDED_CONTEXT.search(before) or _EXCLUDED_TRAILING.search(after))
+
+
+def parse_reported_rent(text):
+    """
+    Monthly rent a listing states: a bare amount ("2400", "$2,400"), a "$2,400/mo" price
+    or "rent: $2,400" in free text such as `other_details`.
+
+    Returns:
+        float | None: The rent, or None when the text states none (other dollar amounts,
+        such as deposits, are not taken as the rent)
+    """
+    text = str(text or "").strip()
+    bare = re.fullmatch(r"\$?\s?(\d{1,3}(?:,\d{3})+|\d{3,6})(?:\.\d{2})?", text)
+    if bare:
+        return _amount(bare.group(1))
+    for m in MONTHLY_RENT_RE.finditer(text):
+        value = _amount(m.group(1))
+        if value is not None and not _excluded(text, m.start(), m.end()):
+            return value
+    stated = _STATED_RENT_RE.search(text)
+    return _amount(stated.group(1)) if stated else None
+
+
+def extract_rent(text, source_title="", source_url=""):
+    """
+    Find the advertised monthly rent in page text without an LLM.
+
+    Ranges resolve to their lowest amount, and several different advertised rents
+    (e.g. floor plans) to the lowest one at AMBIGUOUS_RENT_CONFIDENCE, below
+    CONFIDENT_RENT. Amounts labelled as something else in their own clause (Zestimate,
+    estimated payment, HOA, parking, ...) are ignored.
+
+    Returns:
+        ZillowRent | None: Rent with provenance snippet, confidence and method, or None
+    """
+    text = text or ""
+    candidates = []  # (amount, start, end)
+    range_spans = []
+    for m in RENT_RANGE_RE.finditer(text):
+        range_spans.append(m.span())
+        low = _amount(m.group(1))
+        if low is not None and not _excluded(text, m.start(), m.end()):
+            candidates.append((low, m.start(), m.end()))
+    for m in MONTHLY_RENT_RE.finditer(text):
+        if any(s <= m.start() < e for s, e in range_spans):
+            continue
+        value = _amount(m.group(1))
+        if value is not None and not _excluded(text, m.start(), m.end()):
+            candidates.append((value, m.start(), m.end()))
+
+    if candidates:
+        amount, start, end = min(candidates)
+        distinct = {c[0] for c in candidates}
+        confidence = 0.9 if len(distinct) == 1 else AMBIGUOUS_RENT_CONFIDENCE
+        return ZillowRent(amount, source_title, source_url, reasoning="Monthly rent stated on the page.",
+                          provenance=_snippet(text, start, end), confidence=confidence, method="regex")
+
+    if FOR_RENT_RE.search(text):
+        prices = [(v, m) for m in EMBEDDED_PRICE_RE.finditer(text) if (v := _amount(m.group(1))) is not None]
+        if prices:
+            amount, m = min(prices, key=lambda p: p[0])
+            return ZillowRent(amount, source_title, source_url, reasoning="Price in the rental listing's embedded data.",
+                              provenance=_snippet(text, m.start(), m.end()), confidence=0.85, method="embedded_json")
+    return None
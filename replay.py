@@ -0,0 +1,189 @@
+"""
+Record/replay of provider responses for offline runs and benchmarks.
+
+Recording: with VERITAS_RECORD_DIR set, every Serper, Firecrawl and OpenRouter call made
+through http_client is saved as a fixture. Disable the local caches so every call
+reaches the provider:
+
+    VERITAS_RECORD_DIR=bench/fixtures LLM_CACHE=0 SEARCH_CACHE=0 SCRAPE_CACHE=0 python check_if_scammer.py
+
+Replay: serve the fixtures from a local stub server with injected latency and point the
+provider URLs at it (SERPER_API_URL, FIRECRAWL_API_URL, OPENROUTER_API_URL):
+
+    python replay.py serve bench/fixtures --port 8765 --latency serper=400 --latency openrouter=2500
+
+Fixtures are matched on the request fields that determine the answer: the query for
+Serper, the URL and formats for Firecrawl and the whole body for OpenRouter. An
+OpenRouter request with no exact match (e.g. after a prompt change) falls back to a
+fixture with the same response schema.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RECORD_DIR = os.getenv("VERITAS_RECORD_DIR")
+
+# Path prefix of each provider on the stub server
+PROVIDERS = ("serper", "firecrawl", "openrouter")
+
+_record_lock = threading.Lock()
+
+
+def _hash(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()[:24]
+
+
+def fixture_key(provider, payload):
+    """Key of the fixture answering `payload` for `provider`."""
+    if provider == "serper":
+        return _hash({"q": " ".join(str(payload.get("q", "")).lower().split()), "num": payload.get("num")})
+    if provider == "firecrawl":
+        return _hash({"url": payload.get("url"), "formats": payload.get("formats")})
+    return _hash(payload)
+
+
+def fallback_key(provider, payload):
+    """Looser key used when there is no exact fixture; None when the provider has none."""
+    if provider == "openrouter":
+        schema = (payload.get("response_format") or {}).get("json_schema") or {}
+        return schema.get("name") or payload.get("model")
+    return None
+
+
+def record(provider, url, payload, response, directory=RECORD_DIR):
+    """Save one provider response as `<directory>/<provider>/<key>.json` (JSON responses only)."""
+    try:
+        body = response.json()
+    except ValueError:
+        return
+    fixture = {"provider": provider, "url": url, "request": payload, "status": response.status_code, "response": body}
+    folder = os.path.join(directory, provider)
+    with _record_lock:
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"{fixture_key(provider, payload)}.json"), "w") as f:
+            json.dump(fixture, f, indent=1)
+
+
+class FixtureSet:
+    """Fixtures loaded from a recording directory."""
+
+    def __init__(self, directory):
+        self.exact = {}
+        self.fallback = {}
+        for provider in os.listdir(directory):
+            folder = os.path.join(directory, provider)
+            if not os.path.isdir(folder):
+                continue
+            for filename in sorted(os.listdir(folder)):
+                if not filename.endswith(".json"):
+                    continue
+                with open(os.path.join(folder, filename)) as f:
+                    fixture = json.load(f)
+                self.exact[(provider, fixture_key(provider, fixture["request"]))] = fixture
+                loose = fallback_key(provider, fixture["request"])
+                if loose is not None:
+                    self.fallback.setdefault((provider, loose), fixture)
+
+    def __len__(self):
+        return len(self.exact)
+
+    def find(self, provider, payload):
+        fixture = self.exact.get((provider, fixture_key(provider, payload)))
+        if fixture is None:
+            fixture = self.fallback.get((provider, fallback_key(provider, payload)))
+        return fixture
+
+
+def _handler(fixtures, latency, jitter, counters):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            provider = self.path.strip("/").split("/")[0]
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            delay = latency.get(provider, 0.0)
+            if delay:
+                time.sleep(delay * random.uniform(1 - jitter, 1 + jitter))
+            fixture = fixtures.find(provider, payload)
+            if fixture is None:
+                counters["misses"] += 1
+                status, body = 404, {"error": f"no {provider} fixture for this request"}
+            else:
+                counters["hits"] += 1
+                status, body = fixture["status"], fixture["response"]
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def start_server(directory, port=0, latency=None, jitter=0.2):
+    """
+    Serve fixtures on a background thread.
+
+    Args:
+        directory (str): Recording directory
+        port (int): Port to bind on 127.0.0.1 (0 = any free port)
+        latency (dict): Injected latency in seconds per provider
+        jitter (float): Relative +/- spread applied to the injected latency
+
+    Returns:
+        tuple: (server, base_url, counters); provider URLs are `<base_url>/<provider>`
+    """
+    fixtures = FixtureSet(directory)
+    counters = {"fixtures": len(fixtures), "hits": 0, "misses": 0}
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler(fixtures, latency or {}, jitter, counters))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}", counters
+
+
+def provider_env(base_url):
+    """Environment variables pointing every recorded provider at the stub server."""
+    return {f"{p.upper()}_API_URL": f"{base_url}/{p}" for p in PROVIDERS}
+
+
+def parse_latency(value):
+    """argparse type for PROVIDER=MILLISECONDS."""
+    provider, _, ms = value.partition("=")
+    try:
+        return provider, float(ms) / 1000
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected PROVIDER=MILLISECONDS")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded provider responses")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve", help="Serve fixtures from a local stub server")
+    serve.add_argument("fixtures")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency", type=parse_latency, action="append", default=[],
+                       help="Injected latency per provider, e.g. openrouter=2500 (repeatable)")
+    serve.add_argument("--jitter", type=float, default=0.2)
+    args = parser.parse_args()
+
+    server, base_url, counters = start_server(args.fixtures, args.port, dict(args.latency), args.jitter)
+    print(f"✅ Serving {counters['fixtures']} fixtures on {base_url}")
+    for name, value in provider_env(base_url).items():
+        print(f"   export {name}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
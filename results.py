@@ -0,0 +1,87 @@
+"""
+Typed result records for the verification pipeline.
+
+Stages return these instead of printing; `renderers.py` turns them into CLI output,
+JSON or the Frontend's data shape.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass(slots=True)
+class SearchFinding:
+    """One analyzed search result: the Serper hit plus the LLM verdict per question (1 yes, -1 no, 0 unknown)."""
+    title: str
+    link: str
+    snippet: str
+    verdicts: Dict[str, int] = field(default_factory=dict)
+
+    def source(self):
+        """The search-result dict stored under green_flag / red_flag."""
+        return {"title": self.title, "link": self.link, "snippet": self.snippet}
+
+
+@dataclass(slots=True)
+class LandlordReport:
+    """
+    Web reputation of a landlord.
+
+    `green_flag` / `red_flag` map a readable question ("Ownership Proof") to the search
+    results that confirmed / contradicted it.
+    """
+    query: str
+    findings: List[SearchFinding] = field(default_factory=list)
+    green_flag: Dict[str, List[dict]] = field(default_factory=dict)
+    red_flag: Dict[str, List[dict]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ZillowRent:
+    """
+    Advertised monthly rent found for an address.
+
+    `provenance` is the page text the rent was read from, `confidence` is 0-1 and
+    `method` says how it was found ("regex", "embedded_json", "snippet" or "llm").
+    """
+    monthly_rent_usd: float
+    source_title: str = ""
+    source_url: str = ""
+    reasoning: str = ""
+    provenance: str = ""
+    confidence: float = 0.0
+    method: str = ""
+
+
+@dataclass(slots=True)
+class BlockLot:
+    """San Francisco assessor block and lot numbers of a parcel."""
+    block_number: str
+    lot_number: str
+
+
+@dataclass(slots=True)
+class CheckResult:
+    """Everything one `check_if_scammer` run found."""
+    name: str
+    address: str
+    listing_url: str = ""
+    landlord: Optional[LandlordReport] = None
+    zillow: Optional[ZillowRent] = None
+    reported_rent_usd: Optional[float] = None
+    zillow_rent_flag: bool = False
+    block_number: Optional[str] = None
+    lot_number: Optional[str] = None
+    owners: List[str] = field(default_factory=list)
+    owner_match: Optional[str] = None
+    owner_match_score: float = 0.0
+    timings: Dict[str, float] = field(default_factory=dict)
+    shared_stages: List[str] = field(default_factory=list)
+    skipped_stages: List[str] = field(default_factory=list)  # cancelled once the verdict was decisive
+    risk_score: float = 0.0  # -1 (legitimate) to 1 (scam), see risk_scoring.py
+    verdict: str = "inconclusive"  # "scam", "clear" or "inconclusive"
+    risk_reasons: List[str] = field(default_factory=list)
+    total_seconds: float = 0.0
+
+    @property
+    def owner_mismatch(self):
+        return bool(self.owners) and self.owner_match is None
@@ -0,0 +1,171 @@
+"""
+Incremental risk scoring of a check, fed one stage result at a time.
+
+Each scored stage contributes weighted evidence, capped to the stage's range in
+STAGE_WEIGHTS; the score is the sum of the contributions (positive = likely scam,
+negative = likely legitimate), shown clipped to [-1, 1]. It does not depend on the
+order in which stages finish.
+
+The verdict is decisive as soon as the stages still pending cannot move the score back
+across SCAM_THRESHOLD or -CLEAR_THRESHOLD, so stopping early gives the same verdict a
+full audit would. Only stages that can still add evidence count: without a reported
+rent zillow_rent scores nothing, and once the web search proves ownership a recorder
+owner mismatch no longer counts. `check_if_scammer` then skips the stages that have not
+finished (typically the browser recorder lookup or the GPT-5 block/lot search).
+FULL_AUDIT=1 or `full_audit=True` runs every stage anyway.
+
+Evidence weights:
+- web_search (-0.5 to +0.65): each result reporting scams/fraud +0.35, legal issues
+  +0.1, proof that the landlord owns the address -0.3, name/address confirmed -0.15 or
+  contradicted +0.1
+- zillow_rent (-0.3 to +0.5): reported rent far below the Zillow rent +0.5, in line with
+  it -0.3, scaled by extraction confidence
+- owners (-0.4 to +0.5): declared name matches a recorder owner -0.4 x match score; no
+  owner matches +0.5 (+0.25 when the owners are entities such as LLCs or trusts, which
+  property managers front), dropped when the web search proves ownership
+
+Every stage range stays below both thresholds, so no single signal decides a check on
+its own: either verdict needs two independent stages to agree. A web search proving
+ownership plus a rent in line with Zillow settles "clear" without the recorder lookup.
+Lowering the thresholds through RISK_SCAM_THRESHOLD / RISK_CLEAR_THRESHOLD below 0.65
+gives that up.
+"""
+import os
+from typing import Dict, List, Optional
+
+from name_match import best_match, parse_name
+
+SCAM_THRESHOLD = float(os.getenv("RISK_SCAM_THRESHOLD", "0.7"))
+CLEAR_THRESHOLD = float(os.getenv("RISK_CLEAR_THRESHOLD", "0.7"))
+FULL_AUDIT = os.getenv("FULL_AUDIT", "0") == "1"
+
+# Listing rent below Zillow rent / this factor is suspicious
+RENT_FLAG_RATIO = 1.2
+
+# (lowest, highest) contribution of each scored stage
+STAGE_WEIGHTS = {
+    "web_search": (-0.5, 0.65),
+    "zillow_rent": (-0.3, 0.5),
+    "owners": (-0.4, 0.5),
+}
+
+
+def rent_flag(zillow, reported_rent):
+    """Whether the Zillow rent is much higher than the rent the listing reports."""
+    return bool(zillow and reported_rent and zillow.monthly_rent_usd > RENT_FLAG_RATIO * reported_rent)
+
+
+class RiskScorer:
+    """
+    Running risk score of one check.
+
+    Args:
+        name (str): Declared landlord name
+        reported_rent (float): Rent stated in the listing
+        scam_threshold (float): Score at or above which the listing is decided to be a scam
+        clear_threshold (float): Score at or below minus this which it is decided to be legitimate
+    """
+
+    def __init__(self, name, reported_rent=None, scam_threshold=SCAM_THRESHOLD, clear_threshold=CLEAR_THRESHOLD):
+        self.name = name
+        self.reported_rent = reported_rent
+        self.scam_threshold = scam_threshold
+        self.clear_threshold = clear_threshold
+        self.evidence: Dict[str, float] = {}  # scored stage -> capped contribution
+        self.ownership_proven = False  # a web search result proves the landlord owns the address
+        self.reasons: List[str] = []
+        self.decided_after: Optional[str] = None
+
+    def _web_search(self, report):
+        for finding in report.findings:
+            v = finding.verdicts
+            if v.get("scam_fraud_report") == 1:
+                yield 0.35, f"scam/fraud report: {finding.title}"
+            if v.get("legal_news") == 1:
+                yield 0.1, f"legal issues mentioned: {finding.title}"
+            if v.get("ownership_proof") == 1:
+                yield -0.3, f"ownership proof: {finding.title}"
+            if v.get("name_address_match") == 1:
+                yield -0.15, f"name matches address: {finding.title}"
+            elif v.get("name_address_match") == -1:
+                yield 0.1, f"name contradicts address: {finding.title}"
+
+    def _zillow_rent(self, zillow):
+        if not (zillow and self.reported_rent):
+            return
+        confidence = zillow.confidence or 0.5
+        if rent_flag(zillow, self.reported_rent):
+            yield 0.5 * confidence, f"Zillow rent {zillow.monthly_rent_usd} far above reported {self.reported_rent}"
+        else:
+            yield -0.3 * confidence, f"reported rent {self.reported_rent} in line with Zillow rent {zillow.monthly_rent_usd}"
+
+    def _owners(self, owners):
+        if not owners:
+            return
+        match = best_match(self.name, owners)
+        if match:
+            yield -0.4 * match.score, f"declared name matches recorder owner '{match.name}'"
+        elif all(parse_name(o).is_entity for o in owners):
+            yield 0.25, "declared name matches none of the (entity) recorder owners"
+        else:
+            yield 0.5, "declared name matches none of the recorder owners"
+
+    def update(self, stage, result):
+        """
+        Add the evidence of one finished stage.
+
+        Returns:
+            bool: True once the verdict is decisive
+        """
+        if stage in STAGE_WEIGHTS and stage not in self.evidence:
+            handler = {"web_search": self._web_search, "zillow_rent": self._zillow_rent, "owners": self._owners}[stage]
+            total = 0.0
+            for weight, reason in (handler(result) if result is not None else ()):
+                total += weight
+                self.reasons.append(f"{weight:+.2f} {reason}")
+            low, high = STAGE_WEIGHTS[stage]
+            self.evidence[stage] = max(low, min(high, total))
+            if stage == "web_search" and result is not None:
+                self.ownership_proven = any(f.verdicts.get("ownership_proof") == 1 for f in result.findings)
+        if self.decided_after is None and self.decisive():
+            self.decided_after = stage
+        return self.decided_after is not None
+
+    def _range(self, stage):
+        """(lowest, highest) contribution a pending stage can still make."""
+        if stage == "zillow_rent" and not self.reported_rent:
+            return 0.0, 0.0
+        low, high = STAGE_WEIGHTS[stage]
+        if stage == "owners" and self.ownership_proven:
+            high = 0.0
+        return low, high
+
+    def _owners_counted(self):
+        # A recorder mismatch is outweighed by a web result proving ownership
+        owners = self.evidence.get("owners", 0.0)
+        return 0.0 if owners > 0 and self.ownership_proven else owners
+
+    def _total(self):
+        return sum(v for s, v in self.evidence.items() if s != "owners") + self._owners_counted()
+
+    def decisive(self):
+        """Whether no outcome of the pending scored stages can change the verdict."""
+        pending = [self._range(s) for s in STAGE_WEIGHTS if s not in self.evidence]
+        total = self._total()
+        low = total + sum(low for low, _ in pending)
+        if "web_search" not in self.evidence and self._owners_counted() > 0:
+            low -= self._owners_counted()  # the pending web search may still prove ownership
+        return low >= self.scam_threshold or total + sum(high for _, high in pending) <= -self.clear_threshold
+
+    @property
+    def score(self):
+        return max(-1.0, min(1.0, self._total()))
+
+    @property
+    def verdict(self):
+        total = self._total()
+        if total >= self.scam_threshold:
+            return "scam"
+        if total <= -self.clear_threshold:
+            return "clear"
+        return "inconclusive"
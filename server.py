@@ -4,22 +4,25 @@ from dotenv import load_dotenv
 load_dotenv()
 # Basics
 
-from browser_use import Agent, Browser, ChatOpenAI
+from browser_use import Agent, ChatOpenAI
+from browser_pool import BrowserPool
 
-browser = Browser(
+pool = BrowserPool(
+	max_size=1,
 	headless=False,  # Show browser window
 	window_size={'width': 1000, 'height': 700},  # Set window size
 )
 
-agent = Agent(
-	task='Search for Browser Use',
-	browser=browser,
-	llm=ChatOpenAI(model='gpt-4.1-mini'),
-)
-
 
 async def main():
-	await agent.run()
+	async with pool.lease() as browser:
+		agent = Agent(
+			task='Search for Browser Use',
+			browser=browser,
+			llm=ChatOpenAI(model='gpt-4.1-mini'),
+		)
+		await agent.run()
+	await pool.close()
 
 
 # # Connect to your existing Chrome browser
@@ -0,0 +1,130 @@
+"""
+In-flight request coalescing ("single flight").
+
+Concurrent callers asking for the same key while a lookup is running wait for that
+lookup instead of starting their own; its result (or exception) is handed to all of
+them. Nothing is kept after the call finishes — that is what the caches are for.
+
+    flight = get_group("serper")
+    results = flight.do(key, lambda: fetch(query))               # threads
+    owners = await flight.do_async(key, lambda: lookup(block))   # asyncio tasks
+
+`stats()` reports, per group, how many calls ran, how many joined an in-flight call,
+and the largest number of callers that shared one call.
+"""
+import asyncio
+import threading
+
+import tracing
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "callers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.callers = 1
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls per key, for threads (`do`) and asyncio tasks (`do_async`).
+
+    Args:
+        name (str): Group name used in stats and trace counters
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = {}  # (event loop, key) -> [task, callers]
+        self.executed = 0
+        self.joined = 0
+        self.max_callers = 1
+
+    def _note_join(self, callers):
+        self.joined += 1
+        self.max_callers = max(self.max_callers, callers)
+        tracing.count(f"single_flight.{self.name}.joined")
+
+    def do(self, key, func):
+        """Run `func()` unless a call for `key` is already running in another thread; return its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.callers += 1
+                self._note_join(call.callers)
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key, func):
+        """Await `func()` unless a task for `key` is already running on this event loop; return its result."""
+        slot = (asyncio.get_running_loop(), key)
+        with self._lock:
+            entry = self._tasks.get(slot)
+            if entry is not None:
+                entry[1] += 1
+                self._note_join(entry[1])
+            else:
+                entry = self._tasks[slot] = [asyncio.ensure_future(func()), 1]
+                self.executed += 1
+                entry[0].add_done_callback(lambda _: self._forget(slot))
+        # shield: a cancelled caller must not cancel the lookup the others wait on
+        return await asyncio.shield(entry[0])
+
+    def _forget(self, slot):
+        with self._lock:
+            self._tasks.pop(slot, None)
+
+    def stats(self):
+        calls = self.executed + self.joined
+        return {
+            "calls": calls,
+            "executed": self.executed,
+            "deduplicated": self.joined,
+            "dedup_rate": self.joined / calls if calls else 0.0,
+            "max_callers": self.max_callers,
+            "in_flight": len(self._calls) + len(self._tasks),
+        }
+
+
+_groups = {}
+_groups_lock = threading.Lock()
+
+
+def get_group(name):
+    """Process-wide SingleFlight group for `name`."""
+    with _groups_lock:
+        if name not in _groups:
+            _groups[name] = SingleFlight(name)
+        return _groups[name]
+
+
+def stats():
+    """Per-group call, dedup and contention counters."""
+    with _groups_lock:
+        groups = dict(_groups)
+    return {name: group.stats() for name, group in sorted(groups.items())}
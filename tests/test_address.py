@@ -0,0 +1,50 @@
+import pytest
+
+from address import normalize_address, parse_address
+
+
+@pytest.mark.parametrize("text, key, display", [
+    ("88 king st, unit 116, san francisco 94107", "88 king street #116", "88 King Street #116, San Francisco, CA 94107"),
+    ("539 28th Ave APT2, San Francisco, CA 94121", "539 28th avenue #2", "539 28th Avenue #2, San Francisco, CA 94121"),
+    ("88 King St San Francisco CA", "88 king street", "88 King Street, San Francisco, CA"),
+    ("21686 Drexel Street, Clinton Township, MI 48036", "21686 drexel street",
+     "21686 Drexel Street, Clinton Township, MI 48036"),
+    ("1 Main St, New York, NY", "1 main street", "1 Main Street, New York, NY"),
+    ("1 Main St, New York, New York 10001", "1 main street", "1 Main Street, New York, NY 10001"),
+    ("123 Main St, Apt #4B, New York, NY 10001", "123 main street #4b", "123 Main Street #4B, New York, NY 10001"),
+    ("1600 Pennsylvania Ave NW, Washington, DC", "1600 pennsylvania avenue northwest",
+     "1600 Pennsylvania Avenue Northwest, Washington, DC"),
+    ("12345 Main St, Springfield, IL", "12345 main street", "12345 Main Street, Springfield, IL"),
+    ("88 King St, San Francisco, CA 94107-1234, USA", "88 king street", "88 King Street, San Francisco, CA 94107"),
+])
+def test_key_and_display(text, key, display):
+    address = parse_address(text)
+    assert address.key == key
+    assert address.display == display
+
+
+def test_state_defaults_to_california_only_when_missing():
+    assert parse_address("88 King St").state == "ca"
+    assert parse_address("88 King St").city == "san francisco"
+    assert parse_address("5 Oak Ave, Portland, Oregon").state == "or"
+    assert parse_address("5 Oak Ave, Portland, Oregon").city == "portland"
+
+
+def test_single_letter_street_is_not_a_direction():
+    assert parse_address("10 E St").street == "e street"
+    assert parse_address("100 N Point St").street == "north point street"
+
+
+@pytest.mark.parametrize("street", ["1420 Aptos Ave", "33 Unity Way", "12 Fletcher St"])
+def test_street_names_are_not_units(street):
+    assert parse_address(street).unit == ""
+
+
+def test_variants_share_a_key():
+    assert normalize_address("88 King Street #116") == normalize_address("88 king st, apt 116, SF, CA 94107")
+
+
+def test_zip_is_only_read_from_the_end():
+    assert parse_address("12345 Main St").zip == ""
+    assert parse_address("12345 Main St").number == "12345"
+    assert parse_address("88 King St SF 94107").zip == "94107"
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from browser_pool import BrowserPool, PooledBrowser
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.killed = False
+
+    async def get_current_page_url(self):
+        return "about:blank"
+
+    async def kill(self):
+        self.killed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    async def launch(self, generation):
+        self.launched += 1
+        return PooledBrowser(FakeBrowser(), generation=generation)
+
+    monkeypatch.setattr(BrowserPool, "_launch", launch)
+    return BrowserPool(max_size=1, recycle_after=5)
+
+
+async def lease_twice(pool):
+    browsers = []
+    for _ in range(2):
+        async with pool.lease() as browser:
+            browsers.append(browser)
+    return browsers
+
+
+def test_pool_works_across_event_loops(pool):
+    first = asyncio.run(lease_twice(pool))
+    second = asyncio.run(lease_twice(pool))
+    assert first[0] is first[1] and second[0] is second[1]  # reused within a loop
+    assert first[0] is not second[0]  # a browser never crosses loops
+    assert pool.launched == 2
+
+
+def test_close_resets_instead_of_recycling_forever(pool):
+    async def main():
+        async with pool.lease() as leased:
+            await pool.close()
+        assert leased.killed  # leased during close(): closed on release
+        return await lease_twice(pool)
+
+    browsers = asyncio.run(main())
+    assert browsers[0] is browsers[1]
+    assert not browsers[0].killed
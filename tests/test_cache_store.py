@@ -0,0 +1,39 @@
+from cache_store import CacheStore
+
+
+def store(tmp_path, **kwargs):
+    return CacheStore("test", path=str(tmp_path / "cache.sqlite3"), **kwargs)
+
+
+def test_round_trip_and_counters(tmp_path):
+    cache = store(tmp_path)
+    cache.set("k", {"results": [1, 2]})
+    assert cache.get("k") == {"results": [1, 2]}
+    assert cache.get("missing", "default") == "default"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = store(tmp_path, default_ttl=60)
+    cache.set("old", "value", ttl=-1)
+    cache.set("new", "value")
+    assert cache.get("old") is None
+    assert cache.get_entry("old")[0] == "value"  # kept for stale-while-revalidate readers
+    assert cache.get("new") == "value"
+
+
+def test_evicts_least_recently_used_over_the_size_cap(tmp_path):
+    cache = store(tmp_path)
+    for key in "abc":
+        cache.set(key, key * 1000)
+    cache.get("a")  # "b" is now the least recently used entry
+    cache.max_bytes = cache.stats()["bytes"]
+    cache.set("d", "d" * 1000)
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" * 1000
+    assert cache.evictions >= 1
+
+
+def test_persists_across_instances(tmp_path):
+    store(tmp_path).set("k", [1])
+    assert store(tmp_path).get("k") == [1]
@@ -0,0 +1,41 @@
+from content_window import landlord_window, rent_window, split_passages, strip_boilerplate
+
+PAGE = """[Home](https://x.com) [Rentals](https://x.com/r)
+Menu
+First paragraph about the neighbourhood and its parks, cafes and transit.
+
+Mary Smith owns 88 King Street and rents out unit 116.
+
+Menu
+Another paragraph about schools, commute times and local shopping options.
+"""
+
+
+def test_blank_lines_survive_and_separate_passages():
+    stripped = strip_boilerplate(PAGE)
+    assert stripped.count("\n\n") >= 2
+    passages = split_passages(stripped)
+    assert "Mary Smith owns 88 King Street and rents out unit 116." in passages
+    assert all("Mary Smith" not in p for p in passages if "parks" in p)
+
+
+def test_repeated_short_lines_and_link_lines_are_dropped():
+    stripped = strip_boilerplate(PAGE)
+    assert stripped.count("Menu") == 1
+    assert "https://" not in stripped
+
+
+def test_footer_in_second_half_ends_content():
+    page = "\n".join(["Intro line about the listing"] * 3 + ["Listing details $3,000/mo", "© 2025 Example", "Tail"])
+    assert "Tail" not in strip_boilerplate(page)
+    assert "Tail" in strip_boilerplate("© early banner\nTail\nMore text\nEven more")
+
+
+def test_landlord_window_keeps_matching_passage():
+    window = landlord_window(PAGE, "Mary Smith", "88 King St #116")
+    assert window == "Mary Smith owns 88 King Street and rents out unit 116."
+
+
+def test_rent_window_prefers_price_passages():
+    page = "Neighbourhood guide and history of the area.\n\nRent $3,450/mo, available now.\n"
+    assert rent_window(page, token_budget=10) == "Rent $3,450/mo, available now."
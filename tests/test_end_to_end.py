@@ -0,0 +1,85 @@
+"""Every benchmark target against the replay stub server (see replay.py and bench/benchmark.py)."""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from address import parse_address
+from conftest import REPO_ROOT
+from replay import fixture_key
+from tracing import read_spans
+
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+NAME = "Advaith Sridhar"
+ADDRESS = "88 King Street, San Francisco, 94107"
+LANDLORD_URL = "https://example.com/landlord"
+ZILLOW_URL = "https://www.zillow.com/homedetails/88-king-st"
+
+
+def _write(directory, provider, request, response):
+    folder = directory / provider
+    folder.mkdir(exist_ok=True)
+    fixture = {"provider": provider, "url": "", "request": request, "status": 200, "response": response}
+    (folder / f"{fixture_key(provider, request)}.json").write_text(json.dumps(fixture))
+
+
+def _completion(content):
+    return {"choices": [{"message": {"content": json.dumps(content)}}], "usage": {"total_tokens": 1}}
+
+
+@pytest.fixture
+def fixtures(tmp_path):
+    display = parse_address(ADDRESS).display
+    _write(tmp_path, "serper", {"q": f"{NAME} {display}", "num": 5},
+           {"organic": [{"title": f"{NAME} - 88 King Street", "link": LANDLORD_URL, "snippet": f"{NAME} lives here"}]})
+    _write(tmp_path, "serper", {"q": f"{display} zillow", "num": 5},
+           {"organic": [{"title": "88 King St #116 | Zillow", "link": ZILLOW_URL, "snippet": "Apartment for rent"}]})
+    for url, markdown in ((LANDLORD_URL, f"{NAME} owns 88 King Street."), (ZILLOW_URL, "Rent $3,450/mo")):
+        _write(tmp_path, "firecrawl", {"url": url, "formats": ["markdown", "links"]},
+               {"data": {"title": "", "description": "", "markdown": markdown, "links": []}})
+    verdict = {"result_number": 1, "name_address_match": 1, "scam_fraud_report": -1, "ownership_proof": 1,
+               "legal_news": -1, "alive_or_dead": 1}
+    _write(tmp_path, "openrouter", {"response_format": {"json_schema": {"name": "landlord_analysis_batch"}}},
+           _completion({"results": [verdict]}))
+    _write(tmp_path, "openrouter", {"response_format": {"json_schema": {"name": "zillow_rent_extraction"}}},
+           _completion({"reasoning": "", "monthly_rent_usd": 3450, "rent_snippet": "Rent $3,450/mo"}))
+    (tmp_path / "listings.jsonl").write_text(json.dumps({"name": NAME, "address": ADDRESS}) + "\n")
+    return tmp_path
+
+
+def test_benchmarks_run_end_to_end_on_replayed_providers(fixtures, tmp_path):
+    report_path = tmp_path / "report.json"
+    env = {**os.environ, "VERITAS_TRACE_FILE": str(tmp_path / "trace.jsonl")}
+    proc = subprocess.run(
+        [sys.executable, "-m", "bench.benchmark", str(fixtures), "--listings", str(fixtures / "listings.jsonl"),
+         "--targets", "check,landlord,zillow", "--concurrency", "1", "--json", str(report_path)],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+    report = json.loads(report_path.read_text())
+    for target in ("check", "landlord", "zillow"):
+        assert report["targets"][target]["1"]["runs"] == 1, target
+    assert report["server"]["hits"] > 0
+    assert report["server"]["misses"] == 0
+
+    # The check's spans form one tree: check → stage:* → provider calls (directly or under an llm span)
+    checks = [s for s in read_spans(tmp_path / "trace.jsonl") if s["kind"] == "check"]
+    assert len(checks) == 1 and checks[0]["parent_span_id"] is None
+    spans = read_spans(tmp_path / "trace.jsonl", trace_id=checks[0]["trace_id"])
+    by_id = {s["span_id"]: s for s in spans}
+    stages = {s["name"]: s for s in spans if s["kind"] == "stage"}
+    assert "stage:web_search" in stages
+    assert all(s["parent_span_id"] == checks[0]["span_id"] for s in stages.values())
+
+    def stage_of(span):
+        while span["kind"] != "stage":
+            span = by_id[span["parent_span_id"]]
+        return span["name"]
+
+    clients = [s for s in spans if s["kind"] == "client"]
+    assert {(stage_of(s), s["name"]) for s in clients} >= {
+        ("stage:web_search", "serper"), ("stage:web_search", "firecrawl"), ("stage:web_search", "openrouter")}
@@ -0,0 +1,51 @@
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+import rate_limit  # noqa: E402
+from cache_store import CacheStore  # noqa: E402
+from Kamthe import firecrawl_scraper  # noqa: E402
+
+
+def response(status, body=None):
+    r = requests.Response()
+    r.status_code = status
+    r._content = requests.compat.json.dumps(body or {}).encode()
+    return r
+
+
+@pytest.fixture(autouse=True)
+def scrape_cache(monkeypatch, tmp_path):
+    cache = CacheStore("scrapes", path=str(tmp_path / "scrapes.sqlite3"))
+    monkeypatch.setattr(firecrawl_scraper, "get_scrape_cache", lambda: cache)
+    return cache
+
+
+@pytest.fixture
+def post(monkeypatch):
+    def use(send):
+        monkeypatch.setattr(firecrawl_scraper, "post_json", lambda *a, **kw: send())
+    return use
+
+
+def test_failures_raise_instead_of_returning_placeholder_content(post, scrape_cache):
+    post(lambda: response(503))
+    with pytest.raises(requests.HTTPError):
+        firecrawl_scraper.scrape_url_simple("https://example.com/a")
+    assert firecrawl_scraper.scrape_url_or_none("https://example.com/a") is None
+    assert scrape_cache.stats()["entries"] == 0
+
+
+def test_open_circuit_propagates(post):
+    def fail():
+        raise rate_limit.CircuitOpenError("firecrawl circuit is open")
+
+    post(fail)
+    with pytest.raises(rate_limit.CircuitOpenError):
+        firecrawl_scraper.scrape_url("https://example.com/b", use_cache=False)
+
+
+def test_success_returns_markdown(post):
+    post(lambda: response(200, {"data": {"markdown": "Rent $2,400/mo"}}))
+    assert firecrawl_scraper.scrape_url_or_none("https://example.com/c?utm_source=x") == "Rent $2,400/mo"
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+from Kamthe import GoogleSearch  # noqa: E402
+
+NAME, ADDRESS = "Jane Doe", "123 Main St, San Francisco, CA 94110"
+PAGES = {
+    "https://a.example": "Jane Doe owns 123 Main St and rents it out.",
+    "https://b.example": "Unrelated cooking blog about soup recipes and bread.",
+    "https://c.example": "Jane  Doe owns 123 Main St and rents it out.",
+    "https://d.example": "Jane Doe was reported for a rental scam.",
+}
+RESULTS = [{"title": "", "link": link, "snippet": ""} for link in PAGES]
+VERDICTS = {"https://a.example": 1, "https://d.example": -1}
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    def completion(data, call_site):
+        prompt = data["messages"][0]["content"]
+        links = [link for link in PAGES if link in prompt]
+        calls.append(links)
+        if call_site == "analyze_landlord_batch":
+            return json.dumps({"results": [
+                {"result_number": list(PAGES).index(link) + 1, **dict.fromkeys(
+                    GoogleSearch.AI_OUTPUT_SCHEMA["required"], VERDICTS[link])}
+                for link in links]})
+        return json.dumps(dict.fromkeys(GoogleSearch.AI_OUTPUT_SCHEMA["required"], VERDICTS[links[0]]))
+
+    monkeypatch.setattr(GoogleSearch, "scrape_url_or_none", PAGES.__getitem__)
+    monkeypatch.setattr(GoogleSearch, "openrouter_completion", completion)
+    return calls
+
+
+@pytest.mark.parametrize("analyze", [GoogleSearch.analyze_landlord_batch, GoogleSearch.analyze_landlord_each])
+def test_irrelevant_and_duplicate_pages_skip_the_llm(llm_calls, analyze):
+    verdicts = analyze(NAME, ADDRESS, RESULTS)
+
+    assert sorted(link for links in llm_calls for link in links) == ["https://a.example", "https://d.example"]
+    assert [v["scam_fraud_report"] for v in verdicts] == [1, 0, 1, -1]
@@ -0,0 +1,39 @@
+import pytest
+
+import llm_cache
+from cache_store import CacheStore
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch, tmp_path):
+    monkeypatch.setattr(llm_cache, "_store", CacheStore("llm", path=str(tmp_path / "llm.sqlite3")))
+    monkeypatch.setattr(llm_cache, "_metrics", type(llm_cache._metrics)(llm_cache._metrics.default_factory))
+
+
+def test_second_identical_request_is_a_hit():
+    calls = []
+    request = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.3}
+
+    def call():
+        calls.append(1)
+        return "answer"
+
+    assert llm_cache.cached_call("site", request, call, use_cache=True) == "answer"
+    assert llm_cache.cached_call("site", dict(reversed(request.items())), call, use_cache=True) == "answer"
+    assert len(calls) == 1
+    assert llm_cache.stats()["site"] == {"hits": 1, "misses": 1, "bypassed": 0, "hit_rate": 0.5}
+
+
+def test_any_request_change_is_a_miss():
+    base = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.3}
+    assert llm_cache.request_key(base) == llm_cache.request_key(dict(base))
+    assert llm_cache.request_key(base) != llm_cache.request_key({**base, "temperature": 0.4})
+    assert llm_cache.request_key(base) != llm_cache.request_key({**base, "messages": [{"role": "user", "content": "ho"}]})
+
+
+def test_bypass_and_per_call_site_counters():
+    llm_cache.cached_call("a", {"x": 1}, lambda: 1, use_cache=False)
+    llm_cache.cached_call("b", {"x": 1}, lambda: 2, use_cache=True)
+    assert llm_cache.cached_call("a", {"x": 1}, lambda: 3, use_cache=True) == 3  # keys are per call site
+    assert llm_cache.stats()["a"]["bypassed"] == 1
+    assert llm_cache.stats()["b"]["misses"] == 1
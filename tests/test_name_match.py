@@ -0,0 +1,47 @@
+from name_match import NameIndex, best_match, name_key, parse_name, score_names, soundex
+
+
+def test_soundex():
+    assert soundex("robert") == soundex("rupert") == "r163"
+    assert soundex("") == ""
+
+
+def test_recorder_decorations_are_dropped():
+    parsed = parse_name("(E) SMITH MARY J TR")
+    assert (sorted(parsed.tokens), parsed.initials, parsed.is_entity) == (["mary", "smith"], ("j",), True)
+    assert name_key("Smith, Mary J.") == name_key("Mary J Smith") == "mary smith j"
+    assert not parse_name("Mary Smith and John Smith").is_entity
+
+
+def test_scores():
+    assert score_names("SMITH MARY J TR", "Mary J. Smith") == 1.0
+    assert score_names("Jon Smyth", "John Smith") >= 0.8  # spelling variants
+    assert score_names("Mary J. Smith", "Mary") < 0.8  # a first name alone is not a match
+    assert score_names("Mary Smith", "Robert Jones") == 0.0
+    assert score_names("", "Mary Smith") == 0.0
+
+
+def test_best_match_picks_the_owner():
+    owners = ["JONES ROBERT", "SMITH MARY J", "SMITH FAMILY TRUST"]
+    match = best_match("Mary Smith", owners)
+    assert (match.name, match.is_entity) == ("SMITH MARY J", False)
+    assert best_match("Alice Wong", owners) is None
+
+
+def test_index_returns_payloads_highest_first():
+    index = NameIndex()
+    index.add("Mary Smith", payload="a")
+    index.add("Mary Smithers", payload="b")
+    index.add("Robert Jones", payload="c")
+    matches = index.search("Mary Smith", threshold=0.5)
+    assert [m.payload for m in matches][0] == "a"
+    assert "c" not in [m.payload for m in matches]
+    assert len(index) == 3
+
+
+def test_key_keeps_parties_apart_that_scoring_merges():
+    assert name_key("John Smith Jr") != name_key("John Smith Sr")
+    keys = {name_key(n) for n in ("Smith Holdings LLC", "Smith Properties LLC", "Smith Family Trust", "The Smith Co")}
+    assert len(keys) == 4
+    assert name_key("SMITH JOHN JR") == name_key("John Smith Jr.")
+    assert score_names("John Smith Jr", "John Smith Sr") == 1.0  # fuzzy scoring still ignores them
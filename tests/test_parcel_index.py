@@ -0,0 +1,25 @@
+import sqlite3
+
+from parcel_index import KEY_VERSION, ParcelIndex
+
+
+def test_lookup_exact_and_building(tmp_path):
+    index = ParcelIndex(str(tmp_path / "parcels.sqlite3"))
+    index.add("88 King Street, San Francisco, CA 94107", "3794", "001")
+    assert index.lookup("88 king st unit 5, SF")["block_number"] == "3794"
+
+
+def test_old_keys_are_rekeyed_on_open(tmp_path):
+    path = str(tmp_path / "parcels.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE parcels (address_key TEXT PRIMARY KEY, street_number TEXT, street TEXT, unit TEXT,"
+                 " zip TEXT, block TEXT, lot TEXT, source TEXT)")
+    conn.execute("INSERT INTO parcels VALUES ('100 n point street san francisco', '100',"
+                 " 'n point street san francisco', '', '', '0001', '002', 'old')")
+    conn.commit()
+    conn.close()
+
+    index = ParcelIndex(path)
+    assert index.lookup("100 North Point St, San Francisco, CA") == \
+        {"block_number": "0001", "lot_number": "002", "match": "exact", "score": 1.0}
+    assert index._conn.execute("PRAGMA user_version").fetchone()[0] == KEY_VERSION
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from pipeline import Stage, run_stages
+from results import LandlordReport, SearchFinding, ZillowRent
+from risk_scoring import RiskScorer
+
+SCAM_REPORTS = LandlordReport("q", [SearchFinding("a", "", "", {"scam_fraud_report": 1}),
+                                    SearchFinding("b", "", "", {"scam_fraud_report": 1})])
+
+
+def stages(owners_delay):
+    async def web_search(_):
+        return SCAM_REPORTS
+
+    async def block_lot(_):
+        return ("0001", "002")
+
+    async def owners(_):
+        await asyncio.sleep(owners_delay)
+        return ["JOHN DOE"]
+
+    async def zillow_rent(_):
+        await asyncio.sleep(0.5)
+        return None
+
+    return [Stage("web_search", web_search), Stage("block_lot", block_lot),
+            Stage("owners", owners, deps=("block_lot",)), Stage("zillow_rent", zillow_rent)]
+
+
+async def check(full_audit):
+    scorer = RiskScorer("Mary Smith", 3000)
+    run = await run_stages(stages(0.01),
+                           stop_when=lambda stage, result: scorer.update(stage, result) and not full_audit)
+    return scorer, run
+
+
+def test_dependencies_run_in_order():
+    order = []
+
+    def record(name):
+        def func(inputs):
+            order.append((name, sorted(inputs)))
+            return name
+        return func
+
+    run = asyncio.run(run_stages([Stage("b", record("b"), deps=("a",)), Stage("a", record("a"))]))
+    assert order == [("a", []), ("b", ["a"])]
+    assert run.results == {"a": "a", "b": "b"}
+
+
+def test_graph_errors():
+    with pytest.raises(ValueError):
+        asyncio.run(run_stages([Stage("a", lambda _: 1, deps=("missing",))]))
+    with pytest.raises(ValueError):
+        asyncio.run(run_stages([Stage("a", lambda _: 1, deps=("b",)), Stage("b", lambda _: 1, deps=("a",))]))
+
+
+def test_stage_error_propagates():
+    def boom(_):
+        raise RuntimeError("provider down")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run_stages([Stage("a", boom), Stage("b", lambda _: 1)]))
+
+
+def test_stop_when_skips_pending_stages():
+    scorer, run = asyncio.run(check(full_audit=False))
+    assert run.stopped_after == "owners"
+    assert run.skipped == {"zillow_rent"}
+    assert "zillow_rent" not in run.results and "zillow_rent" not in run.timings
+    assert run.total < 0.5
+    assert scorer.verdict == "scam"
+
+
+def test_early_exit_and_full_audit_verdicts_agree():
+    early, _ = asyncio.run(check(full_audit=False))
+    full, run = asyncio.run(check(full_audit=True))
+    assert not run.skipped
+    assert early.verdict == full.verdict
+
+
+def test_memo_shares_keyed_stages():
+    calls = []
+
+    def lookup(_):
+        calls.append(1)
+        return "3794/001"
+
+    async def two_runs():
+        memo = {}
+        return await asyncio.gather(*(run_stages([Stage("block_lot", lookup, key="88 king street")], memo=memo)
+                                      for _ in range(2)))
+
+    first, second = asyncio.run(two_runs())
+    assert len(calls) == 1
+    assert first.results == second.results == {"block_lot": "3794/001"}
+
+
+def test_clear_verdict_skips_block_lot_and_owners():
+    ownership = LandlordReport("q", [SearchFinding("a", "", "", {"ownership_proof": 1, "name_address_match": 1}),
+                                     SearchFinding("b", "", "", {"ownership_proof": 1})])
+
+    async def block_lot(_):
+        await asyncio.sleep(5)
+        return ("0001", "002")
+
+    pipeline = [Stage("web_search", lambda _: ownership),
+                Stage("zillow_rent", lambda _: ZillowRent(monthly_rent_usd=3100, confidence=0.95)),
+                Stage("block_lot", block_lot),
+                Stage("owners", lambda _: pytest.fail("owners ran"), deps=("block_lot",))]
+    scorer = RiskScorer("Mary Smith", 3000)
+    run = asyncio.run(run_stages(pipeline, stop_when=scorer.update))
+    assert scorer.verdict == "clear"
+    assert run.skipped == {"block_lot", "owners"}
+    assert run.total < 1
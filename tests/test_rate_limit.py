@@ -0,0 +1,75 @@
+import itertools
+
+import pytest
+
+import rate_limit
+
+_names = itertools.count()
+
+
+class Response:
+    def __init__(self, status_code, retry_after=None):
+        self.status_code = status_code
+        self.headers = {"Retry-After": retry_after} if retry_after else {}
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """A fresh provider name with instant backoff."""
+    sleeps = []
+    monkeypatch.setattr(rate_limit, "BACKOFF_BASE", 0.0)
+    monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+    name = f"test{next(_names)}"
+    yield name, sleeps
+    rate_limit.configure(name, None)
+
+
+def test_retries_server_errors_until_success(provider):
+    name, _ = provider
+    statuses = iter([503, 500, 200])
+    response = rate_limit.call(name, lambda: Response(next(statuses)))
+    assert response.status_code == 200
+    assert rate_limit.stats()[name]["retries"] == 2
+
+
+def test_client_errors_are_not_retried(provider):
+    name, _ = provider
+    calls = []
+    response = rate_limit.call(name, lambda: calls.append(1) or Response(404))
+    assert (response.status_code, len(calls)) == (404, 1)
+
+
+def test_429_waits_retry_after_and_throttles(provider):
+    name, sleeps = provider
+    rate_limit.configure(name, 10)
+    statuses = iter([Response(429, "2"), Response(200)])
+    assert rate_limit.call(name, lambda: next(statuses)).status_code == 200
+    assert max(sleeps) >= 2
+    assert rate_limit.get_bucket(name).rate < 10
+
+
+def test_circuit_opens_after_repeated_failures(provider, monkeypatch):
+    name, _ = provider
+    monkeypatch.setattr(rate_limit, "_breakers", {name: rate_limit.CircuitBreaker(failure_threshold=2)})
+
+    def fail():
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        rate_limit.call(name, fail, max_retries=5)
+    with pytest.raises(rate_limit.CircuitOpenError):
+        rate_limit.call(name, fail)
+    assert rate_limit.stats()[name]["requests"] == 2
+
+
+def test_token_bucket_makes_callers_wait():
+    bucket = rate_limit.TokenBucket(rate=10, burst=1)
+    assert bucket._reserve() == 0.0
+    assert bucket._reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_parse_retry_after():
+    assert rate_limit.parse_retry_after("3") == 3.0
+    assert rate_limit.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert rate_limit.parse_retry_after("soon") is None
+    assert rate_limit.parse_retry_after(None) is None
@@ -0,0 +1,44 @@
+import asyncio
+
+import recorder_scraper
+from recorder_scraper import parse_owner_names
+
+
+def table(*rows):
+    return "<table>" + "".join("<tr>" + "".join(f"<td>{c}</td>" for c in row) + "</tr>" for row in rows) + "</table>"
+
+
+def test_reads_only_exact_party_columns():
+    html = table(
+        ["Document Type", "Name Type", "Grantor", "Grantee(s)"],
+        ["GRANT DEED", "Grantor", "SMITH JOHN", "DOE JANE<br>DOE JOHN"],
+    )
+    assert parse_owner_names(html) == ["SMITH JOHN", "DOE JANE", "DOE JOHN"]
+
+
+def test_drops_lenders_and_document_types():
+    html = table(
+        ["Grantor", "Grantee"],
+        ["DOE JANE", "WELLS FARGO BANK N.A."],
+        ["DOE JANE", "MORTGAGE ELECTRONIC REGISTRATION SYSTEMS"],
+        ["Deed of Trust", "DOE FAMILY TRUST"],
+    )
+    assert parse_owner_names(html) == ["DOE JANE", "DOE FAMILY TRUST"]
+
+
+def test_name_column_with_role_column():
+    html = table(
+        ["Name", "Name Type", "Doc Type"],
+        ["DOE JANE", "Grantee", "DEED"],
+        ["FIRST REPUBLIC BANK", "Grantee", "DEED OF TRUST"],
+        ["TITLE CO EMPLOYEE", "Notary", "DEED"],
+    )
+    assert parse_owner_names(html) == ["DOE JANE"]
+
+
+def test_browser_lock_is_per_event_loop():
+    async def lock():
+        return recorder_scraper._browser_lock()
+
+    first, second = asyncio.run(lock()), asyncio.run(lock())
+    assert first is not second
@@ -0,0 +1,52 @@
+import pytest
+
+from rent_extractor import AMBIGUOUS_RENT_CONFIDENCE, CONFIDENT_RENT, extract_rent, parse_reported_rent
+
+
+@pytest.mark.parametrize("text, rent", [
+    ("Rent $3,450/mo", 3450),
+    ("Rent: $2,700 - $3,100/mo", 2700),
+    ("Zestimate: $4,100/mo  Price $3,200/mo", 3200),
+    ("Zestimate: $4,100/mo Price $3,200/mo", 3200),
+    ("Price $3,200/mo Zestimate: $4,100/mo", 3200),
+    ("Rent $2,950/mo, $150/mo parking", 2950),
+    ("$3,200/mo\nParking $350/mo", 3200),
+    ('{"homeStatus":"FOR_RENT","price":2450}', 2450),
+])
+def test_extracts_advertised_rent(text, rent):
+    found = extract_rent(text)
+    assert found is not None and found.monthly_rent_usd == rent
+    assert found.confidence >= CONFIDENT_RENT
+
+
+@pytest.mark.parametrize("text", [
+    "Est. payment $5,200/mo",
+    "Estimated monthly payment $5,200/mo",
+    "Zestimate: $4,100/mo",
+    "$400/mo HOA",
+    "$350/mo parking",
+    "Security deposit $3,000 per month of rent",
+    "No price listed",
+])
+def test_ignores_amounts_that_are_not_rent(text):
+    assert extract_rent(text) is None
+
+
+def test_several_different_rents_are_not_confident():
+    found = extract_rent("Studio $2,400/mo\n1 bed $3,100/mo")
+    assert found.monthly_rent_usd == 2400
+    assert found.confidence == AMBIGUOUS_RENT_CONFIDENCE < CONFIDENT_RENT
+
+
+@pytest.mark.parametrize("text, rent", [
+    ("2400", 2400),
+    ("$2,400", 2400),
+    ("Rent: $2,400, deposit $5,000", 2400),
+    ("2 bed in the Mission, $3,100/mo", 3100),
+    ("$150/mo parking, rent is 2000", 2000),
+    ("Deposit $5,000", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_reported_rent(text, rent):
+    assert parse_reported_rent(text) == rent
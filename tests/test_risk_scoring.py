@@ -0,0 +1,116 @@
+import itertools
+
+import pytest
+
+from results import LandlordReport, SearchFinding, ZillowRent
+from risk_scoring import STAGE_WEIGHTS, RiskScorer, rent_flag
+
+NAME = "Mary Smith"
+REPORTED_RENT = 3000
+
+
+def landlord(*verdicts):
+    return LandlordReport("q", [SearchFinding(f"result {i}", "", "", v) for i, v in enumerate(verdicts)])
+
+
+SCAM_REPORTS = landlord({"scam_fraud_report": 1}, {"scam_fraud_report": 1, "legal_news": 1})
+OWNERSHIP = landlord({"ownership_proof": 1, "name_address_match": 1}, {"ownership_proof": 1})
+CHEAP_RENT = ZillowRent(monthly_rent_usd=5000, confidence=0.95)
+MARKET_RENT = ZillowRent(monthly_rent_usd=3100, confidence=0.95)
+
+SCENARIOS = {
+    "scam reports, owner mismatch": {"web_search": SCAM_REPORTS, "zillow_rent": MARKET_RENT, "owners": ["JOHN DOE"]},
+    "scam reports, owner match": {"web_search": SCAM_REPORTS, "zillow_rent": MARKET_RENT, "owners": ["SMITH MARY"]},
+    "scam reports, cheap rent, owner match": {"web_search": SCAM_REPORTS, "zillow_rent": CHEAP_RENT,
+                                              "owners": ["SMITH MARY"]},
+    "ownership, owner match": {"web_search": OWNERSHIP, "zillow_rent": MARKET_RENT, "owners": ["SMITH MARY J TR"]},
+    "ownership, cheap rent": {"web_search": OWNERSHIP, "zillow_rent": CHEAP_RENT, "owners": ["SMITH MARY"]},
+    "cheap rent, owner mismatch": {"web_search": landlord(), "zillow_rent": CHEAP_RENT, "owners": ["JOHN DOE"]},
+    "scam reports, cheap rent": {"web_search": SCAM_REPORTS, "zillow_rent": CHEAP_RENT, "owners": []},
+    "ownership, market rent, owner mismatch": {"web_search": OWNERSHIP, "zillow_rent": MARKET_RENT,
+                                               "owners": ["JOHN DOE"]},
+    "nothing found": {"web_search": landlord(), "zillow_rent": None, "owners": []},
+}
+
+
+def full_audit(results):
+    scorer = RiskScorer(NAME, REPORTED_RENT)
+    for stage, result in results.items():
+        scorer.update(stage, result)
+    return scorer
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_score_does_not_depend_on_stage_order(scenario):
+    results = SCENARIOS[scenario]
+    scores = set()
+    for order in itertools.permutations(results):
+        scorer = RiskScorer(NAME, REPORTED_RENT)
+        for stage in order:
+            scorer.update(stage, results[stage])
+        scores.add(round(scorer.score, 9))
+    assert len(scores) == 1
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_early_exit_agrees_with_full_audit(scenario):
+    results = SCENARIOS[scenario]
+    expected = full_audit(results).verdict
+    for order in itertools.permutations(results):
+        scorer = RiskScorer(NAME, REPORTED_RENT)
+        for stage in order:
+            if scorer.update(stage, results[stage]):
+                break
+        if scorer.decided_after is not None:
+            assert scorer.verdict == expected, order
+        else:
+            assert scorer.verdict == expected  # every stage was scored
+
+
+def test_decisive_scenarios():
+    assert full_audit(SCENARIOS["scam reports, owner mismatch"]).verdict == "scam"
+    assert full_audit(SCENARIOS["ownership, owner match"]).verdict == "clear"
+    assert full_audit(SCENARIOS["scam reports, owner match"]).verdict == "inconclusive"
+
+
+@pytest.mark.parametrize("stage", STAGE_WEIGHTS)
+def test_one_signal_alone_is_not_decisive(stage):
+    strongest = {"web_search": landlord(*[{"scam_fraud_report": 1, "legal_news": 1}] * 5),
+                 "zillow_rent": ZillowRent(monthly_rent_usd=9000, confidence=1.0),
+                 "owners": ["JOHN DOE"]}[stage]
+    scorer = RiskScorer(NAME, REPORTED_RENT)
+    assert not scorer.update(stage, strongest)
+    assert scorer.verdict == "inconclusive"
+
+
+def test_ownership_and_market_rent_skip_the_recorder_owners():
+    scorer = RiskScorer(NAME, REPORTED_RENT)
+    assert not scorer.update("web_search", OWNERSHIP)
+    assert scorer.update("zillow_rent", MARKET_RENT)
+    assert scorer.verdict == "clear"
+    assert full_audit(SCENARIOS["ownership, market rent, owner mismatch"]).verdict == "clear"
+
+
+def test_unknown_rent_does_not_hold_back_a_clear_verdict():
+    scorer = RiskScorer(NAME, reported_rent=None)
+    assert not scorer.update("web_search", OWNERSHIP)
+    assert scorer.update("owners", ["SMITH MARY"])
+    assert (scorer.verdict, scorer.decided_after) == ("clear", "owners")
+    # ... and the Zillow rent is not scored against a made-up rent
+    scorer.update("zillow_rent", CHEAP_RENT)
+    assert scorer.evidence["zillow_rent"] == 0.0
+    assert not any("Zillow" in reason for reason in scorer.reasons)
+
+
+def test_owner_mismatch_can_skip_the_rent_stage():
+    scorer = RiskScorer(NAME, REPORTED_RENT)
+    assert not scorer.update("web_search", SCAM_REPORTS)
+    assert scorer.update("owners", ["JOHN DOE"])
+    assert scorer.decided_after == "owners"
+
+
+def test_rent_flag():
+    assert rent_flag(CHEAP_RENT, REPORTED_RENT)
+    assert not rent_flag(MARKET_RENT, REPORTED_RENT)
+    assert not rent_flag(None, REPORTED_RENT)
+    assert not rent_flag(CHEAP_RENT, None)
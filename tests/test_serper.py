@@ -0,0 +1,66 @@
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+from Kamthe import SerperAPICall  # noqa: E402
+
+
+def fake_response(status, body):
+    response = requests.Response()
+    response.status_code = status
+    response._content = requests.compat.json.dumps(body).encode()
+    return response
+
+
+def test_http_error_is_raised_instead_of_key_error(monkeypatch):
+    monkeypatch.setattr(SerperAPICall, "post_json",
+                        lambda *a, **kw: fake_response(403, {"message": "Unauthorized."}))
+    with pytest.raises(requests.HTTPError):
+        SerperAPICall.fetch_search_results("jane doe")
+
+
+def test_response_without_organic_results_is_empty(monkeypatch):
+    monkeypatch.setattr(SerperAPICall, "post_json", lambda *a, **kw: fake_response(200, {"searchParameters": {}}))
+    assert SerperAPICall.fetch_search_results("jane doe") == []
+
+
+def test_memory_cache_evicts_least_recently_used(monkeypatch):
+    fetched = []
+
+    def fetch(query, api_key=None, num_results=5):
+        fetched.append(query)
+        return [{"title": query, "link": "", "snippet": ""}]
+
+    monkeypatch.setattr(SerperAPICall, "fetch_search_results", fetch)
+    monkeypatch.setattr(SerperAPICall, "SEARCH_CACHE_MEMORY_SIZE", 2)
+    monkeypatch.setattr(SerperAPICall, "_memory", SerperAPICall.OrderedDict())
+    monkeypatch.setattr(SerperAPICall, "_get_store", lambda: type("NoStore", (), {
+        "get": lambda self, key: None, "set": lambda self, key, value: None})())
+
+    for query in ("a", "b", "a", "c"):  # the hit on "a" makes "b" the eviction candidate
+        SerperAPICall.search_google(query)
+    assert fetched == ["a", "b", "c"]
+    assert list(SerperAPICall._memory) == ["5|a", "5|c"]
+
+
+def test_async_search_shares_the_cache_with_sync_search(monkeypatch):
+    import asyncio
+
+    sent = []
+
+    async def apost_json(url, payload, **kwargs):
+        sent.append(payload["q"])
+        return fake_response(200, {"organic": [{"title": "t", "link": "l", "snippet": "s"}]})
+
+    stored = {}
+    monkeypatch.setattr(SerperAPICall, "apost_json", apost_json)
+    monkeypatch.setattr(SerperAPICall, "post_json", lambda *a, **kw: pytest.fail("sync client used"))
+    monkeypatch.setattr(SerperAPICall, "_memory", SerperAPICall.OrderedDict())
+    monkeypatch.setattr(SerperAPICall, "_get_store", lambda: type("DictStore", (), {
+        "get": lambda self, key: stored.get(key), "set": lambda self, key, value: stored.update({key: value})})())
+
+    results = asyncio.run(SerperAPICall.search_google_async("88 King St zillow"))
+    assert results == [{"title": "t", "link": "l", "snippet": "s"}]
+    assert SerperAPICall.search_google("88 king st zillow") == results
+    assert sent == ["88 King St zillow"]
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+def test_concurrent_threads_share_one_call():
+    flight, release, calls = SingleFlight("test"), threading.Event(), []
+
+    def lookup():
+        calls.append(1)
+        release.wait(5)
+        return "owners"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("key", lookup))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    while flight.joined < 3:
+        threading.Event().wait(0.01)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert (results, len(calls)) == (["owners"] * 4, 1)
+    assert flight.stats()["max_callers"] == 4
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_errors_reach_every_caller_and_are_not_kept():
+    flight = SingleFlight("test")
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+    assert flight.do("key", lambda: "fresh") == "fresh"
+
+
+def test_async_callers_share_one_task_and_survive_cancellation():
+    flight, calls = SingleFlight("test"), []
+
+    async def lookup():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "owners"
+
+    async def main():
+        cancelled = asyncio.ensure_future(flight.do_async("key", lookup))
+        others = [asyncio.ensure_future(flight.do_async("key", lookup)) for _ in range(2)]
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await asyncio.gather(*others)
+
+    assert asyncio.run(main()) == ["owners", "owners"]
+    assert len(calls) == 1
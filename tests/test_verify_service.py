@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("starlette")
+pytest.importorskip("httpx")
+
+from starlette.testclient import TestClient  # noqa: E402
+
+import verify_service  # noqa: E402
+from cache_store import CacheStore  # noqa: E402
+from pipeline import StageTiming  # noqa: E402
+from results import CheckResult  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def service(monkeypatch):
+    async def fake_check(name, address, listing_url, other_details, on_stage=None, full_audit=False, **kwargs):
+        await asyncio.sleep(0.01)
+        on_stage("owners", ["SMITH MARY"], StageTiming(0.0, 0.01))
+        return CheckResult(name=name, address=address, owners=["SMITH MARY"], owner_match="SMITH MARY",
+                           risk_score=-0.8, verdict="clear")
+
+    monkeypatch.setattr(verify_service, "check_if_scammer", fake_check)
+    monkeypatch.setattr(verify_service, "_counters", dict.fromkeys(verify_service._counters, 0))
+    monkeypatch.setattr(verify_service, "MAX_QUEUED_CHECKS", 2)
+
+
+def test_reserve_never_exceeds_the_queue_cap():
+    assert [verify_service._reserve() for _ in range(4)] == [0, 1, None, None]
+    assert verify_service._counters["queued"] == 2
+    assert verify_service._counters["rejected"] == 2
+
+
+def test_place_is_released_when_cancelled_before_running():
+    async def cancel_immediately():
+        verify_service._reserve()
+        task = verify_service._start_check({}, asyncio.Queue())
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(cancel_immediately())
+    assert verify_service._counters["queued"] == 0
+
+
+def test_stream_reports_progress_and_summary():
+    events = []
+    with TestClient(verify_service.app) as client:
+        with client.stream("GET", "/api/checks/stream", params={"name": "Mary Smith", "address": "88 King St"}) as r:
+            for block in r.iter_text():
+                for chunk in block.split("\n\n"):
+                    if chunk.startswith("event:"):
+                        event, data = chunk.split("\n", 1)
+                        events.append((event[len("event: "):], json.loads(data[len("data: "):])))
+    names = [e for e, _ in events]
+    assert names == ["queued", "started", "stage", "result", "done"]
+    assert events[0][1]["position"] == 0
+    summary = events[3][1]["summary"]
+    assert summary["clear_outcome"] is True
+    assert summary["scam_likelihood"] == 0.1
+    assert verify_service._counters == {**verify_service._counters, "queued": 0, "running": 0, "completed": 1}
+
+
+def test_post_returns_summary():
+    with TestClient(verify_service.app) as client:
+        response = client.post("/api/checks", json={"name": "Mary Smith", "address": "88 King St"})
+    assert response.status_code == 200
+    assert response.json()["summary"]["reasons"][0][0] == "good"
+
+
+def test_missing_fields_are_rejected():
+    with TestClient(verify_service.app) as client:
+        assert client.post("/api/checks", json={"name": "Mary Smith"}).status_code == 400
+
+
+def test_status_reports_cache_counters(monkeypatch, tmp_path):
+    monkeypatch.setattr(verify_service, "get_scrape_cache",
+                        lambda: CacheStore("scrapes", path=str(tmp_path / "scrapes.sqlite3")))
+    with TestClient(verify_service.app) as client:
+        status = client.get("/api/status").json()
+    assert status["scrape_cache"]["entries"] == 0
+    assert isinstance(status["llm_cache"], dict)
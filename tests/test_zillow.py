@@ -0,0 +1,51 @@
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+import zillow  # noqa: E402
+from rent_extractor import AMBIGUOUS_RENT_CONFIDENCE  # noqa: E402
+
+PAGES = {
+    "https://zillow.com/a": "Studio $2,400/mo\n1 bed $3,100/mo",
+    "https://zillow.com/b": "No price here",
+    "https://zillow.com/c": "Rent $2,800/mo",
+}
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    monkeypatch.setattr(zillow, "scrape_url_or_none", PAGES.__getitem__)
+    monkeypatch.setattr(zillow, "openrouter_completion", lambda data, call_site: pytest.fail("LLM called"))
+
+
+def result(link, snippet=""):
+    return {"title": "", "link": link, "snippet": snippet}
+
+
+def test_stops_at_first_confident_rent():
+    found = zillow.analyze_zillow([result("https://zillow.com/a"), result("https://zillow.com/c")])
+    assert (found.monthly_rent_usd, found.method) == (2800, "regex")
+
+
+def test_ambiguous_page_beats_snippet_as_fallback():
+    found = zillow.analyze_zillow([result("https://zillow.com/b", "Rent $2,000/mo"), result("https://zillow.com/a")])
+    assert found.monthly_rent_usd == 2400
+    assert found.confidence == AMBIGUOUS_RENT_CONFIDENCE
+
+
+def test_snippet_is_the_last_resort(monkeypatch):
+    monkeypatch.setattr(zillow, "openrouter_completion",
+                        lambda data, call_site: '{"reasoning": "", "monthly_rent_usd": 0, "rent_snippet": ""}')
+    found = zillow.analyze_zillow([result("https://zillow.com/b", "Rent $2,000/mo")])
+    assert (found.monthly_rent_usd, found.method) == (2000, "snippet")
+
+
+def test_llm_window_keeps_passages_about_the_listing_address(monkeypatch):
+    windows = []
+    monkeypatch.setattr(zillow, "rent_window", lambda content, address="": windows.append(address) or content)
+    monkeypatch.setattr(zillow, "openrouter_completion",
+                        lambda data, call_site: '{"reasoning": "", "monthly_rent_usd": 3100, "rent_snippet": ""}')
+    monkeypatch.setitem(PAGES, "https://zillow.com/d", "88 King St #116 · $3,100")
+    zillow.analyze_zillow([result("https://zillow.com/d")], "88 King St, San Francisco, CA 94107")
+    assert windows == ["88 King St, San Francisco, CA 94107"]
@@ -0,0 +1,251 @@
+"""
+Lightweight tracing for checks: spans for pipeline stages and outbound provider calls.
+
+Set VERITAS_TRACE_FILE=traces.jsonl to append one JSON line per finished span; with it
+unset, spans cost a contextvar lookup and nothing is written. Span records follow the
+OpenTelemetry span data model (trace_id, span_id, parent_span_id, start/end time in
+unix nanoseconds, attributes, status), so the file can be converted for any OTel backend.
+
+Span kinds used in this repo:
+- "check"  one check_if_scammer run (the trace root)
+- "stage"  one pipeline stage
+- "client" one outbound HTTP/API call (attributes: provider, status, request/response bytes)
+- "llm"    one cached LLM call site (attributes: provider, cache, prompt/completion tokens)
+- "browser" one browser-use agent run (attributes: steps)
+
+Counters such as cache hits are added to the current span with `count()`.
+
+    python tracing.py report traces.jsonl [--trace TRACE_ID]
+"""
+import argparse
+import contextvars
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+TRACE_FILE = os.getenv("VERITAS_TRACE_FILE")
+
+_current = contextvars.ContextVar("veritas_span", default=None)
+_write_lock = threading.Lock()
+
+
+class Span:
+    """One timed operation; attributes and counters may be added until it ends."""
+
+    __slots__ = ("trace_id", "span_id", "parent_span_id", "name", "kind", "attributes", "start_ns", "status")
+
+    def __init__(self, name, kind, parent, attributes):
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent else None
+        self.name = name
+        self.kind = kind
+        self.attributes = dict(attributes)
+        self.start_ns = time.time_ns()
+        self.status = "ok"
+
+    def record(self, end_ns):
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": end_ns,
+            "duration_ms": (end_ns - self.start_ns) / 1e6,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+def enabled():
+    return bool(TRACE_FILE)
+
+
+def _export(record):
+    line = json.dumps(record, default=str)
+    with _write_lock:
+        with open(TRACE_FILE, "a") as f:
+            f.write(line + "\n")
+
+
+@contextmanager
+def span(name, /, kind="internal", **attributes):
+    """
+    Time the enclosed block as a child of the current span (or a new trace root).
+
+    Yields:
+        Span | None: The span, or None when tracing is disabled
+    """
+    if not TRACE_FILE:
+        yield None
+        return
+    current = Span(name, kind, _current.get(), attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.attributes["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current.reset(token)
+        _export(current.record(time.time_ns()))
+
+
+def current_span():
+    return _current.get()
+
+
+def set_attributes(**attributes):
+    """Add attributes to the current span (no-op without one)."""
+    current = _current.get()
+    if current is not None:
+        current.attributes.update(attributes)
+
+
+def count(name, n=1):
+    """Increment a counter attribute on the current span, e.g. count("cache.serper_searches.hit")."""
+    current = _current.get()
+    if current is not None:
+        current.attributes[name] = current.attributes.get(name, 0) + n
+
+
+def record_usage(usage, provider=None):
+    """
+    Add token usage from a provider response to the current span.
+
+    Accepts OpenAI/OpenRouter chat `usage` dicts (prompt_tokens/completion_tokens) and
+    OpenAI Responses usage objects (input_tokens/output_tokens).
+    """
+    if not usage:
+        return
+    get = usage.get if isinstance(usage, dict) else lambda k: getattr(usage, k, None)
+    prompt = get("prompt_tokens") or get("input_tokens") or 0
+    completion = get("completion_tokens") or get("output_tokens") or 0
+    attrs = {"prompt_tokens": prompt, "completion_tokens": completion}
+    if get("cost") is not None:
+        attrs["cost_usd"] = get("cost")
+    if provider:
+        attrs["provider"] = provider
+    set_attributes(**attrs)
+
+
+def bind(func):
+    """Run `func` in a copy of the caller's context, so spans in thread-pool workers keep their parent."""
+    ctx = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return ctx.copy().run(func, *args, **kwargs)
+    return wrapper
+
+
+def read_spans(path, trace_id=None):
+    """Span records from a JSONL trace file, optionally limited to one trace."""
+    with open(path) as f:
+        spans = [json.loads(line) for line in f if line.strip()]
+    return [s for s in spans if trace_id is None or s["trace_id"] == trace_id]
+
+
+def summarize(spans):
+    """
+    Aggregate spans by stage and by provider.
+
+    Returns:
+        dict: {"checks", "stages": {stage: {...}}, "providers": {provider: {...}}}
+    """
+    stages = defaultdict(lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "shared": 0, "errors": 0,
+                                  "counters": defaultdict(int)})
+    providers = defaultdict(lambda: {"calls": 0, "errors": 0, "total_ms": 0.0, "request_bytes": 0,
+                                     "response_bytes": 0, "llm_calls": 0, "cache_hits": 0,
+                                     "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0})
+    checks = 0
+    for s in spans:
+        attrs = s.get("attributes", {})
+        if s["kind"] == "check":
+            checks += 1
+        elif s["kind"] == "stage":
+            st = stages[attrs.get("stage", s["name"])]
+            st["count"] += 1
+            st["total_ms"] += s["duration_ms"]
+            st["max_ms"] = max(st["max_ms"], s["duration_ms"])
+            st["shared"] += bool(attrs.get("shared"))
+            st["errors"] += s["status"] == "error"
+        elif s["kind"] == "client":
+            p = providers[attrs.get("provider", s["name"])]
+            p["calls"] += 1
+            p["errors"] += s["status"] == "error" or (attrs.get("status") or 0) >= 400
+            p["total_ms"] += s["duration_ms"]
+            p["request_bytes"] += attrs.get("request_bytes", 0)
+            p["response_bytes"] += attrs.get("response_bytes", 0)
+        elif s["kind"] in ("llm", "browser"):
+            p = providers[attrs.get("provider", s["name"])]
+            p["llm_calls"] += 1
+            p["cache_hits"] += attrs.get("cache") == "hit"
+            p["prompt_tokens"] += attrs.get("prompt_tokens", 0)
+            p["completion_tokens"] += attrs.get("completion_tokens", 0)
+            p["cost_usd"] += attrs.get("cost_usd", 0.0)
+
+    # Counters (cache hits/misses, browser steps) roll up to the stage that contains them
+    by_id = {s["span_id"]: s for s in spans}
+    for s in spans:
+        counters = {k: v for k, v in s.get("attributes", {}).items() if k.startswith(("cache.", "browser."))}
+        if not counters:
+            continue
+        parent = s
+        while parent is not None and parent["kind"] != "stage":
+            parent = by_id.get(parent.get("parent_span_id"))
+        stage = parent["attributes"].get("stage", parent["name"]) if parent else "(no stage)"
+        for k, v in counters.items():
+            stages[stage]["counters"][k] += v
+    return {"checks": checks, "stages": dict(stages), "providers": dict(providers)}
+
+
+def print_report(summary):
+    print(f"🔎 {summary['checks']} check(s)")
+    print("\n⏱️  By stage:")
+    for name, st in sorted(summary["stages"].items(), key=lambda kv: -kv[1]["total_ms"]):
+        avg = st["total_ms"] / st["count"] if st["count"] else 0.0
+        line = f"   {name:<14} {st['count']:>4} runs  avg {avg / 1000:6.2f}s  max {st['max_ms'] / 1000:6.2f}s"
+        if st["shared"]:
+            line += f"  shared {st['shared']}"
+        if st["errors"]:
+            line += f"  errors {st['errors']}"
+        if st["counters"]:
+            line += "  " + " ".join(f"{k}={v}" for k, v in sorted(st["counters"].items()))
+        print(line)
+    print("\n🌐 By provider:")
+    for name, p in sorted(summary["providers"].items(), key=lambda kv: -kv[1]["total_ms"]):
+        line = (f"   {name:<11} {p['calls']:>4} calls  {p['total_ms'] / 1000:7.2f}s  "
+                f"{p['request_bytes'] / 1024:7.1f} KB out  {p['response_bytes'] / 1024:7.1f} KB in")
+        if p["errors"]:
+            line += f"  errors {p['errors']}"
+        if p["llm_calls"]:
+            line += (f"  llm {p['llm_calls']} (cached {p['cache_hits']})  "
+                     f"tokens {p['prompt_tokens']}+{p['completion_tokens']}")
+        if p["cost_usd"]:
+            line += f"  ${p['cost_usd']:.4f}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize a Veritas trace file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    report = sub.add_parser("report", help="Break down checks by stage and provider")
+    report.add_argument("path", nargs="?", default=TRACE_FILE)
+    report.add_argument("--trace", help="Only this trace id (one check)")
+    args = parser.parse_args()
+    if not args.path:
+        parser.error("no trace file given and VERITAS_TRACE_FILE is not set")
+    print_report(summarize(read_spans(args.path, args.trace)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Async HTTP verification service (ASGI, Starlette).
+
+    uvicorn verify_service:app --port 8000
+
+GET  /api/checks/stream?name=...&address=...   Server-Sent Events: queued (with the number of checks
+                                               ahead), started, one `stage` event per finished stage,
+                                               result, done; used by Frontend/loading.html
+POST /api/checks                                JSON body with name/address/listing_url/other_details/rent;
+                                               returns the full result
+GET  /api/status                                queue and concurrency counters, per-provider
+                                               retry/throttle/circuit metrics, single-flight dedup counts,
+                                               per-call-site LLM cache and scrape cache hit/miss counters
+/                                               the Frontend
+
+Checks skip their remaining stages once the risk verdict is decisive; pass
+`full_audit=1` (query parameter or JSON field) to run every stage.
+
+At most MAX_CONCURRENT_CHECKS checks run at once. Further requests wait in a queue,
+and requests beyond MAX_QUEUED_CHECKS are rejected with 503.
+"""
+import asyncio
+import os
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
+
+import http_client
+import llm_cache
+import rate_limit
+import recorder_scraper
+import single_flight
+from Kamthe.firecrawl_scraper import get_scrape_cache
+from batch_check import FIELDS
+from browser_pool import get_browser_pool
+from check_if_scammer import check_if_scammer
+from renderers import dumps, render_frontend, render_summary, to_jsonable
+from rent_extractor import parse_reported_rent
+from risk_scoring import FULL_AUDIT
+
+MAX_CONCURRENT_CHECKS = int(os.getenv("MAX_CONCURRENT_CHECKS", "4"))
+MAX_QUEUED_CHECKS = int(os.getenv("MAX_QUEUED_CHECKS", "32"))
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Frontend")
+
+_slots = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+_counters = {"queued": 0, "running": 0, "completed": 0, "failed": 0, "rejected": 0}
+
+
+def sse(event, data):
+    return f"event: {event}\ndata: {dumps(data)}\n\n"
+
+
+def _listing(params):
+    listing = {k: (params.get(k) or "") for k in FIELDS}
+    full_audit = params.get("full_audit")
+    listing["full_audit"] = FULL_AUDIT if full_audit is None else str(full_audit).lower() in ("1", "true", "yes")
+    return listing
+
+
+def _reserve():
+    """
+    Claim a place in the queue.
+
+    Never awaits, so the capacity check and the increment cannot interleave with
+    another request on the event loop.
+
+    Returns:
+        int | None: Number of checks queued ahead of this one, or None when the queue is full
+    """
+    if _counters["queued"] >= MAX_QUEUED_CHECKS:
+        _counters["rejected"] += 1
+        return None
+    position = _counters["queued"]
+    _counters["queued"] += 1
+    return position
+
+
+async def _run_check(listing, events, place):
+    """Wait for a slot, run the check and push progress events onto the `events` queue."""
+    try:
+        async with _slots:
+            place["queued"] = False
+            _counters["queued"] -= 1
+            _counters["running"] += 1
+            events.put_nowait(("started", {}))
+            try:
+                def on_stage(name, result, timing):
+                    events.put_nowait(("stage", {"stage": name, "seconds": round(timing.duration, 3), "result": result}))
+
+                result = await check_if_scammer(listing["name"], listing["address"], listing["listing_url"],
+                                             listing["other_details"], on_stage=on_stage,
+                                             full_audit=listing["full_audit"],
+                                             reported_rent=parse_reported_rent(listing["rent"]))
+                _counters["completed"] += 1
+                events.put_nowait(("result", {"result": result, "frontend": render_frontend(result),
+                                              "summary": render_summary(result)}))
+            except Exception as e:
+                _counters["failed"] += 1
+                events.put_nowait(("error", {"error": f"{type(e).__name__}: {e}"}))
+            finally:
+                _counters["running"] -= 1
+    finally:
+        events.put_nowait(None)
+
+
+def _start_check(listing, events):
+    """Run the check of a reserved queue place as a task; the place is released however the task ends."""
+    place = {"queued": True}
+
+    def release(_):
+        # Also covers a task cancelled before it ever ran (client gone while queued)
+        if place["queued"]:
+            place["queued"] = False
+            _counters["queued"] -= 1
+
+    task = asyncio.create_task(_run_check(listing, events, place))
+    task.add_done_callback(release)
+    return task
+
+
+async def stream_check(request):
+    listing = _listing(request.query_params)
+    if not listing["name"] or not listing["address"]:
+        return JSONResponse({"error": "name and address are required"}, status_code=400)
+    position = _reserve()
+    if position is None:
+        return JSONResponse({"error": "server busy, retry later"}, status_code=503)
+
+    events = asyncio.Queue()
+    task = _start_check(listing, events)
+
+    async def stream():
+        try:
+            yield sse("queued", {"position": position, **listing})
+            while (item := await events.get()) is not None:
+                yield sse(*item)
+            yield sse("done", {})
+        finally:
+            # Stops the check when the client disconnects mid-stream
+            task.cancel()
+
+    return StreamingResponse(stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+async def create_check(request):
+    listing = _listing(await request.json())
+    if not listing["name"] or not listing["address"]:
+        return JSONResponse({"error": "name and address are required"}, status_code=400)
+    if _reserve() is None:
+        return JSONResponse({"error": "server busy, retry later"}, status_code=503)
+
+    events = asyncio.Queue()
+    await _start_check(listing, events)
+    result = {}
+    while (item := events.get_nowait()) is not None:
+        event, data = item
+        if event in ("result", "error"):
+            result = data
+    status = 500 if "error" in result else 200
+    return JSONResponse(to_jsonable(result), status_code=status)
+
+
+async def status(request):
+    return JSONResponse({**_counters, "max_concurrent": MAX_CONCURRENT_CHECKS, "max_queued": MAX_QUEUED_CHECKS,
+                         "providers": rate_limit.stats(), "single_flight": single_flight.stats(),
+                         "llm_cache": llm_cache.stats(), "scrape_cache": get_scrape_cache().stats()})
+
+
+async def shutdown():
+    await get_browser_pool().close()
+    await recorder_scraper.close()
+    await http_client.aclose()
+
+
+app = Starlette(
+    routes=[
+        Route("/api/checks/stream", stream_check),
+        Route("/api/checks", create_check, methods=["POST"]),
+        Route("/api/status", status),
+        Mount("/", StaticFiles(directory=FRONTEND_DIR, html=True)),
+    ],
+    on_shutdown=[shutdown],
+)
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", "8000")))
@@ -1,7 +1,14 @@
-import requests
-from Kamthe.firecrawl_scraper import scrape_url_simple
-from Kamthe.GoogleSearch import OPENROUTER_API_URL, OPENROUTER_API_KEY
+from Kamthe.firecrawl_scraper import scrape_url_or_none
+from Kamthe.GoogleSearch import openrouter_completion
 import json 
+from results import ZillowRent
+from relevance import ContentDeduper, zillow_page_has_price
+from rent_extractor import extract_rent, CONFIDENT_RENT
+from content_window import rent_window
+
+# Confidence given to an LLM-extracted rent and to a price read from a search snippet
+LLM_RENT_CONFIDENCE = 0.75
+SNIPPET_RENT_CONFIDENCE = 0.6
 
 ZILLOW_OUTPUT_SCHEMA = {
     "type": "object",
@@ -14,15 +21,25 @@ ZILLOW_OUTPUT_SCHEMA = {
             "type": "number",
             "description": "The monthly rent in USD as a plain number (no commas, symbols). If a range is shown, use the lowest currently available advertised monthly rent. if there's no monthly rent mentioned on the page, enter 0. "
         },
+        "rent_snippet": {
+            "type": "string",
+            "description": "The exact text snippet where the rent is stated, empty if there is none."
+        },
     },
-    "required": ["sourcreasoninge_title", "monthly_rent_usd"],
+    "required": ["reasoning", "monthly_rent_usd", "rent_snippet"],
     "additionalProperties": False
 }
 
 
-def analyze_zillow(search_results):
+def analyze_zillow(search_results, address=""):
     """
     Analyze a list of Zillow search results and extract the monthly rent from each listing page.
+
+    Results are scraped one at a time. Each page goes through the deterministic
+    extractor first (rent_extractor.py) and only reaches the LLM when that finds
+    nothing. The search stops at the first rent with confidence >= CONFIDENT_RENT or
+    the first LLM-extracted rent; otherwise the most confident weaker rent is returned
+    (a page listing several different rents, then a price read from a search snippet).
     
     Parameters
     ----------
@@ -33,19 +50,39 @@ def analyze_zillow(search_results):
             "link": "https://www.zillow.com/...",
             "snippet": "..."  # optional
         }
+    address : str
+        The listing address; page passages that mention it are kept for the LLM.
     
     Returns
     -------
-    list[dict]
-        List of parsed JSON objects (one per input result) following ZILLOW_OUTPUT_SCHEMA.
+    ZillowRent | None
+        The advertised monthly rent with its provenance snippet and confidence, or None.
     """
-    outputs = []
+    best = None
+    deduper = ContentDeduper()
 
-    for sr in search_results:
-        print(f"🏠 Analyzing Rentals: {sr.get('title') or sr.get('link')}")
+    for i, sr in enumerate(search_results):
+        # Search snippets often carry the price already; weak evidence, kept as a fallback
+        from_snippet = extract_rent(sr.get('snippet', ''), sr.get('title', ''), sr['link'])
+        if from_snippet and best is None:
+            from_snippet.method = "snippet"
+            from_snippet.confidence = SNIPPET_RENT_CONFIDENCE
+            best = from_snippet
 
         # Scrape the Zillow URL content
-        scraped_content = scrape_url_simple(sr["link"])
+        scraped_content = scrape_url_or_none(sr["link"])
+
+        # Local pre-filter: skip pages without any price and duplicate pages
+        if not zillow_page_has_price(scraped_content) or deduper.first_seen(scraped_content, i) != i:
+            continue
+
+        found = extract_rent(scraped_content, sr.get('title', ''), sr['link'])
+        if found:
+            if found.confidence >= CONFIDENT_RENT:
+                return found
+            if best is None or found.confidence > best.confidence:
+                best = found
+            continue
 
         # New analysis prompt (Zillow-focused)
         prompt = f"""
@@ -72,16 +109,11 @@ Title: {sr.get('title', '')}
 URL: {sr['link']}
 Snippet: {sr.get('snippet', '')}
 
-Scraped Content (first 3,000 chars):
-{scraped_content[:3000]}...
+Relevant excerpts of the page:
+{rent_window(scraped_content, address)}
         """.strip()
 
         # Make API request
-        headers = {
-            "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-            "Content-Type": "application/json"
-        }
-
         data = {
             "model": "openai/gpt-4o",
             "messages": [
@@ -98,12 +130,8 @@ Scraped Content (first 3,000 chars):
             }
         }
 
-        response = requests.post(OPENROUTER_API_URL, headers=headers, json=data)
-        response.raise_for_status()
-        response_data = response.json()
-
         # The model returns a JSON string in message.content that conforms to ZILLOW_OUTPUT_SCHEMA
-        content = response_data["choices"][0]["message"]["content"]
+        content = openrouter_completion(data, "analyze_zillow")
 
         # Optionally, ensure the source fields are present/overridden from our inputs
         # (Some models adhere strictly, others may omit; we can defensively patch them here.)
@@ -116,10 +144,15 @@ Scraped Content (first 3,000 chars):
         parsed.setdefault("source_title", sr.get("title", ""))
         parsed.setdefault("source_url", sr["link"])
 
-        outputs.append(parsed)
-
-    for output in outputs:
-        if output['monthly_rent_usd']:
-            return output['monthly_rent_usd']
+        if parsed['monthly_rent_usd']:
+            return ZillowRent(
+                monthly_rent_usd=parsed['monthly_rent_usd'],
+                source_title=parsed['source_title'],
+                source_url=parsed['source_url'],
+                reasoning=parsed.get('reasoning', ''),
+                provenance=parsed.get('rent_snippet', ''),
+                confidence=LLM_RENT_CONFIDENCE,
+                method="llm",
+            )
     
-    return None
+    return best